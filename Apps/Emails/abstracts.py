@@ -4,44 +4,124 @@ from datetime import datetime
 from django.apps import apps
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
 from django.db.models import Model
-from django.template.loader import render_to_string
 from django.utils import timezone
 
+from Emails.cache import email_template_cache
+from Emails.compiler import get_email_template
+from Emails.compiler import get_email_template_version
+from Emails.envelope import EnvelopeEmailMessage
+from Emails.envelope import MessageEnvelope
+from Emails.envelope import replace_variables
 from Project.utils.log import log_information
 
 
 class AbstractEmailFunctionClass:
+    recipient_field: str = None  # Relation read to build the message
+
     @abstractmethod
     def get_email(self) -> str:
         raise NotImplementedError
 
     def get_email_data(self) -> dict:
-        return {
-            "header": self.header,
-            "blocks": self.blocks.all() if self.blocks.all() else [],
-        }
+        return {"header": self.header, "blocks": list(self.blocks.all())}
 
     def get_template(self) -> str:
+        return email_template_cache.get_or_render(
+            self.get_template_cache_key(), self.render_template
+        )
+
+    def render_template(self) -> str:
         data: dict = self.get_email_data()
-        template: str = render_to_string("email.html", data)
+        template: str = get_email_template().render(data)
         return template
 
-    def get_email_object(self) -> EmailMultiAlternatives:
-        email: EmailMultiAlternatives = EmailMultiAlternatives(
-            subject=self.subject,
-            from_email=settings.EMAIL_HOST_USER,
-            to=[self.get_email()],
+    def get_template_cache_key(self) -> str:
+        return email_template_cache.get_key(
+            get_email_template_version(get_email_template()),
+            *self.get_template_variant(),
+        )
+
+    def get_template_variant(self) -> tuple:
+        """
+        Emails with the same class, header, language and blocks share the same
+        rendered template, the blocks content is part of the variant so an
+        edited block is rendered again
+        """
+        blocks: tuple = tuple(
+            (
+                block.id,
+                block.title,
+                block.content,
+                block.show_link,
+                block.link_text,
+                block.link,
+            )
+            for block in self.blocks.all()
+        )
+        return (
+            self.__class__.__name__,
+            self.header,
+            getattr(self, "language", None),
+            blocks,
+        )
+
+    def get_html(self) -> str:
+        """
+        The rendered template is shared by every recipient, the placeholders
+        of the recipient are replaced after getting it
+        """
+        return replace_variables(
+            self.get_template(), self.get_template_variables()
         )
-        email.attach_alternative(self.get_template(), "text/html")
+
+    def get_template_variables(self) -> dict:
+        return {}
+
+    def get_headers(self) -> dict:
+        return {}
+
+    def get_email_object(
+        self,
+        connection: BaseEmailBackend = None,
+        envelope: MessageEnvelope = None,
+    ) -> EmailMultiAlternatives:
+        """
+        Messages built with the envelope of their variant reuse its encoded
+        html part and only get the values of the recipient stamped, the html
+        is only rendered for the recipient when the envelope can not stamp it
+        """
+        attributes: dict = {
+            "subject": self.subject,
+            "from_email": settings.EMAIL_HOST_USER,
+            "to": [self.get_email()],
+            "connection": connection,
+            "headers": self.get_headers(),
+        }
+        if envelope is None:
+            email: EmailMultiAlternatives = EmailMultiAlternatives(**attributes)
+            email.attach_alternative(self.get_html(), "text/html")
+        else:
+            email: EmailMultiAlternatives = EnvelopeEmailMessage(
+                envelope=envelope,
+                variables=self.get_template_variables(),
+                **attributes,
+            )
+            email.attach_alternative(envelope.html, "text/html")
         email.fail_silently = False
         return email
 
+    def get_blacklist_lookup(self) -> dict:
+        return {"user__email": self.get_email()}
+
     def check_if_email_and_type_is_in_blacklist(self) -> bool:
         blacklist: Model = apps.get_model("Emails", "Blacklist")
-        return blacklist.objects.filter(
-            user__email=self.get_email(), affairs__icontains=self.affair
-        ).exists()
+        return (
+            blacklist.objects.with_affair(self.affair)
+            .filter(**self.get_blacklist_lookup())
+            .exists()
+        )
 
     def send(self) -> None:
         is_email_in_blacklist: bool = (
@@ -50,7 +130,13 @@ class AbstractEmailFunctionClass:
         if not is_email_in_blacklist:
             email: EmailMultiAlternatives = self.get_email_object()
             email.send()
-            self.sent_date: datetime = timezone.now()
-            self.was_sent: bool = True
-            self.save()
+            self.save_as_sent()
         log_information(f"Sent: {self.was_sent}", self)
+
+    def save_as_sent(self) -> None:
+        self.set_as_sent()
+        self.save()
+
+    def set_as_sent(self, sent_date: datetime = None) -> None:
+        self.sent_date: datetime = sent_date or timezone.now()
+        self.was_sent: bool = True
@@ -6,6 +6,7 @@ from Emails.models import BlackList
 from Emails.models import Block
 from Emails.models import Email
 from Emails.models import Notification
+from Emails.models import Outbox
 from Emails.models import Suggestion
 
 
@@ -16,10 +17,13 @@ class BlockAdmin(ModelAdmin):
     list_filter: tuple = (
         "title",
         "show_link",
+        "name",
+        "language",
     )
     fieldsets: tuple = (
         ("Content", {"fields": ("id", "title", "content")}),
         ("Link", {"fields": ("show_link", "link_text", "link")}),
+        ("Template", {"fields": ("name", "language")}),
     )
     readonly_fields: list = [
         "id",
@@ -36,13 +40,20 @@ class EmailAdmin(ModelAdmin):
         "is_test",
         "was_sent",
     )
-    list_filter: tuple = ("to", "is_test", "was_sent")
+    list_filter: tuple = ("to", "is_test", "was_sent", "priority")
     fieldsets: tuple = (
         ("Content", {"fields": ("id", "subject", "header", "to")}),
-        ("Blocks", {"fields": ("blocks",)}),
+        ("Blocks", {"fields": ("blocks", "variables")}),
         (
             "Configuration",
-            {"fields": ("is_test", "programed_send_date", "language")},
+            {
+                "fields": (
+                    "is_test",
+                    "programed_send_date",
+                    "language",
+                    "priority",
+                )
+            },
         ),
         ("Sent information", {"fields": ("was_sent", "sent_date")}),
     )
@@ -103,16 +114,49 @@ class NotificationAdmin(ModelAdmin):
             "Configuration",
             {"fields": ("is_test", "programed_send_date")},
         ),
-        ("Sent information", {"fields": ("was_sent", "sent_date")}),
+        (
+            "Sent information",
+            {"fields": ("was_sent", "sent_date", "last_processed_user_id")},
+        ),
     )
     list_display_links: tuple = ("id", "subject")
-    readonly_fields: list = ["id", "was_sent", "sent_date"]
+    readonly_fields: list = [
+        "id",
+        "was_sent",
+        "sent_date",
+        "last_processed_user_id",
+    ]
     search_fields: tuple = ("id", "subject", "programed_send_date")
     ordering: tuple = ("is_test", "was_sent", "sent_date")
 
 
+class OutboxAdmin(ModelAdmin):
+    model: Model = Outbox
+    list_display: tuple = (
+        "email",
+        "priority",
+        "programed_send_date",
+        "lease_owner",
+        "lease_expires_at",
+        "attempts",
+        "is_dead_letter",
+    )
+    list_display_links: tuple = ("email",)
+    list_filter: tuple = ("priority", "is_dead_letter")
+    readonly_fields: list = [
+        "email",
+        "lease_owner",
+        "lease_expires_at",
+        "attempts",
+        "last_error",
+    ]
+    search_fields: tuple = ("email__id", "lease_owner")
+    ordering: tuple = ("programed_send_date",)
+
+
 admin.site.register(Email, EmailAdmin)
 admin.site.register(Block, BlockAdmin)
 admin.site.register(Suggestion, SuggestionAdmin)
 admin.site.register(BlackList, BlackListAdmin)
 admin.site.register(Notification, NotificationAdmin)
+admin.site.register(Outbox, OutboxAdmin)
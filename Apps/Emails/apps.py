@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class EmailsConfig(AppConfig):
     default_auto_field: str = "django.db.models.BigAutoField"
     name: str = "Emails"
+
+    def ready(self) -> None:
+        from Emails import checks  # noqa: F401
+        from Emails import receivers  # noqa: F401
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+
+from django.conf import settings
+from django.core.cache import BaseCache
+from django.core.cache import caches
+
+
+class EmailTemplateCache:
+    """
+    Least recently used cache of rendered email templates, kept in the
+    process and optionally in a shared Django cache (like Redis) so all the
+    workers reuse the templates rendered by the others
+    """
+
+    KEY_PREFIX: str = "email-template"
+
+    def __init__(
+        self, max_size: int, alias: str = None, timeout: int = None
+    ) -> None:
+        self.max_size: int = max_size
+        self.alias: str = alias
+        self.timeout: int = timeout
+        self.templates: OrderedDict = OrderedDict()
+        self.lock: Lock = Lock()
+
+    @property
+    def shared_cache(self) -> BaseCache:
+        return caches[self.alias] if self.alias else None
+
+    @classmethod
+    def get_key(cls, *parts: tuple) -> str:
+        version: str = settings.EMAIL_TEMPLATE_VERSION
+        hashed_parts: str = sha256(repr(parts).encode()).hexdigest()
+        return f"{cls.KEY_PREFIX}:{version}:{hashed_parts}"
+
+    def get(self, key: str) -> str:
+        with self.lock:
+            if key in self.templates:
+                self.templates.move_to_end(key)
+                return self.templates[key]
+        if self.shared_cache is None:
+            return None
+        template: str = self.shared_cache.get(key)
+        if template is not None:
+            self.set_locally(key, template)
+        return template
+
+    def set(self, key: str, template: str) -> None:
+        self.set_locally(key, template)
+        if self.shared_cache is not None:
+            self.shared_cache.set(key, template, self.timeout)
+
+    def set_locally(self, key: str, template: str) -> None:
+        with self.lock:
+            self.templates[key] = template
+            self.templates.move_to_end(key)
+            while len(self.templates) > self.max_size:
+                self.templates.popitem(last=False)
+
+    def get_or_render(self, key: str, render: callable) -> str:
+        template: str = self.get(key)
+        if template is None:
+            template = render()
+            self.set(key, template)
+        return template
+
+    def clear(self) -> None:
+        with self.lock:
+            self.templates.clear()
+
+
+email_template_cache: EmailTemplateCache = EmailTemplateCache(
+    max_size=settings.EMAIL_TEMPLATE_CACHE_SIZE,
+    alias=settings.EMAIL_TEMPLATE_CACHE_ALIAS,
+    timeout=settings.EMAIL_TEMPLATE_CACHE_TIMEOUT,
+)
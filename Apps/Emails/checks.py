@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.checks import Error
+from django.core.checks import Tags
+from django.core.checks import register
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+
+@register(Tags.templates, deploy=True)
+def check_compiled_email_template(app_configs: list, **kwargs: dict) -> list:
+    """
+    Without the compiled template every email falls back to rendering the
+    source layout, which is slower and has the css in a style block
+    """
+    try:
+        get_template(settings.EMAIL_COMPILED_TEMPLATE)
+    except TemplateDoesNotExist:
+        return [
+            Error(
+                f"The email template {settings.EMAIL_COMPILED_TEMPLATE} "
+                "was not compiled",
+                hint="Run python manage.py compile_email_template",
+                id="Emails.E001",
+            )
+        ]
+    return []
@@ -1,3 +1,4 @@
+from django.db.models import IntegerChoices
 from django.db.models import TextChoices
 
 
@@ -15,3 +16,8 @@ class EmailAffair(TextChoices):
     SETTINGS: str = "SETTINGS"
     INVOICE: str = "INVOICE"
     SUGGESTION: str = "SUGGESTION"
+
+
+class EmailPriority(IntegerChoices):
+    TRANSACTIONAL: int = 0
+    BULK: int = 1
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.cache import BaseCache
+from django.core.cache import caches
+
+
+class CircuitBreaker:
+    """
+    Counts the consecutive failures of the email backend in a shared cache,
+    once they reach the threshold the circuit is opened and every worker
+    pauses the dispatch until it times out, instead of hammering a failing
+    SMTP server. Without cache alias the circuit is never opened
+    """
+
+    KEY_PREFIX: str = "email-circuit-breaker"
+
+    def __init__(self, name: str = "smtp") -> None:
+        self.name: str = name
+
+    @property
+    def cache(self) -> BaseCache:
+        alias: str = settings.EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS
+        return caches[alias] if alias else None
+
+    @property
+    def failures_key(self) -> str:
+        return f"{self.KEY_PREFIX}:{self.name}:failures"
+
+    @property
+    def open_key(self) -> str:
+        return f"{self.KEY_PREFIX}:{self.name}:open"
+
+    def is_open(self) -> bool:
+        return bool(self.cache and self.cache.get(self.open_key))
+
+    def record_failure(self) -> None:
+        if self.cache is None:
+            return
+        timeout: int = settings.EMAIL_CIRCUIT_BREAKER_TIMEOUT
+        self.cache.add(self.failures_key, 0, timeout)
+        failures: int = self.cache.incr(self.failures_key)
+        if failures >= settings.EMAIL_CIRCUIT_BREAKER_THRESHOLD:
+            self.cache.set(self.open_key, True, timeout)
+            self.cache.delete(self.failures_key)
+
+    def record_success(self) -> None:
+        if self.cache is not None:
+            self.cache.delete(self.failures_key)
+
+    def reset(self) -> None:
+        if self.cache is not None:
+            self.cache.delete_many([self.failures_key, self.open_key])
+
+
+circuit_breaker: CircuitBreaker = CircuitBreaker()
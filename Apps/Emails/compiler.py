@@ -0,0 +1,207 @@
+import re
+from hashlib import sha256
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import find
+from django.template import Template
+from django.template.loader import get_template
+from django.template.loader import select_template
+from inline_static.css import transform_css_urls
+
+
+EMAIL_TEMPLATE: str = "email.html"
+INCLUDE_TAG: re.Pattern = re.compile(
+    r"{%\s*include\s+['\"](?P<name>[^'\"]+)['\"]\s*%}"
+)
+INLINE_STYLE_TAG: re.Pattern = re.compile(
+    r"{%\s*inline_style\s+['\"](?P<name>[^'\"]+)['\"]\s*%}"
+)
+LOAD_TAG: re.Pattern = re.compile(r"{%\s*load\s+inline_static_tags\s*%}\s*")
+STYLE_BLOCK: re.Pattern = re.compile(r"<style[^>]*>(?P<css>.*?)</style>", re.S)
+VERSION_COMMENT: re.Pattern = re.compile(r"^{# version: (?P<version>\w+) #}")
+CSS_COMMENT: re.Pattern = re.compile(r"/\*.*?\*/", re.S)
+CSS_MEDIA_QUERY: re.Pattern = re.compile(r"@media[^{]*{(?:[^{}]*{[^{}]*})*\s*}")
+CSS_RULE: re.Pattern = re.compile(
+    r"(?P<selectors>[^{}]+){(?P<declarations>[^{}]*)}"
+)
+SIMPLE_SELECTOR: re.Pattern = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?(?:\.(?P<class>[\w-]+)|#(?P<id>[\w-]+))?$"
+)
+START_TAG: re.Pattern = re.compile(
+    r"<(?P<tag>[a-zA-Z][\w-]*)(?P<attributes>(?:[^>\"']|\"[^\"]*\"|'[^']*')*)>"
+)
+CLASS_ATTRIBUTE: re.Pattern = re.compile(r"\sclass=\"(?P<value>[^\"]*)\"")
+ID_ATTRIBUTE: re.Pattern = re.compile(r"\sid=\"(?P<value>[^\"]*)\"")
+STYLE_ATTRIBUTE: re.Pattern = re.compile(r"\sstyle=\"(?P<value>[^\"]*)\"")
+
+
+def get_email_template() -> Template:
+    """
+    Returns the compiled email template when it was generated with the
+    compile_email_template command, otherwise the source template
+    """
+    return select_template([settings.EMAIL_COMPILED_TEMPLATE, EMAIL_TEMPLATE])
+
+
+def get_email_template_version(template: Template) -> str:
+    match: re.Match = VERSION_COMMENT.match(template.template.source)
+    return match.group("version") if match else template.template.name
+
+
+class EmailTemplateCompiler:
+    """
+    Flattens the email layout in a single template, moves the css rules that
+    can be inlined into the style attribute of the elements and minifies the
+    result. Media queries and pseudo classes are kept in a style block as they
+    can not be inlined
+    """
+
+    def compile(self) -> str:
+        source: str = self.flatten(get_template_source(EMAIL_TEMPLATE))
+        source = LOAD_TAG.sub("", source)
+        style_block: re.Match = STYLE_BLOCK.search(source)
+        css: str = self.load_styles(style_block.group("css"))
+        rules, remaining_css = self.parse_css(css)
+        head: str = source[: style_block.start()]
+        body: str = source[style_block.end() :]
+        style: str = (
+            f'<style type="text/css">{remaining_css}</style>'
+            if remaining_css
+            else ""
+        )
+        html: str = self.inline_rules(head, rules)
+        html += style + self.inline_rules(body, rules)
+        html = minify_html(html)
+        version: str = sha256(html.encode()).hexdigest()[:12]
+        return f"{{# version: {version} #}}{html}"
+
+    def flatten(self, source: str) -> str:
+        return INCLUDE_TAG.sub(
+            lambda include: self.flatten(
+                get_template_source(include.group("name"))
+            ),
+            source,
+        )
+
+    def load_styles(self, css: str) -> str:
+        return INLINE_STYLE_TAG.sub(
+            lambda style: load_static_file(style.group("name")), css
+        )
+
+    def parse_css(self, css: str) -> tuple:
+        """
+        Returns the rules that can be inlined, as a list of (specificity,
+        order, tag, class, id, declarations), and the css that can not
+        """
+        css = CSS_COMMENT.sub("", css)
+        remaining_css: list = CSS_MEDIA_QUERY.findall(css)
+        css = CSS_MEDIA_QUERY.sub("", css)
+        rules: list = []
+        for order, rule in enumerate(CSS_RULE.finditer(css)):
+            declarations: list = parse_declarations(rule.group("declarations"))
+            not_inlined_selectors: list = []
+            for selector in rule.group("selectors").split(","):
+                selector = selector.strip()
+                match: re.Match = SIMPLE_SELECTOR.match(selector)
+                if not selector or not match:
+                    not_inlined_selectors.append(selector)
+                    continue
+                tag, class_name, element_id = match.group("tag", "class", "id")
+                specificity: tuple = (
+                    bool(element_id),
+                    bool(class_name),
+                    bool(tag),
+                )
+                rules.append(
+                    (
+                        specificity,
+                        order,
+                        tag,
+                        class_name,
+                        element_id,
+                        declarations,
+                    )
+                )
+            if not_inlined_selectors:
+                remaining_css.append(
+                    f"{','.join(not_inlined_selectors)}"
+                    f"{{{rule.group('declarations')}}}"
+                )
+        rules.sort(key=lambda rule: rule[:2])
+        return rules, minify_css("".join(remaining_css))
+
+    def inline_rules(self, html: str, rules: list) -> str:
+        return START_TAG.sub(
+            lambda element: self.inline_element(element, rules), html
+        )
+
+    def inline_element(self, element: re.Match, rules: list) -> str:
+        tag: str = element.group("tag").lower()
+        attributes: str = element.group("attributes")
+        class_attribute: re.Match = CLASS_ATTRIBUTE.search(attributes)
+        id_attribute: re.Match = ID_ATTRIBUTE.search(attributes)
+        classes: list = []
+        if class_attribute:
+            classes = class_attribute.group("value").split()
+        element_id: str = id_attribute.group("value") if id_attribute else None
+        styles: dict = {}
+        for _, _, rule_tag, rule_class, rule_id, declarations in rules:
+            if rule_tag and rule_tag.lower() != tag:
+                continue
+            if rule_class and rule_class not in classes:
+                continue
+            if rule_id and rule_id != element_id:
+                continue
+            styles.update(declarations)
+        if not styles:
+            return element.group(0)
+        style_attribute: re.Match = STYLE_ATTRIBUTE.search(attributes)
+        if style_attribute:
+            styles.update(parse_declarations(style_attribute.group("value")))
+            attributes = STYLE_ATTRIBUTE.sub("", attributes)
+        style: str = ";".join(
+            f"{property}:{value}" for property, value in styles.items()
+        )
+        closing: str = ""
+        if attributes.rstrip().endswith("/"):
+            attributes, closing = attributes.rstrip()[:-1], " /"
+        return f'<{element.group("tag")}{attributes} style="{style}"{closing}>'
+
+
+def get_template_source(name: str) -> str:
+    return get_template(name).template.source
+
+
+def load_static_file(name: str) -> str:
+    path: str = find(name)
+    if not path:
+        raise FileNotFoundError(f"Static file not found: {name}")
+    with open(path, "r") as static_file:
+        content: str = static_file.read()
+    return transform_css_urls(name, path, content)
+
+
+def parse_declarations(declarations: str) -> list:
+    parsed_declarations: list = []
+    for declaration in declarations.split(";"):
+        if ":" not in declaration:
+            continue
+        property, value = declaration.split(":", 1)
+        value = " ".join(value.split()).replace('"', "'")
+        parsed_declarations.append((property.strip(), value))
+    return parsed_declarations
+
+
+def minify_css(css: str) -> str:
+    css = " ".join(css.split())
+    return re.sub(r"\s*([{};:,])\s*", r"\1", css).replace(";}", "}")
+
+
+def minify_html(html: str) -> str:
+    """
+    Removes the comments and indentation but keeps the line breaks, a single
+    line body would exceed the SMTP line limit and be sent quoted printable
+    """
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    html = re.sub(r"\s*\n\s*", "\n", html)
+    return re.sub(r"[ \t]+", " ", html).strip()
@@ -0,0 +1,206 @@
+from smtplib import SMTPConnectError
+from smtplib import SMTPException
+from smtplib import SMTPServerDisconnected
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.db.models import QuerySet
+
+from Emails.abstracts import AbstractEmailFunctionClass
+from Emails.circuit_breaker import circuit_breaker
+from Emails.models import BlackList
+from Emails.models import Email
+from Emails.models import Outbox
+from Emails.renderer import EmailBatchRenderer
+from Emails.suppression import suppression_cache
+from Project.utils.log import log_connection_error
+from Project.utils.log import log_information
+
+
+BACKEND_ERRORS: tuple = (SMTPConnectError, SMTPServerDisconnected)
+
+
+class EmailDispatcher:
+    """
+    Sends outbox emails in batches, every batch is delivered through a single
+    backend connection instead of opening one per message. The ids of the
+    sent, failed and blacklisted emails are collected in the results, the
+    blacklisted emails are dropped from the outbox as they will not be sent.
+    Failed emails are retried later with a backoff and, while the circuit
+    breaker is open, the pending emails are deferred to the next dispatch.
+    The status of the sent emails is written once per batch. A backend that
+    can not be reached defers the batch. With an owner the lease of the
+    emails is renewed before every batch
+    """
+
+    def __init__(self, batch_size: int = None, owner: str = None) -> None:
+        self.batch_size: int = batch_size or settings.EMAIL_DISPATCH_BATCH_SIZE
+        self.owner: str = owner
+        self.renderer: EmailBatchRenderer = EmailBatchRenderer()
+        self.results: dict = {
+            "sent": [],
+            "failed": [],
+            "blacklisted": [],
+            "dead_letter": [],
+            "deferred": [],
+        }
+
+    def dispatch(self, emails: iter) -> dict:
+        if isinstance(emails, QuerySet):
+            emails = EmailBatchRenderer.prepare(emails)
+        batch: list = []
+        for email in emails:
+            batch.append(email)
+            if len(batch) == self.batch_size:
+                self.send_batch(batch)
+                batch = []
+        if batch:
+            self.send_batch(batch)
+        return self.results
+
+    def send_batch(self, emails: list) -> None:
+        if self.owner is not None:
+            emails = self.renew_lease(emails)
+        if not emails:
+            return
+        blacklisted_ids: set = self.get_blacklisted_ids(emails)
+        if blacklisted_ids:
+            Outbox.objects.filter(email_id__in=blacklisted_ids).delete()
+            self.results["blacklisted"].extend(
+                email.id for email in emails if email.id in blacklisted_ids
+            )
+        pending: list = [
+            email for email in emails if email.id not in blacklisted_ids
+        ]
+        errors: dict = {}
+        sent_emails: list = []
+        if not pending:
+            return
+        if circuit_breaker.is_open():
+            self.defer(pending)
+            return
+        connection: BaseEmailBackend = get_connection(fail_silently=False)
+        if not self.open_connection(connection):
+            self.defer(pending)
+            return
+        try:
+            for index, email in enumerate(pending):
+                if errors and circuit_breaker.is_open():
+                    self.defer(pending[index:])
+                    break
+                error: Exception = self.send_email(email, connection)
+                if error is None:
+                    sent_emails.append(email)
+                    circuit_breaker.record_success()
+                    continue
+                errors[email.id] = repr(error)
+                if self.is_backend_error(error):
+                    circuit_breaker.record_failure()
+                    self.reopen_connection(connection)
+        finally:
+            self.close_connection(connection)
+            if sent_emails:
+                self.save_as_sent(sent_emails)
+            if errors:
+                self.results["dead_letter"].extend(
+                    Outbox.objects.reschedule(errors, self.owner)
+                )
+
+    def renew_lease(self, emails: list) -> list:
+        """
+        Extends the lease before sending every batch, a long chunk would
+        outlive it otherwise. The emails taken by another owner meanwhile are
+        dropped as that owner sends them
+        """
+        renewed_ids: set = set(
+            Outbox.objects.renew(self.owner, [email.id for email in emails])
+        )
+        return [email for email in emails if email.id in renewed_ids]
+
+    def get_blacklisted_ids(self, emails: list) -> set:
+        """
+        Returns the ids of the emails whose recipient blacklisted their affair,
+        the masks of all the recipients of the batch are read at once from the
+        suppression cache
+        """
+        masks: dict = suppression_cache.get_masks(
+            list({email.to_id for email in emails})
+        )
+        return {
+            email.id
+            for email in emails
+            if masks[email.to_id] & BlackList.get_affair_bit(email.affair)
+        }
+
+    def send_email(
+        self, email: AbstractEmailFunctionClass, connection: BaseEmailBackend
+    ) -> Exception:
+        try:
+            self.renderer.get_message(email, connection).send()
+        except Exception as error:
+            self.results["failed"].append(email.id)
+            log_information(f"Not sent: {error!r}", email)
+            return error
+        email.set_as_sent()
+        self.results["sent"].append(email.id)
+        log_information(f"Sent: {email.was_sent}", email)
+        return None
+
+    @staticmethod
+    def is_backend_error(error: Exception) -> bool:
+        """
+        Only the errors of the SMTP server or the network count for the
+        circuit breaker, an email refused for its recipient or content says
+        nothing about the health of the backend
+        """
+        if isinstance(error, BACKEND_ERRORS):
+            return True
+        return isinstance(error, OSError) and not isinstance(
+            error, SMTPException
+        )
+
+    def save_as_sent(self, emails: list) -> None:
+        """
+        Marks the sent emails of the batch and removes them from the outbox
+        with one update and one delete, instead of a full save per email
+        """
+        with transaction.atomic():
+            Email.objects.bulk_update(emails, ["was_sent", "sent_date"])
+            Outbox.objects.filter(
+                email_id__in=[email.id for email in emails]
+            ).delete()
+
+    def open_connection(self, connection: BaseEmailBackend) -> bool:
+        """
+        A backend that can not be reached counts as a failure for the circuit
+        breaker, the batch is deferred instead of failing the dispatch
+        """
+        try:
+            connection.open()
+        except Exception as error:
+            log_connection_error("be opened", error)
+            circuit_breaker.record_failure()
+            return False
+        return True
+
+    def close_connection(self, connection: BaseEmailBackend) -> None:
+        try:
+            connection.close()
+        except Exception as error:
+            log_connection_error("be closed", error)
+
+    def reopen_connection(self, connection: BaseEmailBackend) -> None:
+        """
+        A failed send can leave the SMTP session broken, the connection is
+        opened again so the next emails of the batch do not fail because of it
+        """
+        self.close_connection(connection)
+        self.open_connection(connection)
+
+    def defer(self, emails: list) -> None:
+        emails_ids: list = [email.id for email in emails]
+        self.results["deferred"].extend(emails_ids)
+        if self.owner is not None:
+            Outbox.objects.release(self.owner, emails_ids)
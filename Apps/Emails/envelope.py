@@ -0,0 +1,88 @@
+from email.message import Message
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.message import RFC5322_EMAIL_LINE_LENGTH_LIMIT
+from django.core.mail.message import SafeMIMEText
+from django.utils.html import escape
+
+
+STAMPABLE_ENCODINGS: tuple = ("7bit", "8bit")
+
+
+def replace_variables(html: str, variables: dict) -> str:
+    for name, value in variables.items():
+        html = html.replace("{" + name + "}", escape(value))
+    return html
+
+
+class MessageEnvelope:
+    """
+    Html part shared by the messages of an email variant, it is encoded once
+    with the recipient placeholders and every message gets a copy with its
+    values stamped. Parts encoded as quoted printable or base64, where a
+    placeholder could be split by the encoding, are built per message
+    """
+
+    def __init__(self, html: str) -> None:
+        self.html: str = html
+        self.part: Message = None
+
+    def get_part(self, encoding: str, variables: dict) -> Message:
+        if self.part is None:
+            self.part = SafeMIMEText(self.html, "html", encoding)
+        if not variables:
+            return self.part
+        transfer_encoding: str = self.part["Content-Transfer-Encoding"]
+        if transfer_encoding not in STAMPABLE_ENCODINGS:
+            return None
+        charset: str = self.part.get_content_charset()
+        # The raw 8bit payload keeps its bytes surrogate escaped, get_payload
+        # would decode them and the message could not be serialized
+        payload: str = self.part._payload
+        for name, value in variables.items():
+            encoded_value: str = (
+                escape(value).encode(charset).decode("ascii", "surrogateescape")
+            )
+            payload = payload.replace("{" + name + "}", encoded_value)
+        if any(
+            len(line) > RFC5322_EMAIL_LINE_LENGTH_LIMIT
+            for line in payload.splitlines()
+        ):
+            return None
+        part: Message = Message()
+        for name, value in self.part.raw_items():
+            part.set_raw(name, value)
+        part.set_payload(payload)
+        if not payload.isascii():
+            part.replace_header("Content-Transfer-Encoding", "8bit")
+        return part
+
+
+class EnvelopeEmailMessage(EmailMultiAlternatives):
+    """
+    Email message that takes its html part from the envelope of its variant,
+    falling back to encoding it when the envelope can not stamp it. The html
+    alternative keeps the placeholders, the values of the recipient are
+    replaced when the message is built
+    """
+
+    def __init__(
+        self,
+        *args: tuple,
+        envelope: MessageEnvelope,
+        variables: dict,
+        **kwargs: dict,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.envelope: MessageEnvelope = envelope
+        self.variables: dict = variables
+
+    def _create_mime_attachment(self, content: str, mimetype: str) -> Message:
+        if mimetype == "text/html":
+            encoding: str = self.encoding or settings.DEFAULT_CHARSET
+            part: Message = self.envelope.get_part(encoding, self.variables)
+            if part is not None:
+                return part
+            content = replace_variables(content, self.variables)
+        return super()._create_mime_attachment(content, mimetype)
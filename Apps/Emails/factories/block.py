@@ -5,8 +5,7 @@ from factory.django import DjangoModelFactory
 
 from Emails.models import Block
 from Project.utils.translation import get_translation_in
-from Users.models import User
-from Users.utils import generate_user_verification_token
+from Users.choices import PreferredLanguageChoices
 
 
 class BlockFactory(DjangoModelFactory):
@@ -18,63 +17,66 @@ class BlockFactory(DjangoModelFactory):
     link: str = ""
 
 
-class ResetPasswordBlockFactory(BlockFactory):
-    class Params:
-        instance: User = None
+class TemplateBlockFactory(BlockFactory):
+    """
+    Returns the shared block of the given name and language, creating it only
+    the first time and updating its content when the translations change.
+    The recipient fields are placeholders
+    """
 
+    language: str = PreferredLanguageChoices.ENGLISH
     title: str = LazyAttribute(
         lambda object: (
-            get_translation_in(
-                object.instance.user.preferred_language, settings.EMAIL_GREETING
-            )
-            + f"{object.instance.user.first_name}!"
+            get_translation_in(object.language, settings.EMAIL_GREETING)
+            + " {first_name}!"
         )
     )
+    show_link: bool = True
+    link: str = "{link}"
+
+    @classmethod
+    def _create(cls, model_class: Model, *args: tuple, **kwargs: dict) -> Block:
+        block, created = cls._get_manager(model_class).get_or_create(
+            name=kwargs.pop("name"),
+            language=kwargs.pop("language"),
+            defaults=kwargs,
+        )
+        changed_fields: list = [
+            field
+            for field, value in kwargs.items()
+            if getattr(block, field) != value
+        ]
+        if changed_fields:
+            for field in changed_fields:
+                setattr(block, field, kwargs[field])
+            block.save(update_fields=changed_fields)
+        return block
+
+
+class ResetPasswordBlockFactory(TemplateBlockFactory):
+    name: str = "reset_password"
     content: str = LazyAttribute(
         lambda object: get_translation_in(
-            object.instance.user.preferred_language,
-            settings.RESET_PASSWORD_EMAIL_CONTENT,
+            object.language, settings.RESET_PASSWORD_EMAIL_CONTENT
         )
     )
-    show_link: bool = True
     link_text: str = LazyAttribute(
         lambda object: get_translation_in(
-            object.instance.user.preferred_language,
-            settings.RESET_PASSWORD_EMAIL_LINK_TEXT,
+            object.language, settings.RESET_PASSWORD_EMAIL_LINK_TEXT
         )
     )
-    link: str = LazyAttribute(
-        lambda object: f"{settings.RESET_PASSWORD_URL}/{object.instance.key}"
-    )
-
 
-class VerifyEmailBlockFactory(BlockFactory):
-    class Params:
-        user: User = None
 
-    title: str = LazyAttribute(
-        lambda object: (
-            get_translation_in(
-                object.user.preferred_language, settings.EMAIL_GREETING
-            )
-            + f" {object.user.first_name}!"
-        )
-    )
+class VerifyEmailBlockFactory(TemplateBlockFactory):
+    name: str = "verify_email"
     content: str = LazyAttribute(
         lambda object: get_translation_in(
-            object.user.preferred_language, settings.VERIFY_EMAIL_CONTENT
+            object.language, settings.VERIFY_EMAIL_CONTENT
         )
     )
-    show_link: bool = True
     link_text: str = LazyAttribute(
         lambda object: get_translation_in(
-            object.user.preferred_language, settings.VERIFY_EMAIL_LINK_TEXT
-        )
-    )
-    link: str = LazyAttribute(
-        lambda object: (
-            f"{settings.VERIFY_EMAIL_URL}/{object.user.id}/verify/?token="
-            f"{generate_user_verification_token(object.user)}"
+            object.language, settings.VERIFY_EMAIL_LINK_TEXT
         )
     )
 
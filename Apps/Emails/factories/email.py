@@ -9,6 +9,7 @@ from factory import LazyAttribute
 from factory import post_generation
 from factory.django import DjangoModelFactory
 
+from Emails.choices import EmailPriority
 from Emails.factories.block import BlockFactory
 from Emails.factories.block import ResetPasswordBlockFactory
 from Emails.factories.block import VerifyEmailBlockFactory
@@ -16,6 +17,7 @@ from Emails.models import Block
 from Emails.models import Email
 from Project.utils.translation import get_translation_in
 from Users.models import User
+from Users.utils import generate_user_verification_token
 
 
 class EmailFactory(DjangoModelFactory):
@@ -54,16 +56,19 @@ class ResetEmailFactory(EmailFactory):
     )
     to: User = LazyAttribute(lambda object: object.instance.user)
     programed_send_date: datetime = None
+    priority: int = EmailPriority.TRANSACTIONAL
     language: str = LazyAttribute(
         lambda object: object.instance.user.preferred_language
     )
+    variables: dict = LazyAttribute(
+        lambda object: {
+            "link": f"{settings.RESET_PASSWORD_URL}/{object.instance.key}"
+        }
+    )
 
     @post_generation
     def blocks(self, create: bool, extracted: Model, **kwargs: dict) -> None:
-        token: ResetPasswordToken = ResetPasswordToken.objects.filter(
-            user_id=self.to.id
-        ).last()
-        block: Block = ResetPasswordBlockFactory(instance=token)
+        block: Block = ResetPasswordBlockFactory(language=self.language)
         self.blocks.add(block)
 
 
@@ -84,11 +89,20 @@ class VerifyEmailFactory(EmailFactory):
     )
     to: User = LazyAttribute(lambda object: object.instance)
     programed_send_date: datetime = None
+    priority: int = EmailPriority.TRANSACTIONAL
     language: str = LazyAttribute(
         lambda object: object.instance.preferred_language
     )
+    variables: dict = LazyAttribute(
+        lambda object: {
+            "link": (
+                f"{settings.VERIFY_EMAIL_URL}/{object.instance.id}/verify/"
+                f"?token={generate_user_verification_token(object.instance)}"
+            )
+        }
+    )
 
     @post_generation
     def blocks(self, create: bool, extracted: Model, **kwargs: dict) -> None:
-        block: Block = VerifyEmailBlockFactory(user=self.to)
+        block: Block = VerifyEmailBlockFactory(language=self.language)
         self.blocks.add(block)
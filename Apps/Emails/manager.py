@@ -0,0 +1,232 @@
+from datetime import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models import Manager
+from django.db.models import Model
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.utils.timezone import now
+from django.utils.timezone import timedelta
+
+
+class EmailManager(Manager):
+    def get_due(self) -> QuerySet:
+        return self.filter(
+            outbox__programed_send_date__lte=now(),
+            outbox__is_dead_letter=False,
+        )
+
+    def get_claimed(self, owner: str, emails_ids: list) -> QuerySet:
+        return self.filter(
+            id__in=emails_ids,
+            outbox__lease_owner=owner,
+            outbox__lease_expires_at__gt=now(),
+        )
+
+
+class OutboxManager(Manager):
+    """
+    Outbox manager that allows several workers to take due emails from the
+    queue without sending the same email twice
+    """
+
+    def get_due(self) -> QuerySet:
+        return self.filter(programed_send_date__lte=now(), is_dead_letter=False)
+
+    def claim(
+        self,
+        owner: str,
+        limit: int,
+        emails_ids: list = None,
+        priority: int = None,
+    ) -> list:
+        """
+        Leases up to limit due emails to the given owner and returns their ids,
+        the emails can be restricted to the given ids or priority lane. Rows
+        locked by another transaction are skipped and the emails leased by
+        another owner are only taken again once the lease expires
+        """
+        current_date: datetime = now()
+        lease_expires_at: datetime = self.get_lease_expires_at(current_date)
+        is_not_leased: Q = Q(lease_expires_at__isnull=True) | Q(
+            lease_expires_at__lte=current_date
+        )
+        pending: QuerySet = self.get_due().filter(is_not_leased)
+        if emails_ids is not None:
+            pending = pending.filter(email_id__in=emails_ids)
+        if priority is not None:
+            pending = pending.filter(priority=priority)
+        with transaction.atomic():
+            claimed_ids: list = list(
+                pending.select_for_update(skip_locked=True)
+                .order_by("priority", "programed_send_date", "email_id")
+                .values_list("email_id", flat=True)[:limit]
+            )
+            self.filter(email_id__in=claimed_ids).update(
+                lease_owner=owner, lease_expires_at=lease_expires_at
+            )
+        return claimed_ids
+
+    def renew(self, owner: str, emails_ids: list) -> list:
+        """
+        Extends the lease of the given emails that the owner still holds and
+        returns their ids, the ones that were taken by another owner after the
+        lease expired are left out
+        """
+        lease_expires_at: datetime = self.get_lease_expires_at(now())
+        with transaction.atomic():
+            renewed_ids: list = list(
+                self.get_due()
+                .filter(email_id__in=emails_ids, lease_owner=owner)
+                .select_for_update(skip_locked=True)
+                .values_list("email_id", flat=True)
+            )
+            self.filter(email_id__in=renewed_ids).update(
+                lease_expires_at=lease_expires_at
+            )
+        return renewed_ids
+
+    def get_lease_expires_at(self, current_date: datetime) -> datetime:
+        return current_date + timedelta(seconds=settings.EMAIL_LEASE_SECONDS)
+
+    def release(self, owner: str, emails_ids: list) -> None:
+        self.filter(email_id__in=emails_ids, lease_owner=owner).update(
+            lease_owner=None, lease_expires_at=None
+        )
+
+    def reschedule(self, errors: dict, owner: str = None) -> list:
+        """
+        Pushes back the failed emails, given as {email id: error}, with an
+        exponential backoff and releases their lease. The emails that reached
+        the max attempts are moved to the dead letters, their ids are returned
+        """
+        current_date: datetime = now()
+        outboxes: QuerySet = self.filter(email_id__in=list(errors))
+        if owner is not None:
+            outboxes = outboxes.filter(lease_owner=owner)
+        outboxes = list(outboxes)
+        for outbox in outboxes:
+            outbox.attempts += 1
+            outbox.last_error = errors[outbox.email_id]
+            outbox.is_dead_letter = (
+                outbox.attempts >= settings.EMAIL_MAX_ATTEMPTS
+            )
+            outbox.programed_send_date = current_date + timedelta(
+                seconds=self.get_retry_delay(outbox.attempts)
+            )
+            outbox.lease_owner = None
+            outbox.lease_expires_at = None
+        self.bulk_update(
+            outboxes,
+            [
+                "attempts",
+                "last_error",
+                "is_dead_letter",
+                "programed_send_date",
+                "lease_owner",
+                "lease_expires_at",
+            ],
+        )
+        return [outbox.email_id for outbox in outboxes if outbox.is_dead_letter]
+
+    def get_retry_delay(self, attempts: int) -> int:
+        return get_retry_delay(attempts)
+
+
+class SuggestionManager(Manager):
+    """
+    Suggestion manager that leases the pending suggestions before sending
+    them, so the task of a new suggestion and the sweeper never send the same
+    suggestion twice. Failed suggestions are retried later with a backoff
+    """
+
+    def claim(self, suggestions_ids: list = None) -> list:
+        """
+        Leases the pending suggestions, restricted to the given ids, and
+        returns their ids. Suggestions that are already leased or that failed
+        too many times are skipped
+        """
+        current_date: datetime = now()
+        lease_expires_at: datetime = current_date + timedelta(
+            seconds=settings.EMAIL_LEASE_SECONDS
+        )
+        pending: QuerySet = self.filter(
+            Q(lease_expires_at__isnull=True)
+            | Q(lease_expires_at__lte=current_date),
+            was_sent=False,
+            attempts__lt=settings.EMAIL_MAX_ATTEMPTS,
+        )
+        if suggestions_ids is not None:
+            pending = pending.filter(id__in=suggestions_ids)
+        with transaction.atomic():
+            claimed_ids: list = list(
+                pending.select_for_update(skip_locked=True).values_list(
+                    "id", flat=True
+                )
+            )
+            self.filter(id__in=claimed_ids).update(
+                lease_expires_at=lease_expires_at
+            )
+        return claimed_ids
+
+    def reschedule(self, suggestion: Model, error: Exception) -> None:
+        """
+        Keeps the failed suggestion leased until its next attempt is due
+        """
+        attempts: int = suggestion.attempts + 1
+        retry_date: datetime = now() + timedelta(
+            seconds=get_retry_delay(attempts)
+        )
+        self.filter(id=suggestion.id).update(
+            attempts=attempts,
+            last_error=repr(error),
+            lease_expires_at=retry_date,
+        )
+
+
+class BlackListManager(Manager):
+    def with_affair(self, affair: str) -> QuerySet:
+        """
+        Blacklist entries that include the given affair, checked as a bit of
+        the affairs mask so the match is exact
+        """
+        affair_bit: int = self.model.get_affair_bit(affair)
+        return self.annotate(
+            affair_match=F("affairs_mask").bitand(affair_bit)
+        ).filter(affair_match__gt=0)
+
+    def filter_blacklisted(self, users_ids: list, affair: str) -> set:
+        """
+        Returns the ids of the given users that have the affair blacklisted,
+        with a single query for the whole batch
+        """
+        blacklisted: QuerySet = self.with_affair(affair).filter(
+            user_id__in=users_ids
+        )
+        return set(blacklisted.values_list("user_id", flat=True))
+
+    def add_affair(self, user_id: int, affair: str) -> Model:
+        """
+        Adds the affair to the blacklist of the user, creating it when the
+        user has none
+        """
+        with transaction.atomic():
+            blacklist: Model = (
+                self.select_for_update()
+                .filter(user_id=user_id)
+                .order_by("id")
+                .first()
+            )
+            if blacklist is None:
+                return self.create(user_id=user_id, affairs=[affair])
+            if affair not in blacklist.affairs:
+                blacklist.affairs = [*blacklist.affairs, affair]
+                blacklist.save()
+        return blacklist
+
+
+def get_retry_delay(attempts: int) -> int:
+    delay: int = settings.EMAIL_RETRY_DELAY_SECONDS * 2 ** (attempts - 1)
+    return min(delay, settings.EMAIL_RETRY_MAX_DELAY_SECONDS)
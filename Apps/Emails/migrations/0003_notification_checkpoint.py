@@ -0,0 +1,22 @@
+# Generated by Django 4.1.2 on 2026-10-17 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0002_email_notification'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='last_processed_user_id',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddConstraint(
+            model_name='email',
+            constraint=models.UniqueConstraint(fields=('notification', 'to'), name='unique_notification_recipient'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.1.2 on 2026-10-17 20:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0003_notification_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='email',
+            name='lease_expires_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='email',
+            name='lease_owner',
+            field=models.CharField(editable=False, max_length=100, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='email',
+            index=models.Index(fields=['was_sent', 'programed_send_date'], name='email_due_date_index'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.1.2 on 2026-10-17 20:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django_prometheus.models
+from django.utils import timezone
+
+
+def fill_outbox_with_pending_emails(apps, schema_editor):
+    Email = apps.get_model("Emails", "Email")
+    Outbox = apps.get_model("Emails", "Outbox")
+    pending_emails = Email.objects.filter(was_sent=False).values_list(
+        "id", "programed_send_date"
+    )
+    Outbox.objects.bulk_create(
+        [
+            Outbox(
+                email_id=email_id,
+                programed_send_date=programed_send_date or timezone.now(),
+            )
+            for email_id, programed_send_date in pending_emails.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0004_email_lease'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Outbox',
+            fields=[
+                ('email', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='outbox', serialize=False, to='Emails.email')),
+                ('programed_send_date', models.DateTimeField(db_index=True)),
+                ('lease_owner', models.CharField(editable=False, max_length=100, null=True)),
+                ('lease_expires_at', models.DateTimeField(editable=False, null=True)),
+            ],
+            bases=(django_prometheus.models.ExportModelOperationsMixin('outbox'), models.Model),
+        ),
+        migrations.RunPython(
+            fill_outbox_with_pending_emails, migrations.RunPython.noop
+        ),
+        migrations.RemoveIndex(
+            model_name='email',
+            name='email_due_date_index',
+        ),
+        migrations.RemoveField(
+            model_name='email',
+            name='lease_expires_at',
+        ),
+        migrations.RemoveField(
+            model_name='email',
+            name='lease_owner',
+        ),
+    ]
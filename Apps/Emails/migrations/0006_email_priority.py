@@ -0,0 +1,32 @@
+# Generated by Django 4.1.2 on 2026-10-17 20:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0005_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='email',
+            name='priority',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Transactional'), (1, 'Bulk')], default=1),
+        ),
+        migrations.AddField(
+            model_name='outbox',
+            name='priority',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Transactional'), (1, 'Bulk')], default=1),
+        ),
+        migrations.AlterField(
+            model_name='outbox',
+            name='programed_send_date',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='outbox',
+            index=models.Index(fields=['priority', 'programed_send_date'], name='outbox_lane_due_date_index'),
+        ),
+    ]
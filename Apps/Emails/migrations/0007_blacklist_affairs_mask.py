@@ -0,0 +1,45 @@
+# Generated by Django 4.1.2 on 2026-10-17 20:36
+
+from django.db import migrations, models
+
+
+# Affairs in the order of the choices when the mask was introduced
+AFFAIRS = (
+    "NOTIFICATION",
+    "PROMOTION",
+    "GENERAL",
+    "SETTINGS",
+    "INVOICE",
+    "SUGGESTION",
+)
+
+
+def fill_affairs_mask(apps, schema_editor):
+    BlackList = apps.get_model("Emails", "BlackList")
+    blacklist = BlackList.objects.only("id", "affairs")
+    for entry in blacklist.iterator():
+        mask = 0
+        for affair in entry.affairs or []:
+            if affair in AFFAIRS:
+                mask |= 1 << AFFAIRS.index(affair)
+        entry.affairs_mask = mask
+        entry.save(update_fields=["affairs_mask"])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0006_email_priority'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blacklist',
+            name='affairs_mask',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='blacklist',
+            index=models.Index(fields=['user', 'affairs_mask'], name='blacklist_user_affairs_index'),
+        ),
+        migrations.RunPython(fill_affairs_mask, migrations.RunPython.noop),
+    ]
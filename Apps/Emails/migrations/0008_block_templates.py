@@ -0,0 +1,32 @@
+# Generated by Django 4.1.2 on 2026-10-17 20:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0007_blacklist_affairs_mask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='block',
+            name='language',
+            field=models.CharField(blank=True, choices=[('EN', 'English'), ('ES', 'Spanish'), ('FR', 'French'), ('OT', 'Other')], max_length=2, null=True),
+        ),
+        migrations.AddField(
+            model_name='block',
+            name='name',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='email',
+            name='variables',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddIndex(
+            model_name='block',
+            index=models.Index(fields=['name', 'language'], name='block_template_index'),
+        ),
+    ]
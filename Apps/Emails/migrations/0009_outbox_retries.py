@@ -0,0 +1,28 @@
+# Generated by Django 4.1.2 on 2026-10-17 20:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0008_block_templates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outbox',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='outbox',
+            name='is_dead_letter',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='outbox',
+            name='last_error',
+            field=models.TextField(editable=False, null=True),
+        ),
+    ]
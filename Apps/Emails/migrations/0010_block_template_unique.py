@@ -0,0 +1,57 @@
+# Generated by Django 4.1.2 on 2026-10-17 21:58
+
+from django.db import migrations, models
+
+
+def merge_duplicated_template_blocks(apps, schema_editor):
+    """
+    Keeps the oldest block of every name and language, the emails that used
+    a duplicate are moved to it before the duplicate is deleted
+    """
+    Block = apps.get_model("Emails", "Block")
+    through_models = [
+        relation.through
+        for relation in Block._meta.get_fields()
+        if relation.many_to_many and relation.auto_created
+    ]
+    blocks = Block.objects.filter(name__isnull=False).order_by("id")
+    kept_ids = {}
+    for block in blocks.only("id", "name", "language").iterator():
+        key = (block.name, block.language)
+        if key not in kept_ids:
+            kept_ids[key] = block.id
+            continue
+        for through in through_models:
+            owner_field = next(
+                field.attname
+                for field in through._meta.get_fields()
+                if field.is_relation and field.related_model is not Block
+            )
+            rows = through.objects.filter(block_id=block.id)
+            kept_owners = through.objects.filter(
+                block_id=kept_ids[key]
+            ).values_list(owner_field, flat=True)
+            rows.filter(**{f"{owner_field}__in": kept_owners}).delete()
+            rows.update(block_id=kept_ids[key])
+        block.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0009_outbox_retries'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            merge_duplicated_template_blocks, migrations.RunPython.noop
+        ),
+        migrations.RemoveIndex(
+            model_name='block',
+            name='block_template_index',
+        ),
+        migrations.AddConstraint(
+            model_name='block',
+            constraint=models.UniqueConstraint(fields=('name', 'language'), name='block_template_unique'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.1.2 on 2026-10-17 22:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Emails', '0010_block_template_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='suggestion',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='suggestion',
+            name='last_error',
+            field=models.TextField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='suggestion',
+            name='lease_expires_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+    ]
@@ -1,14 +1,27 @@
 from datetime import datetime
 
 from django.conf import settings
+from django.db import transaction
 from django.db.models import CASCADE
+from django.db.models import SET_NULL
+from django.db.models import BigIntegerField
 from django.db.models import BooleanField
 from django.db.models import CharField
 from django.db.models import DateTimeField
+from django.db.models import Exists
 from django.db.models import ForeignKey
+from django.db.models import Index
+from django.db.models import JSONField
+from django.db.models import Manager
 from django.db.models import ManyToManyField
 from django.db.models import Model
+from django.db.models import OneToOneField
+from django.db.models import OuterRef
+from django.db.models import PositiveIntegerField
+from django.db.models import PositiveSmallIntegerField
+from django.db.models import QuerySet
 from django.db.models import TextField
+from django.db.models import UniqueConstraint
 from django.db.models import URLField
 from django.db.models.fields import Field
 from django.db.models.fields.related import ForeignObject
@@ -22,6 +35,14 @@ from Emails import factories
 from Emails.abstracts import AbstractEmailFunctionClass
 from Emails.choices import CommentType
 from Emails.choices import EmailAffair
+from Emails.choices import EmailPriority
+from Emails.manager import BlackListManager
+from Emails.manager import EmailManager
+from Emails.manager import OutboxManager
+from Emails.manager import SuggestionManager
+from Emails.signals import emails_bulk_created
+from Emails.unsubscribe import UNSUBSCRIBE_LINK_PLACEHOLDER
+from Emails.unsubscribe import get_unsubscribe_url
 from Project.utils.translation import get_translation_in
 from Users.choices import PreferredLanguageChoices
 from Users.fakers.user import EmailTestUserFaker
@@ -32,7 +53,9 @@ class Block(Model):
     """
     Block models will be used as small parts that an email can have,
     allowing this way to create a more dynamic emails according to the
-    topic of the email.
+    topic of the email. Named blocks are templates shared by every email of
+    the same kind and language, with placeholders like {first_name} that are
+    filled in for every recipient
     """
 
     title: Field = CharField(max_length=100, null=True)
@@ -40,6 +63,20 @@ class Block(Model):
     show_link: Field = BooleanField(default=False)
     link_text: Field = CharField(max_length=100, null=True, blank=True)
     link: Field = URLField(max_length=100, null=True, blank=True)
+    name: Field = CharField(max_length=50, null=True, blank=True)
+    language: Field = CharField(
+        max_length=2,
+        choices=PreferredLanguageChoices.choices,
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        constraints: list = [
+            UniqueConstraint(
+                fields=["name", "language"], name="block_template_unique"
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.id} | {self.title}"
@@ -73,6 +110,28 @@ class Email(
         default=PreferredLanguageChoices.ENGLISH,
         null=True,
     )
+    notification: ForeignObject = ForeignKey(
+        "Emails.Notification",
+        on_delete=SET_NULL,
+        null=True,
+        blank=True,
+        related_name="emails",
+    )
+    priority: Field = PositiveSmallIntegerField(
+        choices=EmailPriority.choices, default=EmailPriority.BULK
+    )
+    variables: Field = JSONField(default=dict, blank=True)
+
+    objects: Manager = EmailManager()
+    recipient_field: str = "to"
+
+    class Meta:
+        constraints: list = [
+            UniqueConstraint(
+                fields=["notification", "to"],
+                name="unique_notification_recipient",
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.id} | {self.subject}"
@@ -80,8 +139,18 @@ class Email(
     def get_email(self) -> str:
         return self.to.email
 
+    def get_blacklist_lookup(self) -> dict:
+        return {"user_id": self.to_id}
+
     def set_programed_send_date(self) -> None:
+        """
+        Transactional emails are due as soon as they are created, the rest
+        are sent at least five minutes later
+        """
         if not self.programed_send_date or self.programed_send_date <= now():
+            if self.priority == EmailPriority.TRANSACTIONAL:
+                self.programed_send_date = now()
+                return
             five_minutes_ahead: datetime = now() + timedelta(minutes=5)
             self.programed_send_date = five_minutes_ahead
 
@@ -94,6 +163,23 @@ class Email(
             "unsubscribe_text": get_translation_in(
                 self.language, settings.UNSUBSCRIBE_TEXT
             ),
+            "unsubscribe_link": UNSUBSCRIBE_LINK_PLACEHOLDER,
+        }
+
+    def get_unsubscribe_url(self) -> str:
+        return get_unsubscribe_url(self.to_id, self.affair)
+
+    def get_template_variables(self) -> dict:
+        return {
+            "first_name": self.to.first_name or "",
+            "unsubscribe_link": self.get_unsubscribe_url(),
+            **self.variables,
+        }
+
+    def get_headers(self) -> dict:
+        return {
+            "List-Unsubscribe": f"<{self.get_unsubscribe_url()}>",
+            "List-Unsubscribe-Post": "List-Unsubscribe=One-Click",
         }
 
     def save(self, *args: tuple, **kwargs: dict) -> None:
@@ -101,7 +187,62 @@ class Email(
             self.to = EmailTestUserFaker()
         if not self.was_sent:
             self.set_programed_send_date()
-        super(Email, self).save(*args, **kwargs)
+        with transaction.atomic():
+            super(Email, self).save(*args, **kwargs)
+            self.update_outbox()
+
+    def update_outbox(self) -> None:
+        """
+        Keeps the email in the outbox while it is pending, once it is sent
+        only the email row remains as history
+        """
+        if self.was_sent:
+            self.remove_from_outbox()
+        else:
+            Outbox.objects.update_or_create(
+                email=self,
+                defaults={
+                    "programed_send_date": self.programed_send_date,
+                    "priority": self.priority,
+                },
+            )
+
+    def remove_from_outbox(self) -> None:
+        Outbox.objects.filter(email=self).delete()
+
+
+class Outbox(ExportModelOperationsMixin("outbox"), Model):
+    """
+    Outbox model, holds one row per email pending to be delivered so the queue
+    queries only scan the pending emails no matter the size of the history.
+    Emails that failed too many times stay as dead letters until reviewed
+    """
+
+    email: ForeignObject = OneToOneField(
+        Email, on_delete=CASCADE, primary_key=True, related_name="outbox"
+    )
+    programed_send_date: Field = DateTimeField()
+    priority: Field = PositiveSmallIntegerField(
+        choices=EmailPriority.choices, default=EmailPriority.BULK
+    )
+    lease_owner: Field = CharField(max_length=100, null=True, editable=False)
+    lease_expires_at: Field = DateTimeField(null=True, editable=False)
+    attempts: Field = PositiveSmallIntegerField(default=0, editable=False)
+    last_error: Field = TextField(null=True, editable=False)
+    is_dead_letter: Field = BooleanField(default=False)
+
+    objects: Manager = OutboxManager()
+
+    class Meta:
+        indexes: list = [
+            Index(
+                fields=["priority", "programed_send_date"],
+                name="outbox_lane_due_date_index",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.email_id} | {self.programed_send_date}"
 
 
 class Suggestion(
@@ -128,6 +269,11 @@ class Suggestion(
         default=CommentType.SUGGESTION.value,
     )
     was_read: Field = BooleanField(default=False)
+    lease_expires_at: Field = DateTimeField(null=True, editable=False)
+    attempts: Field = PositiveSmallIntegerField(default=0, editable=False)
+    last_error: Field = TextField(null=True, editable=False)
+
+    objects: Manager = SuggestionManager()
 
     def __str__(self) -> str:
         return f"{self.id} | {self.subject}"
@@ -159,6 +305,7 @@ class Notification(Model, AbstractEmailFunctionClass):
         default=PreferredLanguageChoices.ENGLISH,
         null=True,
     )
+    last_processed_user_id: Field = BigIntegerField(default=0, editable=False)
 
     def __str__(self) -> str:
         return f"{self.id} | {self.subject}"
@@ -166,24 +313,144 @@ class Notification(Model, AbstractEmailFunctionClass):
     def send(self) -> None:
         if not self.is_test:
             self.create_email_for_every_user()
-        self.create_email(to=EmailTestUserFaker())
+        with transaction.atomic():
+            if self.mark_as_sent():
+                self.create_email(to=EmailTestUserFaker())
+
+    def mark_as_sent(self) -> bool:
+        """
+        Marks the notification as sent, returns False when another run already
+        did it so the closing steps of the fan-out are only done once
+        """
         self.sent_date: datetime = timezone.now()
         self.was_sent: bool = True
-        self.save()
+        updated_rows: int = Notification.objects.filter(
+            pk=self.pk, was_sent=False
+        ).update(sent_date=self.sent_date, was_sent=self.was_sent)
+        return updated_rows == 1
 
     def create_email_for_every_user(self) -> None:
-        for user in User.objects.all():
-            if user.preferred_language == self.language:
-                self.create_email(user)
+        """
+        Fans out the notification walking the recipients by id, so every
+        chunk of users is created with a constant number of queries and
+        without loading the whole users table in memory
+        """
+        blocks_ids: list = list(self.blocks.values_list("id", flat=True))
+        while self.create_next_emails_chunk(blocks_ids):
+            continue
+
+    def create_next_emails_chunk(self, blocks_ids: list) -> bool:
+        """
+        Creates the emails of the users after the stored checkpoint and moves
+        it forward in the same transaction, so a killed or concurrent run
+        resumes where the last committed chunk ended. Returns False when there
+        are no users left
+        """
+        with transaction.atomic():
+            last_processed_user_id: int = (
+                Notification.objects.select_for_update()
+                .values_list("last_processed_user_id", flat=True)
+                .get(pk=self.pk)
+            )
+            users_ids: list = self.get_recipients_ids_after(
+                last_processed_user_id
+            )
+            if not users_ids:
+                return False
+            self.create_emails_in_bulk(users_ids, blocks_ids)
+            self.last_processed_user_id: int = users_ids[-1]
+            Notification.objects.filter(pk=self.pk).update(
+                last_processed_user_id=self.last_processed_user_id
+            )
+        return True
+
+    def get_recipients(self) -> QuerySet:
+        """
+        Users in the language of the notification that did not blacklist its
+        affair, they are excluded with an anti join so their emails are never
+        created
+        """
+        blacklisted: QuerySet = BlackList.objects.with_affair(
+            self.affair
+        ).filter(user_id=OuterRef("pk"))
+        return User.objects.filter(
+            ~Exists(blacklisted), preferred_language=self.language
+        )
+
+    def get_recipients_ids_after(self, user_id: int) -> list:
+        chunk_size: int = settings.NOTIFICATION_EMAILS_CHUNK_SIZE
+        recipients: QuerySet = self.get_recipients().filter(id__gt=user_id)
+        recipients_ids: QuerySet = recipients.order_by("id").values_list(
+            "id", flat=True
+        )
+        return list(recipients_ids[:chunk_size])
+
+    def get_email_attributes(self) -> dict:
+        return {
+            "subject": self.subject,
+            "header": self.header,
+            "affair": self.affair,
+            "language": self.language,
+            "programed_send_date": self.programed_send_date,
+            "sent_date": None,
+        }
+
+    def create_emails_in_bulk(self, users_ids: list, blocks_ids: list) -> None:
+        """
+        Bulk version of create_email, as bulk_create skips Email.save the
+        programed send date is set here. The users that already have the email
+        are skipped, their outbox and blocks are left untouched
+        """
+        emails: list = []
+        for user_id in users_ids:
+            email: Email = Email(
+                **self.get_email_attributes(), to_id=user_id, notification=self
+            )
+            email.set_programed_send_date()
+            emails.append(email)
+        if not emails:
+            return
+        with transaction.atomic():
+            notification_emails: QuerySet = Email.objects.filter(
+                notification=self, to_id__in=users_ids
+            )
+            existing_emails_ids: set = set(
+                notification_emails.values_list("id", flat=True)
+            )
+            Email.objects.bulk_create(emails, ignore_conflicts=True)
+            created_emails: list = list(
+                notification_emails.exclude(
+                    id__in=existing_emails_ids
+                ).values_list("id", "programed_send_date")
+            )
+            if not created_emails:
+                return
+            created_emails_ids: list = [id for id, _ in created_emails]
+            Outbox.objects.bulk_create(
+                [
+                    Outbox(email_id=id, programed_send_date=programed_send_date)
+                    for id, programed_send_date in created_emails
+                ]
+            )
+            email_block: Model = Email.blocks.through
+            email_block.objects.bulk_create(
+                [
+                    email_block(email_id=email_id, block_id=block_id)
+                    for email_id in created_emails_ids
+                    for block_id in blocks_ids
+                ]
+            )
+            emails_bulk_created.send(
+                sender=Email,
+                emails_ids=created_emails_ids,
+                programed_send_date=emails[-1].programed_send_date,
+            )
 
     def create_email(self, to: User) -> None:
         factories.email.EmailFactory(
+            **self.get_email_attributes(),
             to=to,
-            subject=self.subject,
-            header=self.header,
             is_test=self.is_test,
-            programed_send_date=self.programed_send_date,
-            sent_date=None,
             blocks=self.blocks.all(),
         )
 
@@ -206,3 +473,35 @@ class BlackList(ExportModelOperationsMixin("blacklist"), Model):
         size=5,
         max_length=(5 * 15 + 4),  # Base fields per sizer plus commas
     )
+    affairs_mask: Field = PositiveIntegerField(default=0, editable=False)
+    objects: Manager = BlackListManager()
+
+    class Meta:
+        indexes: list = [
+            Index(
+                fields=["user", "affairs_mask"],
+                name="blacklist_user_affairs_index",
+            )
+        ]
+
+    def save(self, *args: tuple, **kwargs: dict) -> None:
+        self.affairs_mask = self.get_affairs_mask(self.affairs)
+        super(BlackList, self).save(*args, **kwargs)
+
+    @staticmethod
+    def get_affair_bit(affair: str) -> int:
+        """
+        Every affair has its own bit, given by its position in the choices,
+        so new affairs must be added at the end of the choices
+        """
+        return 1 << EmailAffair.values.index(affair)
+
+    @classmethod
+    def get_affairs_mask(cls, affairs: list or str) -> int:
+        if isinstance(affairs, str):
+            affairs = affairs.split(",")
+        mask: int = 0
+        for affair in affairs or []:
+            if affair in EmailAffair.values:
+                mask |= cls.get_affair_bit(affair)
+        return mask
@@ -1,9 +1,9 @@
 from django.http import HttpRequest
 from django.views import View
-from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import BasePermission
 
 from Emails.models import BlackList
+from Project.utils.identity_map import get_instance
 from Users.models import User
 
 
@@ -14,7 +14,7 @@ class IsBlacklistOwner(BasePermission):
         user: User = request.user
         kwargs: dict = request.parser_context["kwargs"]
         blacklist_id: int = kwargs.get("pk", None)
-        blacklist: BlackList = get_object_or_404(BlackList, id=blacklist_id)
+        blacklist: BlackList = get_instance(request, BlackList, pk=blacklist_id)
         return user.has_permission(blacklist)
 
 
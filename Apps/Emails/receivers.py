@@ -0,0 +1,103 @@
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from kombu.exceptions import OperationalError
+
+from Emails.choices import EmailPriority
+from Emails.models import BlackList
+from Emails.models import Email
+from Emails.models import Notification
+from Emails.models import Suggestion
+from Emails.signals import emails_bulk_created
+from Emails.suppression import suppression_cache
+from Emails.tasks import create_notification_emails
+from Emails.tasks import get_sending_queue
+from Emails.tasks import send_scheduled_emails
+from Emails.tasks import send_suggestion
+from Project.utils.log import log_scheduling_error
+
+
+def schedule_emails(
+    emails_ids: list, programed_send_date: datetime, priority: int
+) -> None:
+    """
+    Enqueues the delivery of the emails for their programed send date in the
+    queue of their lane, if the broker is not available the sweeper will send
+    them
+    """
+    try:
+        send_scheduled_emails.apply_async(
+            args=[emails_ids],
+            eta=programed_send_date,
+            queue=get_sending_queue(priority),
+        )
+    except OperationalError as error:
+        log_scheduling_error("Emails", emails_ids, error)
+
+
+def schedule_notification(notification: Notification) -> None:
+    try:
+        create_notification_emails.delay(notification.id)
+    except OperationalError as error:
+        log_scheduling_error("Notification", [notification.id], error)
+
+
+def schedule_suggestion(suggestion: Suggestion) -> None:
+    try:
+        send_suggestion.delay(suggestion.id)
+    except OperationalError as error:
+        log_scheduling_error("Suggestion", [suggestion.id], error)
+
+
+@receiver(post_save, sender=Email)
+def email_created(
+    sender: Model, instance: Email, created: bool, **kwargs: dict
+) -> None:
+    if created and not instance.was_sent:
+        transaction.on_commit(
+            lambda: schedule_emails(
+                [instance.id], instance.programed_send_date, instance.priority
+            )
+        )
+
+
+@receiver(post_save, sender=Notification)
+def notification_created(
+    sender: Model, instance: Notification, created: bool, **kwargs: dict
+) -> None:
+    if created and not instance.was_sent:
+        transaction.on_commit(lambda: schedule_notification(instance))
+
+
+@receiver(post_save, sender=Suggestion)
+def suggestion_created(
+    sender: Model, instance: Suggestion, created: bool, **kwargs: dict
+) -> None:
+    if created and not instance.was_sent:
+        transaction.on_commit(lambda: schedule_suggestion(instance))
+
+
+@receiver(emails_bulk_created)
+def emails_created_in_bulk(
+    sender: Model,
+    emails_ids: list,
+    programed_send_date: datetime,
+    **kwargs: dict,
+) -> None:
+    transaction.on_commit(
+        lambda: schedule_emails(
+            emails_ids, programed_send_date, EmailPriority.BULK
+        )
+    )
+
+
+@receiver(post_save, sender=BlackList)
+@receiver(post_delete, sender=BlackList)
+def blacklist_changed(
+    sender: Model, instance: BlackList, **kwargs: dict
+) -> None:
+    transaction.on_commit(lambda: suppression_cache.refresh(instance.user_id))
@@ -0,0 +1,47 @@
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db.models import QuerySet
+
+from Emails.abstracts import AbstractEmailFunctionClass
+from Emails.envelope import MessageEnvelope
+
+
+class EmailBatchRenderer:
+    """
+    Builds the messages of a queryset of emails or suggestions with a
+    constant number of queries, the recipients are joined and the blocks of
+    every email are prefetched at once instead of being read per message.
+    Emails that render the same template share the envelope of the variant
+    """
+
+    def __init__(self, connection: BaseEmailBackend = None) -> None:
+        self.connection: BaseEmailBackend = connection
+        self.envelopes: dict = {}
+
+    @staticmethod
+    def prepare(emails: QuerySet) -> QuerySet:
+        recipient_field: str = emails.model.recipient_field
+        if recipient_field:
+            emails = emails.select_related(recipient_field)
+        return emails.prefetch_related("blocks")
+
+    def render(self, emails: QuerySet) -> list:
+        return [
+            self.get_message(email, self.connection)
+            for email in self.prepare(emails)
+        ]
+
+    def get_message(
+        self,
+        email: AbstractEmailFunctionClass,
+        connection: BaseEmailBackend = None,
+    ) -> EmailMultiAlternatives:
+        return email.get_email_object(connection, self.get_envelope(email))
+
+    def get_envelope(
+        self, email: AbstractEmailFunctionClass
+    ) -> MessageEnvelope:
+        key: tuple = email.get_template_variant()
+        if key not in self.envelopes:
+            self.envelopes[key] = MessageEnvelope(email.get_template())
+        return self.envelopes[key]
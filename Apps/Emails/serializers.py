@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.db.models import Field
 from django.db.models import Model
 from rest_framework.generics import get_object_or_404
@@ -71,6 +72,7 @@ class AbstractEmailSerializer(ModelSerializer):
     is_test: Field = BooleanField()
     programed_send_date: Field = DateTimeField()
 
+    @transaction.atomic
     def update(self, instance: Model, validated_data: dict) -> Model:
         blocks_data: list = validated_data.pop("blocks")
         blocks: list = self.create_blocks(blocks_data)
@@ -78,7 +80,12 @@ class AbstractEmailSerializer(ModelSerializer):
         instance.blocks.set(blocks)
         return instance
 
+    @transaction.atomic
     def create(self, validated_data: dict) -> Model:
+        """
+        The instance and its blocks are committed together, so the delivery
+        scheduled on commit always finds the blocks
+        """
         blocks_data: list = validated_data.pop("blocks")
         blocks: list = self.create_blocks(blocks_data)
         instance: Model = super().create(validated_data)
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+
+# Sent after a chunk of emails is inserted with bulk_create, which does not
+# send post_save. Arguments: emails_ids and programed_send_date
+emails_bulk_created: Signal = Signal()
@@ -0,0 +1,74 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import BaseCache
+from django.core.cache import caches
+from django.db.models import Model
+
+
+class SuppressionCache:
+    """
+    Affairs mask of every recipient kept in a shared cache (like Redis), so
+    the sender knows who opted out without querying the blacklist. Users
+    missing in the cache are loaded with a single query, users without
+    blacklist are cached too with an empty mask
+    """
+
+    KEY_PREFIX: str = "email-suppression"
+
+    @property
+    def cache(self) -> BaseCache:
+        alias: str = settings.EMAIL_SUPPRESSION_CACHE_ALIAS
+        return caches[alias] if alias else None
+
+    @classmethod
+    def get_key(cls, user_id: int) -> str:
+        return f"{cls.KEY_PREFIX}:{user_id}"
+
+    def get_masks(self, users_ids: list) -> dict:
+        keys: dict = {self.get_key(user_id): user_id for user_id in users_ids}
+        cached: dict = self.cache.get_many(list(keys)) if self.cache else {}
+        masks: dict = {keys[key]: mask for key, mask in cached.items()}
+        missing_ids: list = [
+            user_id for user_id in keys.values() if user_id not in masks
+        ]
+        if missing_ids:
+            loaded_masks: dict = self.load_masks(missing_ids)
+            masks.update(loaded_masks)
+            self.add_masks(loaded_masks)
+        return masks
+
+    def load_masks(self, users_ids: list) -> dict:
+        blacklist: Model = apps.get_model("Emails", "BlackList")
+        masks: dict = dict.fromkeys(users_ids, 0)
+        entries: list = blacklist.objects.filter(
+            user_id__in=users_ids
+        ).values_list("user_id", "affairs_mask")
+        for user_id, affairs_mask in entries:
+            masks[user_id] |= affairs_mask
+        return masks
+
+    def set_masks(self, masks: dict) -> None:
+        if self.cache is None:
+            return
+        self.cache.set_many(
+            {self.get_key(user_id): mask for user_id, mask in masks.items()},
+            settings.EMAIL_SUPPRESSION_CACHE_TIMEOUT,
+        )
+
+    def add_masks(self, masks: dict) -> None:
+        """
+        Caches the masks loaded on a miss only when the key is still missing,
+        so a mask read before a blacklist change does not overwrite the one
+        set by the refresh of that change
+        """
+        if self.cache is None:
+            return
+        timeout: int = settings.EMAIL_SUPPRESSION_CACHE_TIMEOUT
+        for user_id, mask in masks.items():
+            self.cache.add(self.get_key(user_id), mask, timeout)
+
+    def refresh(self, user_id: int) -> None:
+        self.set_masks(self.load_masks([user_id]))
+
+
+suppression_cache: SuppressionCache = SuppressionCache()
@@ -1,13 +1,22 @@
+from uuid import uuid4
+
+from celery import chord
 from celery import shared_task
+from django.conf import settings
 from django.db.models import QuerySet
-from django.utils.timezone import now
 
+from Emails.choices import EmailPriority
+from Emails.dispatcher import EmailDispatcher
 from Emails.models import Email
 from Emails.models import Notification
+from Emails.models import Outbox
+from Emails.models import Suggestion
 from Project.settings.celery_worker.worker import app
+from Project.utils.log import log_dispatch_results
+from Project.utils.log import log_information
 
 
-SECONDS: float = 10.0
+SECONDS: float = 5 * 60.0  # Sweeper for anything the scheduling missed
 
 
 @shared_task
@@ -17,13 +26,111 @@ def create_notifications_emails() -> None:
         notification.send()
 
 
+@shared_task
+def create_notification_emails(notification_id: int) -> None:
+    notification: Notification = Notification.objects.filter(
+        id=notification_id, was_sent=False
+    ).first()
+    if notification:
+        notification.send()
+
+
+@shared_task
+def send_scheduled_emails(emails_ids: list) -> dict:
+    """
+    Sends the given emails if they are due and nobody else is sending them,
+    the ones that are not due yet are left to the sweeper
+    """
+    owner: str = uuid4().hex
+    claimed_ids: list = Outbox.objects.claim(owner, len(emails_ids), emails_ids)
+    emails: QuerySet = Email.objects.get_claimed(owner, claimed_ids)
+    return EmailDispatcher(owner=owner).dispatch(emails)
+
+
+@shared_task
+def send_suggestion(suggestion_id: int) -> None:
+    send_claimed_suggestions(Suggestion.objects.claim([suggestion_id]))
+
+
+@shared_task
+def send_suggestions() -> None:
+    send_claimed_suggestions(Suggestion.objects.claim())
+
+
+def send_claimed_suggestions(suggestions_ids: list) -> None:
+    """
+    A suggestion that fails is retried later with a backoff, the remaining
+    suggestions are still sent
+    """
+    suggestions: QuerySet = Suggestion.objects.filter(id__in=suggestions_ids)
+    for suggestion in suggestions:
+        try:
+            suggestion.send()
+        except Exception as error:
+            log_information(f"Not sent: {error!r}", suggestion)
+            Suggestion.objects.reschedule(suggestion, error)
+
+
+def get_sending_queue(priority: int) -> str:
+    if priority == EmailPriority.TRANSACTIONAL:
+        return settings.EMAIL_TRANSACTIONAL_QUEUE
+    return settings.EMAIL_SENDING_QUEUE
+
+
 @shared_task
 def send_emails() -> None:
-    emails: QuerySet = Email.objects.filter(
-        was_sent=False, programed_send_date__lte=now()
-    )
-    for email in emails:
-        email.send()
+    """
+    Claims the due emails in chunks, lane by lane starting with the
+    transactional ones, and sends every chunk in parallel in the queue of its
+    lane. The results of all the chunks are aggregated at the end. Every
+    sweep claims up to the max chunks, the rest of a big backlog is left to
+    the next sweeps instead of being leased while it waits in the queue
+    """
+    owner: str = uuid4().hex
+    chunk_size: int = settings.EMAIL_DISPATCH_CHUNK_SIZE
+    max_chunks: int = settings.EMAIL_DISPATCH_MAX_CHUNKS
+    chunks: list = []
+    for priority in EmailPriority.values:
+        queue: str = get_sending_queue(priority)
+        while len(chunks) < max_chunks:
+            emails_ids: list = Outbox.objects.claim(
+                owner, chunk_size, priority=priority
+            )
+            if not emails_ids:
+                break
+            chunks.append(
+                send_emails_chunk.s(owner, emails_ids).set(queue=queue)
+            )
+    if chunks:
+        chord(chunks)(aggregate_dispatch_results.s())
+
+
+@shared_task
+def send_emails_chunk(owner: str, emails_ids: list) -> dict:
+    """
+    Sends a chunk claimed by send_emails, the lease is renewed first as the
+    chunk may have waited in the queue, the emails whose lease was taken by
+    another owner meanwhile are skipped
+    """
+    renewed_ids: list = Outbox.objects.renew(owner, emails_ids)
+    emails: QuerySet = Email.objects.get_claimed(owner, renewed_ids)
+    return EmailDispatcher(owner=owner).dispatch(emails)
+
+
+@shared_task
+def aggregate_dispatch_results(chunks_results: list) -> dict:
+    results: dict = {
+        "sent": 0,
+        "failed": 0,
+        "blacklisted": 0,
+        "dead_letter": 0,
+        "deferred": 0,
+    }
+    for chunk_results in chunks_results:
+        for result, emails_ids in chunk_results.items():
+            results[result] += len(emails_ids)
+    log_dispatch_results(results)
+    return results
 
 
 def each_seconds() -> float:
@@ -39,4 +146,8 @@ app.conf.beat_schedule = {
         "task": "Emails.tasks.send_emails",
         "schedule": each_seconds(),
     },
+    "send_suggestions": {
+        "task": "Emails.tasks.send_suggestions",
+        "schedule": each_seconds(),
+    },
 }
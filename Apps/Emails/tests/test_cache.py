@@ -0,0 +1,91 @@
+from copy import deepcopy
+
+from django.core.cache import caches
+from django.test import override_settings
+from mock import MagicMock
+from mock import patch
+from pytest import mark
+
+from Emails.cache import EmailTemplateCache
+from Emails.cache import email_template_cache
+from Emails.compiler import get_email_template
+from Emails.factories.email import EmailFactory
+from Emails.fakers.block import BlockFaker
+from Emails.models import Block
+from Emails.models import Email
+from Users.fakers.user import UserFaker
+
+
+class TestEmailTemplateCache:
+    def test_get_or_render_renders_only_once(self) -> None:
+        cache: EmailTemplateCache = EmailTemplateCache(max_size=2)
+        render: MagicMock = MagicMock(return_value="template")
+        assert cache.get_or_render("key", render) == "template"
+        assert cache.get_or_render("key", render) == "template"
+        assert render.call_count == 1
+
+    def test_least_recently_used_template_is_evicted(self) -> None:
+        cache: EmailTemplateCache = EmailTemplateCache(max_size=2)
+        cache.set("first", "first template")
+        cache.set("second", "second template")
+        cache.get("first")
+        cache.set("third", "third template")
+        assert cache.get("first") == "first template"
+        assert cache.get("second") is None
+        assert cache.get("third") == "third template"
+
+    def test_shared_cache_is_used_when_alias_is_set(self) -> None:
+        cache: EmailTemplateCache = EmailTemplateCache(
+            max_size=2, alias="default"
+        )
+        cache.set("key", "template")
+        assert caches["default"].get("key") == "template"
+        cache.clear()
+        assert cache.get("key") == "template"
+
+    def test_key_changes_with_template_version(self) -> None:
+        key: str = EmailTemplateCache.get_key("Email", "header")
+        with override_settings(EMAIL_TEMPLATE_VERSION="2"):
+            new_key: str = EmailTemplateCache.get_key("Email", "header")
+        assert key != new_key
+
+
+@mark.django_db
+class TestEmailTemplateRendering:
+    def test_emails_with_same_blocks_render_once(self) -> None:
+        block: Block = BlockFaker()
+        first_email: Email = EmailFactory(to=UserFaker(), blocks=[block])
+        second_email: Email = EmailFactory(to=UserFaker(), blocks=[block])
+        email_template_cache.clear()
+        with patch.object(
+            Email, "render_template", return_value="template"
+        ) as mocked_render:
+            first_email.get_template()
+            second_email.get_template()
+        assert mocked_render.call_count == 1
+
+    def test_edited_block_is_rendered_again(self) -> None:
+        block: Block = BlockFaker()
+        email: Email = EmailFactory(to=UserFaker(), blocks=[block])
+        email_template_cache.clear()
+        template: str = email.get_template()
+        block.content = "new content"
+        block.save()
+        assert email.get_template() != template
+
+    def test_compiled_template_is_used_when_available(
+        self, settings, tmp_path
+    ) -> None:
+        email: Email = EmailFactory(
+            to=UserFaker(), header="Header", blocks=[BlockFaker()]
+        )
+        email_template_cache.clear()
+        key: str = email.get_template_cache_key()
+        compiled_template: str = "{# version: 0123456789ab #}{{header}}"
+        (tmp_path / "email.compiled.html").write_text(compiled_template)
+        templates: list = deepcopy(settings.TEMPLATES)
+        templates[0]["DIRS"] = [str(tmp_path)]
+        settings.TEMPLATES = templates
+        assert get_email_template().template.name == "email.compiled.html"
+        assert email.get_template_cache_key() != key
+        assert email.get_template() == email.header
@@ -0,0 +1,20 @@
+from django.conf import LazySettings
+from pytest import mark
+
+from Emails.checks import check_compiled_email_template
+
+
+@mark.django_db
+class TestEmailChecks:
+    def test_compiled_email_template_exists(
+        self, settings: LazySettings
+    ) -> None:
+        settings.EMAIL_COMPILED_TEMPLATE = "email.html"
+        assert check_compiled_email_template(None) == []
+
+    def test_missing_compiled_email_template_is_an_error(
+        self, settings: LazySettings
+    ) -> None:
+        settings.EMAIL_COMPILED_TEMPLATE = "missing.compiled.html"
+        errors: list = check_compiled_email_template(None)
+        assert [error.id for error in errors] == ["Emails.E001"]
@@ -0,0 +1,32 @@
+from pytest import fixture
+
+from Emails.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    @fixture(autouse=True)
+    def circuit_breaker_settings(self, settings) -> None:
+        settings.EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS = "default"
+        settings.EMAIL_CIRCUIT_BREAKER_THRESHOLD = 2
+        CircuitBreaker("test").reset()
+
+    def test_circuit_opens_after_the_threshold(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker("test")
+        circuit_breaker.record_failure()
+        assert circuit_breaker.is_open() is False
+        circuit_breaker.record_failure()
+        assert circuit_breaker.is_open() is True
+
+    def test_success_resets_the_failures(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker("test")
+        circuit_breaker.record_failure()
+        circuit_breaker.record_success()
+        circuit_breaker.record_failure()
+        assert circuit_breaker.is_open() is False
+
+    def test_circuit_is_never_opened_without_cache(self, settings) -> None:
+        settings.EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS = None
+        circuit_breaker: CircuitBreaker = CircuitBreaker("test")
+        for _ in range(3):
+            circuit_breaker.record_failure()
+        assert circuit_breaker.is_open() is False
@@ -0,0 +1,244 @@
+from smtplib import SMTPException
+from smtplib import SMTPRecipientsRefused
+from smtplib import SMTPServerDisconnected
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.utils.timezone import now
+from mock import MagicMock
+from mock import patch
+from pytest import mark
+
+from Emails.circuit_breaker import circuit_breaker
+from Emails.dispatcher import EmailDispatcher
+from Emails.factories.email import EmailFactory
+from Emails.fakers.blacklist import BlackListFaker
+from Emails.models import Email
+from Emails.models import Outbox
+from Users.fakers.user import UserFaker
+from Users.models import User
+
+
+@mark.django_db
+class TestEmailDispatcher:
+    def test_dispatch_sends_every_email(self) -> None:
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(3)]
+        results: dict = EmailDispatcher(batch_size=2).dispatch(emails)
+        assert len(mail.outbox) == 3
+        assert results["sent"] == [email.id for email in emails]
+        assert results["failed"] == []
+        assert results["blacklisted"] == []
+        assert Email.objects.filter(was_sent=True).count() == 3
+
+    @patch("Emails.dispatcher.get_connection", wraps=get_connection)
+    def test_dispatch_opens_one_connection_per_batch(
+        self, mocked_get_connection: MagicMock
+    ) -> None:
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(5)]
+        EmailDispatcher(batch_size=2).dispatch(emails)
+        assert mocked_get_connection.call_count == 3
+        assert len(mail.outbox) == 5
+
+    def test_dispatch_records_blacklisted_emails(self) -> None:
+        email: Email = EmailFactory(to=UserFaker(), affair="GENERAL")
+        BlackListFaker(user=email.to, affairs="GENERAL")
+        results: dict = EmailDispatcher().dispatch([email])
+        assert results["blacklisted"] == [email.id]
+        assert len(mail.outbox) == 0
+        email.refresh_from_db()
+        assert email.was_sent is False
+        assert Outbox.objects.filter(email=email).exists() is False
+
+    @patch(
+        "Emails.dispatcher.suppression_cache.get_masks",
+        side_effect=lambda users_ids: dict.fromkeys(users_ids, 0),
+    )
+    def test_dispatch_reads_the_suppression_masks_once_per_batch(
+        self, mocked_get_masks: MagicMock
+    ) -> None:
+        emails: list = [
+            EmailFactory(to=UserFaker(), affair=affair)
+            for affair in ["GENERAL", "GENERAL", "PROMOTION"]
+        ]
+        EmailDispatcher(batch_size=2).dispatch(emails)
+        assert mocked_get_masks.call_count == 2
+        assert len(mail.outbox) == 3
+
+    def test_dispatch_only_drops_emails_with_the_blacklisted_affair(
+        self,
+    ) -> None:
+        user: User = UserFaker()
+        BlackListFaker(user=user, affairs="PROMOTION")
+        general: Email = EmailFactory(to=user, affair="GENERAL")
+        promotion: Email = EmailFactory(to=user, affair="PROMOTION")
+        results: dict = EmailDispatcher().dispatch([general, promotion])
+        assert results["sent"] == [general.id]
+        assert results["blacklisted"] == [promotion.id]
+
+    def test_dispatch_records_failures_and_keeps_sending(self) -> None:
+        failed_email: Email = EmailFactory(to=UserFaker())
+        sent_email: Email = EmailFactory(to=UserFaker())
+        with patch(
+            "Emails.abstracts.EmailMultiAlternatives.send",
+            side_effect=[SMTPException("error"), 1],
+        ):
+            results: dict = EmailDispatcher().dispatch(
+                [failed_email, sent_email]
+            )
+        assert results["failed"] == [failed_email.id]
+        assert results["sent"] == [sent_email.id]
+        failed_email.refresh_from_db()
+        assert failed_email.was_sent is False
+
+    def test_dispatch_reschedules_the_failed_emails(self) -> None:
+        email: Email = EmailFactory(to=UserFaker())
+        Outbox.objects.update(programed_send_date=now())
+        Outbox.objects.claim("worker", 10)
+        with patch(
+            "Emails.abstracts.EmailMultiAlternatives.send",
+            side_effect=SMTPException("error"),
+        ):
+            results: dict = EmailDispatcher(owner="worker").dispatch([email])
+        outbox: Outbox = Outbox.objects.get(email=email)
+        assert results["failed"] == [email.id]
+        assert outbox.attempts == 1
+        assert outbox.last_error == repr(SMTPException("error"))
+        assert outbox.lease_owner is None
+        assert outbox.programed_send_date > now()
+
+    def test_dispatch_records_the_dead_letters(self, settings) -> None:
+        settings.EMAIL_MAX_ATTEMPTS = 1
+        email: Email = EmailFactory(to=UserFaker())
+        with patch(
+            "Emails.abstracts.EmailMultiAlternatives.send",
+            side_effect=SMTPException("error"),
+        ):
+            results: dict = EmailDispatcher().dispatch([email])
+        assert results["dead_letter"] == [email.id]
+        assert Outbox.objects.get(email=email).is_dead_letter is True
+
+    def test_dispatch_defers_the_emails_while_the_circuit_is_open(
+        self, settings
+    ) -> None:
+        settings.EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS = "default"
+        settings.EMAIL_CIRCUIT_BREAKER_THRESHOLD = 1
+        circuit_breaker.reset()
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(3)]
+        Outbox.objects.update(programed_send_date=now())
+        Outbox.objects.claim("worker", 10)
+        with patch(
+            "Emails.abstracts.EmailMultiAlternatives.send",
+            side_effect=SMTPServerDisconnected("error"),
+        ):
+            results: dict = EmailDispatcher(owner="worker").dispatch(emails)
+        circuit_breaker.reset()
+        assert results["failed"] == [emails[0].id]
+        assert results["deferred"] == [emails[1].id, emails[2].id]
+        assert Outbox.objects.filter(lease_owner="worker").count() == 0
+        assert Outbox.objects.get(email=emails[1]).attempts == 0
+
+    def test_recipient_errors_do_not_open_the_circuit(self, settings) -> None:
+        settings.EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS = "default"
+        settings.EMAIL_CIRCUIT_BREAKER_THRESHOLD = 1
+        circuit_breaker.reset()
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(2)]
+        with patch(
+            "Emails.abstracts.EmailMultiAlternatives.send",
+            side_effect=SMTPRecipientsRefused({}),
+        ):
+            results: dict = EmailDispatcher().dispatch(emails)
+        assert circuit_breaker.is_open() is False
+        assert results["failed"] == [email.id for email in emails]
+        assert results["deferred"] == []
+
+    def test_sent_emails_reset_the_failures_of_the_circuit(
+        self, settings
+    ) -> None:
+        settings.EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS = "default"
+        settings.EMAIL_CIRCUIT_BREAKER_THRESHOLD = 2
+        circuit_breaker.reset()
+        circuit_breaker.record_failure()
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(2)]
+        with patch(
+            "Emails.abstracts.EmailMultiAlternatives.send",
+            side_effect=[1, SMTPServerDisconnected("error")],
+        ):
+            EmailDispatcher().dispatch(emails)
+        is_open: bool = circuit_breaker.is_open()
+        circuit_breaker.reset()
+        assert is_open is False
+
+    def test_dispatch_skips_the_batches_leased_by_other_owner(self) -> None:
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(2)]
+        Outbox.objects.update(programed_send_date=now())
+        Outbox.objects.claim("worker", 10)
+
+        def take_the_lease_of_the_next_batch() -> int:
+            Outbox.objects.filter(email=emails[1]).update(
+                lease_owner="other worker"
+            )
+            return 1
+
+        with patch(
+            "Emails.abstracts.EmailMultiAlternatives.send",
+            side_effect=take_the_lease_of_the_next_batch,
+        ) as mocked_send:
+            results: dict = EmailDispatcher(
+                batch_size=1, owner="worker"
+            ).dispatch(emails)
+        assert mocked_send.call_count == 1
+        assert results["sent"] == [emails[0].id]
+        assert Outbox.objects.get(email=emails[1]).lease_owner == (
+            "other worker"
+        )
+
+    def test_dispatch_writes_the_sent_status_once_per_batch(self) -> None:
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(3)]
+        with patch.object(Email, "save") as mocked_save:
+            with patch(
+                "Emails.dispatcher.Email.objects.bulk_update",
+                wraps=Email.objects.bulk_update,
+            ) as mocked_bulk_update:
+                EmailDispatcher().dispatch(emails)
+        assert mocked_save.call_count == 0
+        assert mocked_bulk_update.call_count == 1
+        assert Email.objects.filter(was_sent=True).count() == 3
+        assert Email.objects.filter(sent_date__isnull=True).count() == 0
+        assert Outbox.objects.count() == 0
+
+    def test_dispatch_keeps_sending_when_closing_the_connection_fails(
+        self,
+    ) -> None:
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(2)]
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.close",
+            side_effect=SMTPServerDisconnected("error"),
+        ):
+            results: dict = EmailDispatcher(batch_size=1).dispatch(emails)
+        assert results["sent"] == [email.id for email in emails]
+        assert Email.objects.filter(was_sent=True).count() == 2
+        assert Outbox.objects.count() == 0
+
+    def test_dispatch_defers_the_batch_when_the_backend_is_down(
+        self, settings
+    ) -> None:
+        settings.EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS = "default"
+        settings.EMAIL_CIRCUIT_BREAKER_THRESHOLD = 1
+        circuit_breaker.reset()
+        emails: list = [EmailFactory(to=UserFaker()) for _ in range(2)]
+        Outbox.objects.update(programed_send_date=now())
+        Outbox.objects.claim("worker", 10)
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.open",
+            side_effect=ConnectionRefusedError("error"),
+        ):
+            results: dict = EmailDispatcher(
+                batch_size=1, owner="worker"
+            ).dispatch(emails)
+        is_open: bool = circuit_breaker.is_open()
+        circuit_breaker.reset()
+        assert is_open is True
+        assert results["deferred"] == [email.id for email in emails]
+        assert len(mail.outbox) == 0
+        assert Outbox.objects.filter(lease_owner="worker").count() == 0
+        assert Outbox.objects.filter(attempts=0).count() == 2
@@ -1,4 +1,8 @@
+import json
+
+from django.http import StreamingHttpResponse
 from django.urls import reverse
+from mock import patch
 from pytest import fixture
 from pytest import mark
 from rest_framework.response import Response
@@ -6,6 +10,7 @@ from rest_framework.test import APIClient
 
 from Emails.fakers.email import EmailTestFaker
 from Emails.models import Email
+from Emails.views import EmailViewSet
 from Users.fakers.user import AdminFaker
 from Users.fakers.user import UserFaker
 from Users.fakers.user import VerifiedUserFaker
@@ -55,6 +60,74 @@ class TestListEmailsView:
         response: Response = client.get(url)
         assert response.status_code == 200
 
+    def test_list_emails_reports_if_the_count_is_exact(
+        self, client: APIClient
+    ) -> None:
+        admin: User = AdminFaker()
+        EmailTestFaker()
+        client.force_authenticate(user=admin)
+        response: Response = client.get(self.url())
+        assert response.data["count"] == 1
+        assert response.data["count_is_exact"] is True
+
+    def test_list_emails_streaming(self, client: APIClient) -> None:
+        admin: User = AdminFaker()
+        for _ in range(3):
+            EmailTestFaker()
+        client.force_authenticate(user=admin)
+        response: Response = client.get(self.url(), {"page_size": 2})
+        streaming_response: StreamingHttpResponse = client.get(
+            self.url(), {"page_size": 2, "stream": "true"}
+        )
+        assert streaming_response.status_code == 200
+        assert streaming_response.streaming is True
+        content: bytes = b"".join(streaming_response.streaming_content)
+        assert json.loads(content)["results"] == json.loads(
+            json.dumps(response.data["results"])
+        )
+
+    def test_list_emails_streaming_in_chunks(
+        self, client: APIClient, django_assert_num_queries
+    ) -> None:
+        admin: User = AdminFaker()
+        for _ in range(5):
+            EmailTestFaker()
+        client.force_authenticate(user=admin)
+        with patch.object(EmailViewSet, "stream_chunk_size", 2):
+            response: StreamingHttpResponse = client.get(
+                self.url(), {"page_size": 5, "stream": "true"}
+            )
+            with django_assert_num_queries(4):
+                content: bytes = b"".join(response.streaming_content)
+        assert len(json.loads(content)["results"]) == 5
+
+    def test_list_emails_streaming_rejects_the_cursor_pagination(
+        self, client: APIClient
+    ) -> None:
+        admin: User = AdminFaker()
+        client.force_authenticate(user=admin)
+        response: Response = client.get(
+            self.url(), {"pagination": "cursor", "stream": "true"}
+        )
+        assert response.status_code == 400
+
+    def test_list_emails_with_cursor_pagination(
+        self, client: APIClient
+    ) -> None:
+        admin: User = AdminFaker()
+        emails_ids: list = [EmailTestFaker().id for _ in range(3)]
+        client.force_authenticate(user=admin)
+        response: Response = client.get(
+            self.url(), {"pagination": "cursor", "page_size": 2}
+        )
+        assert response.status_code == 200
+        assert "count" not in response.data
+        first_page: list = [email["id"] for email in response.data["results"]]
+        response = client.get(response.data["next"])
+        second_page: list = [email["id"] for email in response.data["results"]]
+        assert first_page + second_page == sorted(emails_ids, reverse=True)
+        assert response.data["next"] is None
+
 
 @mark.django_db
 class TestRetrieveEmailsView:
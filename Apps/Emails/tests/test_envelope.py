@@ -0,0 +1,112 @@
+from email.message import Message
+
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.message import SafeMIMEText
+from mock import MagicMock
+from mock import patch
+from pytest import mark
+
+from Emails.envelope import EnvelopeEmailMessage
+from Emails.envelope import MessageEnvelope
+from Emails.envelope import replace_variables
+from Emails.factories.email import EmailFactory
+from Emails.fakers.block import BlockFaker
+from Emails.models import Block
+from Emails.models import Email
+from Emails.renderer import EmailBatchRenderer
+from Users.fakers.user import UserFaker
+
+
+def get_html_part(message: EmailMultiAlternatives) -> bytes:
+    return message.message().get_payload()[0].get_payload(decode=True)
+
+
+class TestMessageEnvelope:
+    def test_part_is_encoded_once_and_stamped_per_message(self) -> None:
+        envelope: MessageEnvelope = MessageEnvelope("<p>Hi {name}</p>")
+        with patch(
+            "Emails.envelope.SafeMIMEText", wraps=SafeMIMEText
+        ) as mocked_mime_text:
+            first_part: Message = envelope.get_part("utf-8", {"name": "Ana"})
+            second_part: Message = envelope.get_part("utf-8", {"name": "<Bob>"})
+        assert mocked_mime_text.call_count == 1
+        assert first_part.get_payload(decode=True) == b"<p>Hi Ana</p>"
+        assert second_part.get_payload(decode=True) == b"<p>Hi &lt;Bob&gt;</p>"
+
+    def test_non_ascii_values_are_sent_as_8bit(self) -> None:
+        envelope: MessageEnvelope = MessageEnvelope("<p>Hi {name}</p>")
+        part: Message = envelope.get_part("utf-8", {"name": "Iñigo"})
+        assert part["Content-Transfer-Encoding"] == "8bit"
+        assert part.get_payload(decode=True).decode() == "<p>Hi Iñigo</p>"
+
+    def test_non_ascii_templates_can_be_serialized(self) -> None:
+        message: EnvelopeEmailMessage = EnvelopeEmailMessage(
+            to=["user@email.com"],
+            envelope=MessageEnvelope("<p>Síguenos {name}</p>"),
+            variables={"name": "Iñigo"},
+        )
+        message.attach_alternative("<p>Síguenos {name}</p>", "text/html")
+        content: bytes = message.message().as_bytes(linesep="\r\n")
+        assert "<p>Síguenos Iñigo</p>".encode() in content
+
+    def test_quoted_printable_parts_are_not_stamped(self) -> None:
+        envelope: MessageEnvelope = MessageEnvelope("a" * 1000 + "{name}")
+        assert envelope.get_part("utf-8", {"name": "Ana"}) is None
+
+    def test_message_falls_back_to_encode_its_own_part(self) -> None:
+        html: str = "a" * 1000 + "{name}"
+        message: EnvelopeEmailMessage = EnvelopeEmailMessage(
+            to=["user@email.com"],
+            envelope=MessageEnvelope(html),
+            variables={"name": "Ana"},
+        )
+        message.attach_alternative(html, "text/html")
+        assert get_html_part(message).decode() == "a" * 1000 + "Ana"
+
+
+@mark.django_db
+class TestEmailEnvelope:
+    @patch("Emails.envelope.SafeMIMEText", wraps=SafeMIMEText)
+    def test_emails_of_the_same_variant_share_the_envelope(
+        self, mocked_mime_text: MagicMock
+    ) -> None:
+        block: Block = BlockFaker()
+        for first_name in ["Ana", "Bob"]:
+            EmailFactory(
+                to=UserFaker(first_name=first_name),
+                header="Header",
+                blocks=[block],
+            )
+        messages: list = EmailBatchRenderer().render(Email.objects.all())
+        htmls: list = [get_html_part(message) for message in messages]
+        assert mocked_mime_text.call_count == 1
+        for message, html, email in zip(messages, htmls, Email.objects.all()):
+            assert html.decode() == replace_variables(
+                message.alternatives[0][0], message.variables
+            )
+            assert email.get_unsubscribe_url() in html.decode()
+        assert htmls[0] != htmls[1]
+
+    def test_emails_with_non_ascii_blocks_can_be_serialized(self) -> None:
+        block: Block = BlockFaker(content="Café para todos")
+        for _ in range(2):
+            EmailFactory(to=UserFaker(), header="Header", blocks=[block])
+        messages: list = EmailBatchRenderer().render(Email.objects.all())
+        for message, email in zip(messages, Email.objects.all()):
+            content: bytes = message.message().as_bytes(linesep="\r\n")
+            assert "Café para todos".encode() in content
+            assert email.get_unsubscribe_url().encode() in content
+
+    def test_emails_with_an_envelope_are_not_rendered_per_message(
+        self,
+    ) -> None:
+        block: Block = BlockFaker()
+        for _ in range(2):
+            EmailFactory(to=UserFaker(), header="Header", blocks=[block])
+        with patch.object(Email, "get_html") as mocked_get_html:
+            with patch.object(
+                Email, "get_template_cache_key", wraps=lambda: "key"
+            ) as mocked_cache_key:
+                EmailBatchRenderer().render(Email.objects.all())
+        assert mocked_get_html.call_count == 0
+        assert mocked_cache_key.call_count == 1
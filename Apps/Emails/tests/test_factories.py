@@ -1,10 +1,12 @@
 from django.conf import settings
+from django.db import IntegrityError
 from django.db import transaction
 from django_rest_passwordreset.models import ResetPasswordToken
 from pytest import mark
 from pytest import raises
 from rest_framework.exceptions import ParseError
 
+from Emails.choices import EmailPriority
 from Emails.factories.block import BlockFactory
 from Emails.factories.block import ResetPasswordBlockFactory
 from Emails.factories.block import SuggestionBlockFactory
@@ -38,6 +40,7 @@ class TestEmailFactories:
         assert Email.objects.count() == 1
         assert Block.objects.count() == 1
         assert email.is_test is False
+        assert email.priority == EmailPriority.BULK
         assert email.to is not None
         assert email.programed_send_date is not None
         assert email.blocks is not None
@@ -71,16 +74,19 @@ class TestEmailFactories:
         assert email.subject == settings.RESET_PASSWORD_EMAIL_SUBJECT
         assert email.header == settings.RESET_PASSWORD_EMAIL_HEADER
         assert email.is_test is False
+        assert email.priority == EmailPriority.TRANSACTIONAL
         assert email.to == user
         assert email.programed_send_date is not None
         assert email.blocks is not None
         block: Block = email.blocks.first()
         assert str(settings.EMAIL_GREETING) in block.title
-        assert user.first_name in block.title
+        assert "{first_name}" in block.title
         assert block.content == settings.RESET_PASSWORD_EMAIL_CONTENT
         assert block.show_link
         assert block.link_text == settings.RESET_PASSWORD_EMAIL_LINK_TEXT
-        assert str(settings.RESET_PASSWORD_URL) in block.link
+        assert block.link == "{link}"
+        assert str(settings.RESET_PASSWORD_URL) in email.variables["link"]
+        assert instance.key in email.variables["link"]
 
     def test_verify_email_factory_raises_exception(self) -> None:
         assert Email.objects.count() == 0
@@ -101,18 +107,35 @@ class TestEmailFactories:
         assert email.subject == settings.VERIFY_EMAIL_SUBJECT
         assert email.header == settings.VERIFY_EMAIL_HEADER + settings.APP_NAME
         assert email.is_test is False
+        assert email.priority == EmailPriority.TRANSACTIONAL
         assert email.to == user
         assert email.programed_send_date is not None
         assert email.blocks is not None
         block: Block = email.blocks.first()
         assert str(settings.EMAIL_GREETING) in block.title
-        assert user.first_name in block.title
+        assert "{first_name}" in block.title
         assert block.content == settings.VERIFY_EMAIL_CONTENT
         assert block.show_link
         assert block.link_text == settings.VERIFY_EMAIL_LINK_TEXT
-        assert str(settings.VERIFY_EMAIL_URL) in block.link
-        assert generate_user_verification_token(user) in block.link
-        assert f"{user.id}" in block.link
+        assert block.link == "{link}"
+        link: str = email.variables["link"]
+        assert str(settings.VERIFY_EMAIL_URL) in link
+        assert generate_user_verification_token(user) in link
+        assert f"{user.id}" in link
+
+    def test_verify_emails_of_the_same_language_share_the_block(self) -> None:
+        first_email: Email = VerifyEmailFactory(
+            instance=UserFaker(preferred_language="EN")
+        )
+        second_email: Email = VerifyEmailFactory(
+            instance=UserFaker(preferred_language="EN")
+        )
+        spanish_email: Email = VerifyEmailFactory(
+            instance=UserFaker(preferred_language="ES")
+        )
+        assert Block.objects.count() == 2
+        assert first_email.blocks.get() == second_email.blocks.get()
+        assert spanish_email.blocks.get().language == "ES"
 
 
 @mark.django_db
@@ -127,45 +150,54 @@ class TestBlockFactories:
         assert block.link_text is not None
         assert block.link is not None
 
-    def test_reset_password_block_factory_raises_exception_without_params(
+    def test_reset_password_block_factory_reuses_the_block(self) -> None:
+        block: Block = ResetPasswordBlockFactory(language="EN")
+        assert ResetPasswordBlockFactory(language="EN") == block
+        assert ResetPasswordBlockFactory(language="ES") != block
+        assert Block.objects.count() == 2
+
+    def test_reset_password_block_factory_updates_the_changed_content(
         self,
     ) -> None:
-        assert Email.objects.count() == 0
-        assert Block.objects.count() == 0
-        with raises(AttributeError):
-            ResetPasswordBlockFactory()
-        assert Email.objects.count() == 0
-        assert Block.objects.count() == 0
+        block: Block = ResetPasswordBlockFactory(language="EN")
+        Block.objects.filter(id=block.id).update(content="Old content")
+        assert ResetPasswordBlockFactory(language="EN") == block
+        block.refresh_from_db()
+        assert block.content == settings.RESET_PASSWORD_EMAIL_CONTENT
+        assert Block.objects.count() == 1
+
+    def test_template_blocks_are_unique_by_name_and_language(self) -> None:
+        ResetPasswordBlockFactory(language="EN")
+        with raises(IntegrityError), transaction.atomic():
+            BlockFactory(name="reset_password", language="EN")
+        BlockFactory()
+        BlockFactory()
+        assert Block.objects.count() == 3
 
     def test_reset_password_block_factory(self) -> None:
         assert Block.objects.count() == 0
-        user: User = UserFaker()
-        instance: ResetPasswordToken = ResetPasswordToken.objects.create(
-            user=user
-        )
-        block: Block = ResetPasswordBlockFactory(instance=instance)
+        block: Block = ResetPasswordBlockFactory()
         assert Block.objects.count() == 1
+        assert block.name == "reset_password"
+        assert block.language == "EN"
         assert block.title is not None
         assert block.content is not None
         assert block.show_link is not None
         assert block.link_text is not None
         assert block.link is not None
 
-    def test_verify_email_block_factory_raises_exception_without_params(
-        self,
-    ) -> None:
-        assert Email.objects.count() == 0
-        assert Block.objects.count() == 0
-        with raises(AttributeError):
-            VerifyEmailBlockFactory()
-        assert Email.objects.count() == 0
-        assert Block.objects.count() == 0
+    def test_verify_email_block_factory_reuses_the_block(self) -> None:
+        block: Block = VerifyEmailBlockFactory(language="EN")
+        assert VerifyEmailBlockFactory(language="EN") == block
+        assert ResetPasswordBlockFactory(language="EN") != block
+        assert Block.objects.count() == 2
 
     def test_verify_email_block_factory(self) -> None:
         assert Block.objects.count() == 0
-        user: User = UserFaker()
-        block: Block = VerifyEmailBlockFactory(user=user)
+        block: Block = VerifyEmailBlockFactory(language="ES")
         assert Block.objects.count() == 1
+        assert block.name == "verify_email"
+        assert block.language == "ES"
         assert block.title is not None
         assert block.content is not None
         assert block.show_link is not None
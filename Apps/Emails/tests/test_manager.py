@@ -0,0 +1,169 @@
+from django.utils.timezone import now
+from django.utils.timezone import timedelta
+from pytest import mark
+
+from Emails.choices import EmailPriority
+from Emails.factories.email import EmailFactory
+from Emails.fakers.blacklist import BlackListFaker
+from Emails.models import BlackList
+from Emails.models import Email
+from Emails.models import Outbox
+from Users.fakers.user import UserFaker
+
+
+def create_due_emails(quantity: int) -> list:
+    emails: list = [EmailFactory(to=UserFaker()) for _ in range(quantity)]
+    Outbox.objects.update(programed_send_date=now() - timedelta(minutes=1))
+    return [email.id for email in emails]
+
+
+@mark.django_db
+class TestEmailManager:
+    def test_get_due_only_returns_pending_emails_in_time(self) -> None:
+        due_emails_ids: list = create_due_emails(2)
+        EmailFactory(to=UserFaker())
+        Email.objects.get(id=due_emails_ids[0]).save_as_sent()
+        due_emails: list = list(Email.objects.get_due())
+        assert [email.id for email in due_emails] == due_emails_ids[1:]
+
+    def test_get_claimed_only_returns_emails_of_the_owner(self) -> None:
+        emails_ids: list = create_due_emails(2)
+        Outbox.objects.claim("worker", 1)
+        claimed: list = list(Email.objects.get_claimed("worker", emails_ids))
+        assert [email.id for email in claimed] == emails_ids[:1]
+
+    def test_get_claimed_skips_emails_with_expired_lease(self) -> None:
+        emails_ids: list = create_due_emails(1)
+        Outbox.objects.claim("worker", 1)
+        Outbox.objects.update(lease_expires_at=now() - timedelta(seconds=1))
+        assert Email.objects.get_claimed("worker", emails_ids).exists() is False
+
+
+@mark.django_db
+class TestOutboxManager:
+    def test_claim_leases_emails_to_the_owner(self) -> None:
+        emails_ids: list = create_due_emails(3)
+        claimed_ids: list = Outbox.objects.claim("worker", 2)
+        assert claimed_ids == emails_ids[:2]
+        for outbox in Outbox.objects.filter(email_id__in=claimed_ids):
+            assert outbox.lease_owner == "worker"
+            assert outbox.lease_expires_at > now()
+
+    def test_claim_only_the_given_emails(self) -> None:
+        emails_ids: list = create_due_emails(3)
+        claimed_ids: list = Outbox.objects.claim("worker", 3, emails_ids[1:])
+        assert claimed_ids == emails_ids[1:]
+
+    def test_claim_skips_emails_leased_by_other_owner(self) -> None:
+        emails_ids: list = create_due_emails(2)
+        first_claim: list = Outbox.objects.claim("first worker", 10)
+        second_claim: list = Outbox.objects.claim("second worker", 10)
+        assert first_claim == emails_ids
+        assert second_claim == []
+
+    def test_claim_takes_emails_with_expired_lease(self) -> None:
+        emails_ids: list = create_due_emails(1)
+        Outbox.objects.claim("first worker", 10)
+        Outbox.objects.update(lease_expires_at=now() - timedelta(seconds=1))
+        assert Outbox.objects.claim("second worker", 10) == emails_ids
+        outbox: Outbox = Outbox.objects.get(email_id=emails_ids[0])
+        assert outbox.lease_owner == "second worker"
+
+    def test_renew_extends_the_lease_of_the_owner(self) -> None:
+        emails_ids: list = create_due_emails(2)
+        Outbox.objects.claim("worker", 1)
+        Outbox.objects.update(lease_expires_at=now() - timedelta(seconds=1))
+        assert Outbox.objects.renew("worker", emails_ids) == emails_ids[:1]
+        outbox: Outbox = Outbox.objects.get(email_id=emails_ids[0])
+        assert outbox.lease_expires_at > now()
+
+    def test_renew_skips_emails_taken_by_other_owner(self) -> None:
+        emails_ids: list = create_due_emails(1)
+        Outbox.objects.claim("first worker", 10)
+        Outbox.objects.update(lease_expires_at=now() - timedelta(seconds=1))
+        Outbox.objects.claim("second worker", 10)
+        assert Outbox.objects.renew("first worker", emails_ids) == []
+
+    def test_release_frees_the_claimed_emails(self) -> None:
+        emails_ids: list = create_due_emails(1)
+        Outbox.objects.claim("first worker", 10)
+        Outbox.objects.release("first worker", emails_ids)
+        assert Outbox.objects.claim("second worker", 10) == emails_ids
+
+    def test_claim_transactional_emails_first(self) -> None:
+        emails_ids: list = create_due_emails(2)
+        Outbox.objects.filter(email_id=emails_ids[1]).update(
+            priority=EmailPriority.TRANSACTIONAL
+        )
+        assert Outbox.objects.claim("worker", 1) == emails_ids[1:]
+
+    def test_claim_only_the_given_priority(self) -> None:
+        emails_ids: list = create_due_emails(2)
+        Outbox.objects.filter(email_id=emails_ids[0]).update(
+            priority=EmailPriority.TRANSACTIONAL
+        )
+        claimed_ids: list = Outbox.objects.claim(
+            "worker", 10, priority=EmailPriority.BULK
+        )
+        assert claimed_ids == emails_ids[1:]
+
+
+@mark.django_db
+class TestBlackListManager:
+    def test_with_affair_matches_the_affair_exactly(self) -> None:
+        entry: BlackList = BlackListFaker(affairs=["PROMOTION", "INVOICE"])
+        BlackListFaker(affairs=["GENERAL"])
+        promotion: list = list(BlackList.objects.with_affair("PROMOTION"))
+        assert promotion == [entry]
+        assert BlackList.objects.with_affair("SETTINGS").exists() is False
+
+    def test_filter_blacklisted_returns_the_blacklisted_users_ids(
+        self,
+    ) -> None:
+        users: list = [UserFaker() for _ in range(3)]
+        BlackListFaker(user=users[0], affairs="PROMOTION")
+        BlackListFaker(user=users[1], affairs="GENERAL")
+        users_ids: list = [user.id for user in users]
+        blacklisted: set = BlackList.objects.filter_blacklisted(
+            users_ids, "PROMOTION"
+        )
+        assert blacklisted == {users[0].id}
+
+    def test_reschedule_backs_off_and_releases_the_failed_emails(
+        self, settings
+    ) -> None:
+        settings.EMAIL_RETRY_DELAY_SECONDS = 60
+        emails_ids: list = create_due_emails(1)
+        Outbox.objects.claim("worker", 10)
+        dead_letters: list = Outbox.objects.reschedule(
+            {emails_ids[0]: "error"}, "worker"
+        )
+        outbox: Outbox = Outbox.objects.get(email_id=emails_ids[0])
+        assert dead_letters == []
+        assert outbox.attempts == 1
+        assert outbox.last_error == "error"
+        assert outbox.lease_owner is None
+        assert outbox.programed_send_date > now() + timedelta(seconds=50)
+        Outbox.objects.reschedule({emails_ids[0]: "error"})
+        outbox.refresh_from_db()
+        assert outbox.attempts == 2
+        assert outbox.programed_send_date > now() + timedelta(seconds=110)
+
+    def test_reschedule_moves_emails_to_the_dead_letters(
+        self, settings
+    ) -> None:
+        settings.EMAIL_MAX_ATTEMPTS = 2
+        emails_ids: list = create_due_emails(1)
+        Outbox.objects.filter(email_id=emails_ids[0]).update(attempts=1)
+        dead_letters: list = Outbox.objects.reschedule({emails_ids[0]: "error"})
+        assert dead_letters == emails_ids
+        Outbox.objects.update(programed_send_date=now() - timedelta(minutes=1))
+        assert Outbox.objects.claim("worker", 10) == []
+        assert list(Email.objects.get_due()) == []
+
+    def test_retry_delay_is_capped(self, settings) -> None:
+        settings.EMAIL_RETRY_DELAY_SECONDS = 60
+        settings.EMAIL_RETRY_MAX_DELAY_SECONDS = 200
+        assert Outbox.objects.get_retry_delay(1) == 60
+        assert Outbox.objects.get_retry_delay(2) == 120
+        assert Outbox.objects.get_retry_delay(3) == 200
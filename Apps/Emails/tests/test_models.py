@@ -2,10 +2,16 @@ from django.conf import settings
 from django.core import mail
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
+from django.test import override_settings
+from django.utils.timezone import now
+from django.utils.timezone import timedelta
+from mock import patch
 from pytest import mark
 from pytest import raises
 
 from Emails.abstracts import AbstractEmailFunctionClass
+from Emails.choices import EmailAffair
+from Emails.choices import EmailPriority
 from Emails.factories.email import EmailFactory
 from Emails.factories.notification import NotificationFactory
 from Emails.factories.suggestion import SuggestionEmailFactory
@@ -16,6 +22,7 @@ from Emails.models import BlackList
 from Emails.models import Block
 from Emails.models import Email
 from Emails.models import Notification
+from Emails.models import Outbox
 from Emails.models import Suggestion
 from Users.fakers.user import EmailTestUserFaker
 from Users.fakers.user import UserFaker
@@ -91,6 +98,20 @@ class TestEmailModel:
         email.save()
         assert email.programed_send_date is not None
 
+    def test_saving_a_transactional_email_without_date(self) -> None:
+        email: Email = EmailFactory.build(
+            to=UserFaker(), priority=EmailPriority.TRANSACTIONAL
+        )
+        email.programed_send_date = None
+        email.save()
+        assert email.programed_send_date <= now()
+
+    def test_saving_a_bulk_email_without_date(self) -> None:
+        email: Email = EmailFactory.build(to=UserFaker())
+        email.programed_send_date = None
+        email.save()
+        assert email.programed_send_date > now() + timedelta(minutes=4)
+
     def test_saving_an_email_with_emails(self) -> None:
         user: User = UserFaker()
         email: Email = EmailFactory.build(to=UserFaker())
@@ -158,6 +179,44 @@ class TestEmailModel:
         assert email.was_sent is False
         assert len(mail.outbox) == 0
 
+    def test_email_object_has_the_unsubscribe_link_of_the_recipient(
+        self,
+    ) -> None:
+        email: Email = EmailFactory(to=UserFaker(), affair="PROMOTION")
+        email_object: EmailMultiAlternatives = email.get_email_object()
+        html: str = email_object.alternatives[0][0]
+        unsubscribe_url: str = email.get_unsubscribe_url()
+        assert f'href="{unsubscribe_url}"' in html
+        assert "{unsubscribe_link}" in email.get_template()
+        assert email_object.extra_headers["List-Unsubscribe"] == (
+            f"<{unsubscribe_url}>"
+        )
+
+    def test_email_html_fills_the_placeholders_of_the_recipient(
+        self,
+    ) -> None:
+        block: Block = BlockFaker(
+            title="Hi {first_name}!", link="{link}", content="Hello"
+        )
+        user: User = UserFaker(first_name="<Ana>")
+        email: Email = EmailFactory(
+            to=user,
+            blocks=[block],
+            variables={"link": "https://appname.me/?a=1&b=2"},
+        )
+        html: str = email.get_html()
+        assert "Hi &lt;Ana&gt;!" in html
+        assert "https://appname.me/?a=1&amp;b=2" in html
+        assert "{first_name}" not in html
+        assert "{link}" not in html
+
+    def test_send_email_is_not_blocked_by_other_affairs(self) -> None:
+        email: Email = EmailFactory(to=UserFaker(), affair="GENERAL")
+        BlackListFaker(user=email.to, affairs="PROMOTION,SETTINGS")
+        email.send()
+        assert email.was_sent is True
+        assert len(mail.outbox) == 1
+
 
 @mark.django_db
 class TestSuggestionModel:
@@ -288,6 +347,129 @@ class TestNotificationModel:
             == notification.blocks.all()[0].id
         )
 
+    @override_settings(NOTIFICATION_EMAILS_CHUNK_SIZE=2)
+    def test_create_email_for_every_user_in_chunks(self) -> None:
+        users: list = [UserFaker(preferred_language="EN") for _ in range(5)]
+        UserFaker(preferred_language="ES")
+        blocks: list = [BlockFaker(), BlockFaker()]
+        notification: Notification = NotificationFactory(
+            language="EN", blocks=blocks
+        )
+        notification.create_email_for_every_user()
+        emails: list = list(Email.objects.order_by("to_id"))
+        assert [email.to for email in emails] == users
+        for email in emails:
+            assert email.notification == notification
+            assert email.language == notification.language
+            assert email.programed_send_date is not None
+            assert list(email.blocks.order_by("id")) == blocks
+
+    def test_get_recipients_ids_after(self) -> None:
+        first_user: User = UserFaker(preferred_language="EN")
+        second_user: User = UserFaker(preferred_language="EN")
+        notification: Notification = NotificationFactory(language="EN")
+        recipients_ids: list = notification.get_recipients_ids_after(
+            first_user.id
+        )
+        assert recipients_ids == [second_user.id]
+
+    def test_create_email_for_every_user_skips_blacklisted_users(
+        self,
+    ) -> None:
+        user: User = UserFaker(preferred_language="EN")
+        promotion_blacklisted: User = UserFaker(preferred_language="EN")
+        general_blacklisted: User = UserFaker(preferred_language="EN")
+        BlackListFaker(user=promotion_blacklisted, affairs="PROMOTION")
+        BlackListFaker(user=general_blacklisted, affairs="GENERAL")
+        notification: Notification = NotificationFactory(
+            language="EN", affair="GENERAL"
+        )
+        notification.create_email_for_every_user()
+        recipients: list = list(Email.objects.values_list("to", flat=True))
+        assert sorted(recipients) == [user.id, promotion_blacklisted.id]
+
+    def test_create_email_for_every_user_resumes_from_checkpoint(self) -> None:
+        first_user: User = UserFaker(preferred_language="EN")
+        second_user: User = UserFaker(preferred_language="EN")
+        notification: Notification = NotificationFactory(language="EN")
+        Notification.objects.filter(pk=notification.pk).update(
+            last_processed_user_id=first_user.id
+        )
+        notification.create_email_for_every_user()
+        assert Email.objects.count() == 1
+        assert Email.objects.first().to == second_user
+        notification.refresh_from_db()
+        assert notification.last_processed_user_id == second_user.id
+
+    def test_create_email_for_every_user_twice_does_not_duplicate(
+        self,
+    ) -> None:
+        UserFaker(preferred_language="EN")
+        UserFaker(preferred_language="EN")
+        notification: Notification = NotificationFactory(language="EN")
+        notification.create_email_for_every_user()
+        notification.create_email_for_every_user()
+        assert Email.objects.count() == 2
+
+    def test_mark_as_sent_only_once(self) -> None:
+        notification: Notification = NotificationFactory()
+        assert notification.mark_as_sent() is True
+        assert notification.mark_as_sent() is False
+        notification.refresh_from_db()
+        assert notification.was_sent is True
+        assert notification.sent_date is not None
+
+
+@mark.django_db
+class TestOutboxModel:
+    def test_created_email_is_added_to_the_outbox(self) -> None:
+        email: Email = EmailFactory(to=UserFaker())
+        outbox: Outbox = Outbox.objects.get(email=email)
+        assert outbox.programed_send_date == email.programed_send_date
+        assert outbox.lease_owner is None
+        assert str(outbox) == f"{email.id} | {email.programed_send_date}"
+
+    def test_sent_email_is_removed_from_the_outbox(self) -> None:
+        email: Email = EmailFactory(to=UserFaker())
+        email.send()
+        assert Outbox.objects.filter(email=email).exists() is False
+        assert Email.objects.filter(id=email.id, was_sent=True).exists()
+
+    def test_programed_send_date_changes_are_kept_in_the_outbox(self) -> None:
+        email: Email = EmailFactory(to=UserFaker())
+        email.programed_send_date = email.programed_send_date + timedelta(
+            days=1
+        )
+        email.save()
+        outbox: Outbox = Outbox.objects.get(email=email)
+        assert outbox.programed_send_date == email.programed_send_date
+
+    def test_emails_created_in_bulk_are_added_to_the_outbox(self) -> None:
+        UserFaker(preferred_language="EN")
+        UserFaker(preferred_language="EN")
+        notification: Notification = NotificationFactory(language="EN")
+        notification.create_email_for_every_user()
+        assert Outbox.objects.count() == 2
+        for email in Email.objects.all():
+            assert email.outbox.programed_send_date == email.programed_send_date
+
+    def test_emails_created_in_bulk_again_only_add_the_new_emails(
+        self,
+    ) -> None:
+        first_user: User = UserFaker()
+        second_user: User = UserFaker()
+        notification: Notification = NotificationFactory()
+        blocks_ids: list = [BlockFaker().id, BlockFaker().id]
+        notification.create_emails_in_bulk([first_user.id], blocks_ids)
+        with patch("Emails.models.emails_bulk_created.send") as mocked_send:
+            notification.create_emails_in_bulk(
+                [first_user.id, second_user.id], blocks_ids
+            )
+        second_email: Email = Email.objects.get(to=second_user)
+        assert mocked_send.call_args.kwargs["emails_ids"] == [second_email.id]
+        assert Outbox.objects.count() == 2
+        assert Email.blocks.through.objects.count() == 4
+
 
 @mark.django_db
 class TestBlackListModel:
@@ -297,3 +479,20 @@ class TestBlackListModel:
         attributes: list = [attribute for attribute in dict_keys]
         assert "user_id" in attributes
         assert "affairs" in attributes
+
+    def test_affairs_mask_is_set_on_save(self) -> None:
+        black_list_item: BlackList = BlackListFaker(
+            affairs=["NOTIFICATION", "GENERAL"]
+        )
+        assert black_list_item.affairs_mask == 0b101
+
+    def test_affairs_mask_from_comma_joined_affairs(self) -> None:
+        assert BlackList.get_affairs_mask("PROMOTION,INVOICE") == 0b10010
+        assert BlackList.get_affairs_mask("") == 0
+        assert BlackList.get_affairs_mask(["UNKNOWN"]) == 0
+
+    def test_affair_bits_are_unique(self) -> None:
+        bits: list = [
+            BlackList.get_affair_bit(affair) for affair in EmailAffair.values
+        ]
+        assert len(set(bits)) == len(EmailAffair.values)
@@ -0,0 +1,91 @@
+from kombu.exceptions import OperationalError
+from mock import MagicMock
+from mock import patch
+from pytest import mark
+
+from Emails.factories.email import EmailFactory
+from Emails.factories.email import VerifyEmailFactory
+from Emails.factories.notification import NotificationFactory
+from Emails.factories.suggestion import SuggestionEmailFactory
+from Emails.models import Email
+from Emails.models import Notification
+from Emails.models import Suggestion
+from Users.fakers.user import UserFaker
+
+
+@mark.django_db
+class TestEmailsScheduling:
+    @patch("Emails.receivers.send_scheduled_emails.apply_async")
+    def test_created_email_is_scheduled_on_commit(
+        self, mocked_apply_async: MagicMock, django_capture_on_commit_callbacks
+    ) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            email: Email = EmailFactory(to=UserFaker())
+        mocked_apply_async.assert_called_once_with(
+            args=[[email.id]],
+            eta=email.programed_send_date,
+            queue="emails",
+        )
+
+    @patch("Emails.receivers.send_scheduled_emails.apply_async")
+    def test_transactional_email_is_scheduled_in_its_queue(
+        self, mocked_apply_async: MagicMock, django_capture_on_commit_callbacks
+    ) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            email: Email = VerifyEmailFactory(instance=UserFaker())
+        mocked_apply_async.assert_called_once_with(
+            args=[[email.id]],
+            eta=email.programed_send_date,
+            queue="transactional_emails",
+        )
+
+    @patch("Emails.receivers.send_scheduled_emails.apply_async")
+    def test_email_is_not_scheduled_without_commit(
+        self, mocked_apply_async: MagicMock
+    ) -> None:
+        EmailFactory(to=UserFaker())
+        mocked_apply_async.assert_not_called()
+
+    @patch("Emails.receivers.create_notification_emails.delay")
+    def test_created_notification_is_scheduled_on_commit(
+        self, mocked_delay: MagicMock, django_capture_on_commit_callbacks
+    ) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            notification: Notification = NotificationFactory()
+        mocked_delay.assert_called_once_with(notification.id)
+
+    @patch("Emails.receivers.send_suggestion.delay")
+    def test_created_suggestion_is_scheduled_on_commit(
+        self, mocked_delay: MagicMock, django_capture_on_commit_callbacks
+    ) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            suggestion: Suggestion = SuggestionEmailFactory(
+                type="ERROR", content="Error found", user=UserFaker()
+            )
+        mocked_delay.assert_called_once_with(suggestion.id)
+
+    @patch("Emails.receivers.send_scheduled_emails.apply_async")
+    def test_emails_created_in_bulk_are_scheduled_on_commit(
+        self, mocked_apply_async: MagicMock, django_capture_on_commit_callbacks
+    ) -> None:
+        users: list = [UserFaker(preferred_language="EN") for _ in range(2)]
+        notification: Notification = NotificationFactory(language="EN")
+        with django_capture_on_commit_callbacks(execute=True):
+            notification.create_email_for_every_user()
+        emails_ids: list = list(
+            Email.objects.filter(to__in=users).values_list("id", flat=True)
+        )
+        mocked_apply_async.assert_called_once()
+        assert mocked_apply_async.call_args.kwargs["args"] == [emails_ids]
+
+    @patch(
+        "Emails.receivers.send_scheduled_emails.apply_async",
+        side_effect=OperationalError("Broker not available"),
+    )
+    def test_broker_errors_are_left_to_the_sweeper(
+        self, mocked_apply_async: MagicMock, django_capture_on_commit_callbacks
+    ) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            email: Email = EmailFactory(to=UserFaker())
+        mocked_apply_async.assert_called_once()
+        assert Email.objects.get(id=email.id).was_sent is False
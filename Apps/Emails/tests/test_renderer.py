@@ -0,0 +1,49 @@
+from django.core.mail import EmailMultiAlternatives
+from pytest import mark
+
+from Emails.cache import email_template_cache
+from Emails.factories.email import EmailFactory
+from Emails.factories.suggestion import SuggestionEmailFactory
+from Emails.fakers.block import BlockFaker
+from Emails.models import Email
+from Emails.models import Suggestion
+from Emails.renderer import EmailBatchRenderer
+from Users.fakers.user import UserFaker
+
+
+@mark.django_db
+class TestEmailBatchRenderer:
+    def test_render_returns_a_message_per_email(self) -> None:
+        emails: list = [
+            EmailFactory(to=UserFaker(), blocks=[BlockFaker()])
+            for _ in range(3)
+        ]
+        messages: list = EmailBatchRenderer().render(Email.objects.all())
+        assert len(messages) == 3
+        for email, message in zip(emails, messages):
+            assert isinstance(message, EmailMultiAlternatives)
+            assert message.to == [email.to.email]
+
+    @mark.parametrize("quantity", [1, 10])
+    def test_render_emails_with_constant_queries(
+        self, quantity: int, django_assert_num_queries
+    ) -> None:
+        for _ in range(quantity):
+            EmailFactory(to=UserFaker(), blocks=[BlockFaker(), BlockFaker()])
+        email_template_cache.clear()
+        with django_assert_num_queries(2):
+            EmailBatchRenderer().render(Email.objects.all())
+
+    def test_render_suggestions_with_constant_queries(
+        self, django_assert_num_queries
+    ) -> None:
+        for _ in range(3):
+            SuggestionEmailFactory(
+                type="SUGGESTION", content="content", user=UserFaker()
+            )
+        email_template_cache.clear()
+        with django_assert_num_queries(2):
+            messages: list = EmailBatchRenderer().render(
+                Suggestion.objects.all()
+            )
+        assert len(messages) == 3
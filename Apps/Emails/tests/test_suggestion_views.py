@@ -37,7 +37,7 @@ class TestSubmitSuggestionViews:
         assert len(mail.outbox) == 0
 
     def test_suggestion_creates_email_as_authenticated_user(
-        self, client: APIClient
+        self, client: APIClient, django_capture_on_commit_callbacks
     ) -> None:
         normal_user: User = VerifiedUserFaker()
         email_count: int = Suggestion.objects.all().count()
@@ -46,11 +46,13 @@ class TestSubmitSuggestionViews:
         type: str = CommentType.ERROR.value
         data: dict = {"type": type, "content": "Error found"}
         client.force_authenticate(user=normal_user)
-        response: Response = client.post(self.url(), data, format="json")
+        with django_capture_on_commit_callbacks(execute=True):
+            response: Response = client.post(self.url(), data, format="json")
         email_count: Suggestion = Suggestion.objects.all().count()
         expected_header: str = f"ERROR from user with id: {normal_user.id}"
         assert response.status_code == 201
-        assert True == response.data["was_sent"]
+        assert False == response.data["was_sent"]
+        assert True == Suggestion.objects.first().was_sent
         assert "ERROR" == response.data["subject"]
         assert expected_header == response.data["header"]
         block = Suggestion.objects.first().blocks.first()
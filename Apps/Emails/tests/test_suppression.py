@@ -0,0 +1,74 @@
+from django.conf import LazySettings
+from django.core.cache import caches
+from pytest import fixture
+from pytest import mark
+
+from Emails.fakers.blacklist import BlackListFaker
+from Emails.models import BlackList
+from Emails.suppression import SuppressionCache
+from Emails.suppression import suppression_cache
+from Users.fakers.user import UserFaker
+from Users.models import User
+
+
+@mark.django_db
+class TestSuppressionCache:
+    @fixture(autouse=True)
+    def shared_cache(self, settings: LazySettings) -> None:
+        settings.EMAIL_SUPPRESSION_CACHE_ALIAS = "default"
+        caches["default"].clear()
+
+    def test_get_masks_loads_the_blacklist_of_missing_users(self) -> None:
+        user: User = UserFaker()
+        other_user: User = UserFaker()
+        BlackListFaker(user=user, affairs="PROMOTION")
+        BlackListFaker(user=user, affairs="GENERAL")
+        masks: dict = suppression_cache.get_masks([user.id, other_user.id])
+        promotion_and_general: int = BlackList.get_affairs_mask(
+            ["PROMOTION", "GENERAL"]
+        )
+        assert masks == {user.id: promotion_and_general, other_user.id: 0}
+        key: str = SuppressionCache.get_key(user.id)
+        assert caches["default"].get(key) == promotion_and_general
+
+    def test_get_masks_reads_cached_users_without_queries(
+        self, django_assert_num_queries
+    ) -> None:
+        user: User = UserFaker()
+        suppression_cache.get_masks([user.id])
+        with django_assert_num_queries(0):
+            assert suppression_cache.get_masks([user.id]) == {user.id: 0}
+
+    def test_blacklist_changes_refresh_the_cache_on_commit(
+        self, django_capture_on_commit_callbacks
+    ) -> None:
+        user: User = UserFaker()
+        suppression_cache.get_masks([user.id])
+        with django_capture_on_commit_callbacks(execute=True):
+            blacklist: BlackList = BlackListFaker(user=user, affairs="GENERAL")
+        assert suppression_cache.get_masks([user.id]) == {
+            user.id: blacklist.affairs_mask
+        }
+        with django_capture_on_commit_callbacks(execute=True):
+            blacklist.delete()
+        assert suppression_cache.get_masks([user.id]) == {user.id: 0}
+
+    def test_masks_loaded_on_a_miss_do_not_overwrite_a_refresh(self) -> None:
+        user: User = UserFaker()
+        blacklist: BlackList = BlackListFaker(user=user, affairs="GENERAL")
+        suppression_cache.refresh(user.id)
+        suppression_cache.add_masks({user.id: 0})
+        assert suppression_cache.get_masks([user.id]) == {
+            user.id: blacklist.affairs_mask
+        }
+
+    def test_get_masks_reads_the_blacklist_without_cache(
+        self, settings: LazySettings
+    ) -> None:
+        settings.EMAIL_SUPPRESSION_CACHE_ALIAS = None
+        user: User = UserFaker()
+        BlackListFaker(user=user, affairs="GENERAL")
+        masks: dict = suppression_cache.get_masks([user.id])
+        assert masks == {user.id: BlackList.get_affairs_mask("GENERAL")}
+        key: str = SuppressionCache.get_key(user.id)
+        assert caches["default"].get(key) is None
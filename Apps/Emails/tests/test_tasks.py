@@ -0,0 +1,226 @@
+from smtplib import SMTPException
+
+from django.core import mail
+from django.test import override_settings
+from django.utils.timezone import now
+from django.utils.timezone import timedelta
+from mock import MagicMock
+from mock import patch
+from pytest import mark
+
+from Emails.choices import EmailPriority
+from Emails.factories.email import EmailFactory
+from Emails.factories.notification import NotificationFactory
+from Emails.factories.suggestion import SuggestionEmailFactory
+from Emails.models import Email
+from Emails.models import Notification
+from Emails.models import Outbox
+from Emails.models import Suggestion
+from Emails.tasks import aggregate_dispatch_results
+from Emails.tasks import create_notification_emails
+from Emails.tasks import get_sending_queue
+from Emails.tasks import send_emails
+from Emails.tasks import send_emails_chunk
+from Emails.tasks import send_scheduled_emails
+from Emails.tasks import send_suggestion
+from Emails.tasks import send_suggestions
+from Emails.tests.test_manager import create_due_emails
+from Users.fakers.user import UserFaker
+
+
+@mark.django_db
+class TestSendEmailsTask:
+    def test_send_emails_sends_every_due_email(self) -> None:
+        create_due_emails(3)
+        send_emails()
+        assert len(mail.outbox) == 3
+        for email in Email.objects.all():
+            assert email.was_sent is True
+        assert Outbox.objects.count() == 0
+
+    @override_settings(EMAIL_DISPATCH_CHUNK_SIZE=2)
+    @patch("Emails.tasks.aggregate_dispatch_results.run")
+    def test_send_emails_splits_due_emails_in_chunks(
+        self, mocked_aggregate: MagicMock
+    ) -> None:
+        create_due_emails(5)
+        send_emails()
+        chunks_results: list = mocked_aggregate.call_args.args[0]
+        assert [len(chunk["sent"]) for chunk in chunks_results] == [2, 2, 1]
+        assert len(mail.outbox) == 5
+
+    @patch("Emails.tasks.chord")
+    def test_send_emails_routes_every_lane_to_its_queue(
+        self, mocked_chord: MagicMock
+    ) -> None:
+        emails_ids: list = create_due_emails(2)
+        Outbox.objects.filter(email_id=emails_ids[1]).update(
+            priority=EmailPriority.TRANSACTIONAL
+        )
+        send_emails()
+        chunks: list = mocked_chord.call_args.args[0]
+        assert [chunk.args[1] for chunk in chunks] == [
+            emails_ids[1:],
+            emails_ids[:1],
+        ]
+        assert [chunk.options["queue"] for chunk in chunks] == [
+            "transactional_emails",
+            "emails",
+        ]
+
+    @override_settings(EMAIL_DISPATCH_CHUNK_SIZE=1, EMAIL_DISPATCH_MAX_CHUNKS=2)
+    @patch("Emails.tasks.chord")
+    def test_send_emails_claims_up_to_the_max_chunks(
+        self, mocked_chord: MagicMock
+    ) -> None:
+        emails_ids: list = create_due_emails(3)
+        send_emails()
+        chunks: list = mocked_chord.call_args.args[0]
+        assert [chunk.args[1] for chunk in chunks] == [
+            emails_ids[:1],
+            emails_ids[1:2],
+        ]
+        outbox: Outbox = Outbox.objects.get(email_id=emails_ids[2])
+        assert outbox.lease_owner is None
+
+    def test_send_emails_skips_emails_leased_by_other_worker(self) -> None:
+        create_due_emails(2)
+        Outbox.objects.claim("other worker", 1)
+        send_emails()
+        assert len(mail.outbox) == 1
+
+    def test_send_emails_chunk_only_sends_emails_of_the_owner(self) -> None:
+        emails_ids: list = create_due_emails(2)
+        Outbox.objects.claim("worker", 1)
+        results: dict = send_emails_chunk("worker", emails_ids)
+        assert results["sent"] == emails_ids[:1]
+        assert len(mail.outbox) == 1
+
+    def test_send_emails_chunk_skips_emails_claimed_again(self) -> None:
+        emails_ids: list = create_due_emails(1)
+        Outbox.objects.claim("worker", 1)
+        Outbox.objects.update(lease_expires_at=now() - timedelta(seconds=1))
+        Outbox.objects.claim("other worker", 1)
+        results: dict = send_emails_chunk("worker", emails_ids)
+        assert results["sent"] == []
+        assert len(mail.outbox) == 0
+
+    def test_aggregate_dispatch_results(self) -> None:
+        chunks_results: list = [
+            {"sent": [1, 2], "failed": [3], "blacklisted": []},
+            {"sent": [4], "failed": [], "blacklisted": [5, 6]},
+            {"dead_letter": [3], "deferred": [7]},
+        ]
+        results: dict = aggregate_dispatch_results(chunks_results)
+        assert results == {
+            "sent": 3,
+            "failed": 1,
+            "blacklisted": 2,
+            "dead_letter": 1,
+            "deferred": 1,
+        }
+
+
+@mark.django_db
+class TestSendScheduledEmailsTask:
+    def test_sends_the_given_due_emails(self) -> None:
+        emails_ids: list = create_due_emails(3)
+        results: dict = send_scheduled_emails(emails_ids[:2])
+        assert results["sent"] == emails_ids[:2]
+        assert len(mail.outbox) == 2
+
+    def test_does_not_send_emails_that_are_not_due(self) -> None:
+        email: Email = EmailFactory(to=UserFaker())
+        results: dict = send_scheduled_emails([email.id])
+        assert results["sent"] == []
+        assert len(mail.outbox) == 0
+
+
+@mark.django_db
+class TestCreateNotificationEmailsTask:
+    def test_sends_the_given_notification(self) -> None:
+        notification: Notification = NotificationFactory()
+        create_notification_emails(notification.id)
+        notification.refresh_from_db()
+        assert notification.was_sent is True
+
+    def test_ignores_sent_notifications(self) -> None:
+        notification: Notification = NotificationFactory()
+        notification.mark_as_sent()
+        create_notification_emails(notification.id)
+        assert Email.objects.count() == 0
+
+
+@mark.django_db
+class TestSendSuggestionTask:
+    def create_suggestion(self) -> Suggestion:
+        return SuggestionEmailFactory(
+            type="ERROR", content="Error found", user=UserFaker()
+        )
+
+    def test_sends_the_given_suggestion(self) -> None:
+        suggestion: Suggestion = self.create_suggestion()
+        send_suggestion(suggestion.id)
+        suggestion.refresh_from_db()
+        assert suggestion.was_sent is True
+        assert len(mail.outbox) == 1
+
+    def test_ignores_sent_suggestions(self) -> None:
+        suggestion: Suggestion = self.create_suggestion()
+        suggestion.save_as_sent()
+        send_suggestion(suggestion.id)
+        assert len(mail.outbox) == 0
+
+    def test_sweeper_sends_pending_suggestions(self) -> None:
+        self.create_suggestion()
+        self.create_suggestion().save_as_sent()
+        send_suggestions()
+        assert len(mail.outbox) == 1
+        assert Suggestion.objects.filter(was_sent=False).count() == 0
+
+    @patch("django.core.mail.message.EmailMessage.send")
+    def test_a_failed_suggestion_does_not_stop_the_others(
+        self, send: MagicMock
+    ) -> None:
+        send.side_effect = [SMTPException("Refused"), 1]
+        self.create_suggestion()
+        self.create_suggestion()
+        send_suggestions()
+        assert Suggestion.objects.filter(was_sent=True).count() == 1
+        failed: Suggestion = Suggestion.objects.get(was_sent=False)
+        assert failed.attempts == 1
+        assert "Refused" in failed.last_error
+        assert failed.lease_expires_at > now()
+
+    @patch("django.core.mail.message.EmailMessage.send")
+    def test_failed_suggestions_wait_for_the_backoff(
+        self, send: MagicMock
+    ) -> None:
+        send.side_effect = SMTPException("Refused")
+        self.create_suggestion()
+        send_suggestions()
+        send_suggestions()
+        assert send.call_count == 1
+
+    def test_skips_suggestions_claimed_by_another_run(self) -> None:
+        suggestion: Suggestion = self.create_suggestion()
+        assert Suggestion.objects.claim() == [suggestion.id]
+        send_suggestion(suggestion.id)
+        send_suggestions()
+        assert len(mail.outbox) == 0
+
+    @override_settings(EMAIL_MAX_ATTEMPTS=1)
+    def test_gives_up_after_the_max_attempts(self) -> None:
+        suggestion: Suggestion = self.create_suggestion()
+        Suggestion.objects.filter(id=suggestion.id).update(attempts=1)
+        send_suggestions()
+        assert len(mail.outbox) == 0
+
+
+class TestGetSendingQueue:
+    def test_transactional_emails_have_their_own_queue(self) -> None:
+        queue: str = get_sending_queue(EmailPriority.TRANSACTIONAL)
+        assert queue == "transactional_emails"
+
+    def test_bulk_emails_use_the_sending_queue(self) -> None:
+        assert get_sending_queue(EmailPriority.BULK) == "emails"
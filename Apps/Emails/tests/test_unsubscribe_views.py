@@ -0,0 +1,148 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from pytest import fixture
+from pytest import mark
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from Emails.factories.email import EmailFactory
+from Emails.fakers.blacklist import BlackListFaker
+from Emails.models import BlackList
+from Emails.models import Email
+from Emails.suppression import suppression_cache
+from Emails.unsubscribe import get_unsubscribe_token
+from Emails.unsubscribe import get_unsubscribe_url
+from Users.fakers.user import UserFaker
+from Users.models import User
+
+
+@fixture(scope="function")
+def client() -> APIClient:
+    return APIClient()
+
+
+@mark.django_db
+class TestUnsubscribeViews:
+    def url(self, token: str) -> str:
+        return reverse("emails:unsubscribe", args=[token])
+
+    def test_url(self) -> None:
+        assert self.url("token") == "/api/unsubscribe/token/"
+
+    def test_unsubscribe_url_of_an_email(self) -> None:
+        email: Email = EmailFactory(to=UserFaker(), affair="PROMOTION")
+        token: str = get_unsubscribe_token(email.to_id, email.affair)
+        assert email.get_unsubscribe_url() == get_unsubscribe_url(
+            email.to_id, email.affair
+        )
+        assert email.get_unsubscribe_url().endswith(self.url(token))
+
+    def test_get_checks_the_token_without_unsubscribing(
+        self, client: APIClient
+    ) -> None:
+        user: User = UserFaker()
+        token: str = get_unsubscribe_token(user.id, "PROMOTION")
+        response: Response = client.get(self.url(token))
+        assert response.status_code == 200
+        assert response.data == {"user_id": user.id, "affair": "PROMOTION"}
+        assert BlackList.objects.filter(user=user).exists() is False
+
+    def test_get_from_a_browser_asks_for_confirmation(
+        self, client: APIClient
+    ) -> None:
+        user: User = UserFaker()
+        token: str = get_unsubscribe_token(user.id, "PROMOTION")
+        response: Response = client.get(
+            self.url(token), HTTP_ACCEPT="text/html"
+        )
+        content: str = response.content.decode()
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/html")
+        assert '<form method="post">' in content
+        assert str(settings.UNSUBSCRIBE_BUTTON_TEXT) in content
+        assert BlackList.objects.filter(user=user).exists() is False
+
+    def test_post_from_the_confirmation_form_unsubscribes(
+        self, client: APIClient
+    ) -> None:
+        user: User = UserFaker()
+        token: str = get_unsubscribe_token(user.id, "PROMOTION")
+        response: Response = client.post(
+            self.url(token), HTTP_ACCEPT="text/html"
+        )
+        content: str = response.content.decode()
+        assert response.status_code == 200
+        assert str(settings.UNSUBSCRIBE_DONE_TEXT) in content
+        assert "<form" not in content
+        assert BlackList.objects.get(user=user).affairs == ["PROMOTION"]
+
+    def test_unsubscribe_creates_the_blacklist_as_unauthenticated(
+        self, client: APIClient
+    ) -> None:
+        user: User = UserFaker()
+        token: str = get_unsubscribe_token(user.id, "PROMOTION")
+        response: Response = client.post(self.url(token))
+        assert response.status_code == 200
+        assert response.data == {"user_id": user.id, "affair": "PROMOTION"}
+        blacklist: BlackList = BlackList.objects.get(user=user)
+        assert blacklist.affairs == ["PROMOTION"]
+
+    def test_unsubscribe_adds_the_affair_to_the_blacklist(
+        self, client: APIClient
+    ) -> None:
+        user: User = UserFaker()
+        BlackListFaker(user=user, affairs="GENERAL")
+        token: str = get_unsubscribe_token(user.id, "PROMOTION")
+        response: Response = client.post(self.url(token))
+        assert response.status_code == 200
+        blacklist: BlackList = BlackList.objects.get(user=user)
+        assert blacklist.affairs == ["GENERAL", "PROMOTION"]
+        assert blacklist.affairs_mask == BlackList.get_affairs_mask(
+            ["GENERAL", "PROMOTION"]
+        )
+
+    def test_unsubscribe_twice_keeps_one_affair(
+        self, client: APIClient
+    ) -> None:
+        user: User = UserFaker()
+        token: str = get_unsubscribe_token(user.id, "PROMOTION")
+        client.post(self.url(token))
+        client.post(self.url(token))
+        blacklist: BlackList = BlackList.objects.get(user=user)
+        assert blacklist.affairs == ["PROMOTION"]
+
+    def test_unsubscribe_fails_with_a_tampered_token(
+        self, client: APIClient
+    ) -> None:
+        user: User = UserFaker()
+        token: str = get_unsubscribe_token(user.id, "PROMOTION")
+        response: Response = client.post(self.url(f"{token}tampered"))
+        assert response.status_code == 400
+        assert BlackList.objects.count() == 0
+        response: Response = client.get(self.url(f"{token}tampered"))
+        assert response.status_code == 400
+
+    def test_unsubscribe_fails_with_an_unknown_user(
+        self, client: APIClient
+    ) -> None:
+        token: str = get_unsubscribe_token(0, "PROMOTION")
+        response: Response = client.post(self.url(token))
+        assert response.status_code == 404
+        response: Response = client.get(self.url(token))
+        assert response.status_code == 404
+
+    @override_settings(EMAIL_SUPPRESSION_CACHE_ALIAS="default")
+    def test_unsubscribe_updates_the_suppression_cache(
+        self, client: APIClient, django_capture_on_commit_callbacks
+    ) -> None:
+        caches["default"].clear()
+        user: User = UserFaker()
+        assert suppression_cache.get_masks([user.id]) == {user.id: 0}
+        token: str = get_unsubscribe_token(user.id, "PROMOTION")
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post(self.url(token))
+        assert suppression_cache.get_masks([user.id]) == {
+            user.id: BlackList.get_affairs_mask("PROMOTION")
+        }
@@ -1,4 +1,5 @@
 from django.core import mail
+from django.utils.timezone import now
 from django_rest_passwordreset.models import ResetPasswordToken
 from pytest import mark
 
@@ -10,18 +11,21 @@ from Users.models import User
 
 @mark.django_db
 class TestEmailUtils:
-    def test_send_email_verify_email(self):
+    def test_send_email_verify_email(self, django_capture_on_commit_callbacks):
         email_type: str = "verify_email"
         user: User = UserFaker()
         emails: int = Email.objects.all().count()
         assert emails == 0
         assert len(mail.outbox) == 0
-        send_email(email_type, user)
+        with django_capture_on_commit_callbacks(execute=True):
+            send_email(email_type, user)
         emails: int = Email.objects.all().count()
         assert emails == 1
         assert len(mail.outbox) == 1
 
-    def test_reset_password_verify_email(self):
+    def test_reset_password_verify_email(
+        self, django_capture_on_commit_callbacks
+    ):
         email_type: str = "reset_password"
         user: User = UserFaker()
         instance: ResetPasswordToken = ResetPasswordToken.objects.create(
@@ -30,7 +34,16 @@ class TestEmailUtils:
         emails: int = Email.objects.all().count()
         assert emails == 0
         assert len(mail.outbox) == 0
-        send_email(email_type, instance)
+        with django_capture_on_commit_callbacks(execute=True):
+            send_email(email_type, instance)
         emails: int = Email.objects.all().count()
         assert emails == 1
         assert len(mail.outbox) == 1
+
+    def test_send_email_is_not_delivered_before_commit(self):
+        user: User = UserFaker()
+        send_email("verify_email", user)
+        email: Email = Email.objects.get(to=user)
+        assert email.was_sent is False
+        assert email.outbox.programed_send_date <= now()
+        assert len(mail.outbox) == 0
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core import signing
+from django.urls import reverse
+
+
+UNSUBSCRIBE_SALT: str = "Emails.unsubscribe"
+UNSUBSCRIBE_LINK_PLACEHOLDER: str = "{unsubscribe_link}"
+
+
+def get_unsubscribe_token(user_id: int, affair: str) -> str:
+    data: dict = {"user_id": user_id, "affair": affair}
+    return signing.dumps(data, salt=UNSUBSCRIBE_SALT)
+
+
+def load_unsubscribe_token(token: str) -> dict:
+    """
+    Returns the user id and affair of the token, raises BadSignature when
+    the token was not signed by us
+    """
+    return signing.loads(token, salt=UNSUBSCRIBE_SALT)
+
+
+def get_unsubscribe_url(user_id: int, affair: str) -> str:
+    token: str = get_unsubscribe_token(user_id, affair)
+    return f"{settings.URL}{reverse('emails:unsubscribe', args=[token])}"
@@ -6,6 +6,7 @@ from Emails.views import BlacklistViewSet
 from Emails.views import EmailViewSet
 from Emails.views import NotificationViewSet
 from Emails.views import SuggestionViewSet
+from Emails.views import UnsubscribeView
 
 
 router: DefaultRouter = DefaultRouter()
@@ -16,4 +17,9 @@ router.register("notifications", NotificationViewSet, basename="notifications")
 
 urlpatterns: list = [
     path("", include(router.urls)),
+    path(
+        "unsubscribe/<str:token>/",
+        UnsubscribeView.as_view(),
+        name="unsubscribe",
+    ),
 ]
@@ -1,8 +1,8 @@
+from django.db import transaction
 from django_rest_passwordreset.models import ResetPasswordToken
 
 from Emails.factories.email import ResetEmailFactory
 from Emails.factories.email import VerifyEmailFactory
-from Emails.models import Email
 from Project.utils.log import log_email_action
 from Users.models import User
 
@@ -13,7 +13,11 @@ EMAILS: dict = {
 }
 
 
+@transaction.atomic
 def send_email(email_type: str, instance: User or ResetPasswordToken) -> None:
-    email: Email = EMAILS[email_type](instance=instance)
-    email.send()
+    """
+    Creates the email with its blocks, the delivery is enqueued in the
+    transactional queue once the transaction is committed
+    """
+    EMAILS[email_type](instance=instance)
     log_email_action(email_type, instance)
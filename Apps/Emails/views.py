@@ -1,12 +1,20 @@
+from django.conf import settings
+from django.core.signing import BadSignature
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from rest_framework.decorators import action
+from rest_framework.exceptions import ParseError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import AllowAny
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.renderers import TemplateHTMLRenderer
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK as OK
 from rest_framework.status import HTTP_201_CREATED as CREATED
+from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.viewsets import ModelViewSet
 
@@ -20,22 +28,33 @@ from Emails.serializers import BlacklistSerializer
 from Emails.serializers import EmailSerializer
 from Emails.serializers import NotificationSerializer
 from Emails.serializers import SuggestionEmailSerializer
+from Emails.unsubscribe import load_unsubscribe_token
+from Project.pagination import ListTenResultsApproximateCountPagination
 from Project.pagination import ListTenResultsSetPagination
+from Project.streaming import StreamingListMixin
+from Project.utils.identity_map import IdentityMapMixin
+from Project.utils.translation import get_translation_in
 from Users.models import User
 from Users.permissions import IsAdmin
 from Users.permissions import IsSameUserId
 from Users.permissions import IsVerified
 
 
-class EmailViewSet(ModelViewSet):
-    queryset: QuerySet = Email.objects.all().order_by("-id")
+class EmailViewSet(StreamingListMixin, ModelViewSet):
+    queryset: QuerySet = (
+        Email.objects.select_related("to")
+        .prefetch_related("blocks")
+        .order_by("-id")
+    )
     lookup_url_kwarg: str = "pk"
     serializer_class: EmailSerializer = EmailSerializer
-    pagination_class: PageNumberPagination = ListTenResultsSetPagination
+    pagination_class: PageNumberPagination = (
+        ListTenResultsApproximateCountPagination
+    )
     permission_classes: list = [IsAuthenticated & IsVerified & IsAdmin]
 
 
-class BlacklistViewSet(ModelViewSet):
+class BlacklistViewSet(IdentityMapMixin, ModelViewSet):
     queryset: QuerySet = BlackList.objects.all().order_by("-id")
     lookup_url_kwarg: str = "pk"
     serializer_class: BlacklistSerializer = BlacklistSerializer
@@ -69,10 +88,10 @@ class SuggestionViewSet(GenericViewSet):
         type: str = request.data.get("type")
         content: str = request.data.get("content")
         user: User = User.objects.get(id=request.user.id)
-        suggestion: Suggestion = SuggestionEmailFactory(
-            type=type, content=content, user=user
-        )
-        suggestion.send()
+        with transaction.atomic():
+            suggestion: Suggestion = SuggestionEmailFactory(
+                type=type, content=content, user=user
+            )
         data = SuggestionEmailSerializer(suggestion).data
         return Response(data=data, status=CREATED)
 
@@ -91,3 +110,51 @@ class SuggestionViewSet(GenericViewSet):
         page: QuerySet = self.paginate_queryset(suggestions)
         data: dict = SuggestionEmailSerializer(page, many=True).data
         return self.get_paginated_response(data)
+
+
+class UnsubscribeView(APIView):
+    """
+    Adds the affair of the signed token to the blacklist of its user, the
+    token is the authentication so the link works from the email. Only POST
+    unsubscribes, as in the one click unsubscribe of RFC 8058, GET checks the
+    token so link prefetchers do not unsubscribe anybody. Browsers get a page
+    in the language of the user, GET asks for confirmation with a form that
+    POSTs to the same link
+    """
+
+    authentication_classes: list = []
+    permission_classes: list = [AllowAny]
+    renderer_classes: list = [JSONRenderer, TemplateHTMLRenderer]
+
+    def get(self, request: HttpRequest, token: str) -> Response:
+        data, user = self.load_token(token)
+        page: dict = {
+            "text": settings.UNSUBSCRIBE_CONFIRMATION_TEXT,
+            "button_text": settings.UNSUBSCRIBE_BUTTON_TEXT,
+        }
+        return self.get_response(request, data, user, page)
+
+    def post(self, request: HttpRequest, token: str) -> Response:
+        data, user = self.load_token(token)
+        BlackList.objects.add_affair(user.id, data["affair"])
+        page: dict = {"text": settings.UNSUBSCRIBE_DONE_TEXT}
+        return self.get_response(request, data, user, page)
+
+    def load_token(self, token: str) -> tuple:
+        try:
+            data: dict = load_unsubscribe_token(token)
+        except BadSignature:
+            raise ParseError("Invalid unsubscribe token")
+        user: User = get_object_or_404(User, id=data["user_id"])
+        return data, user
+
+    def get_response(
+        self, request: HttpRequest, data: dict, user: User, page: dict
+    ) -> Response:
+        if request.accepted_renderer.format != "html":
+            return Response(data=data, status=OK)
+        page: dict = {
+            name: get_translation_in(user.preferred_language, text)
+            for name, text in page.items()
+        }
+        return Response(data=page, status=OK, template_name="unsubscribe.html")
@@ -1,5 +1,6 @@
 from django.contrib.auth import authenticate
 from django.contrib.auth import password_validation
+from django.db import transaction
 from django.db.models import Field
 from django.db.models import Model
 from phonenumber_field.serializerfields import PhoneNumberField
@@ -114,6 +115,7 @@ class UserSignUpSerializer(Serializer):
             return PreferredLanguageChoices.ENGLISH
         return preferred_language
 
+    @transaction.atomic
     def create(self, data):
         data.pop("password_confirmation")
         user: User = User.objects.create_user(**data, is_verified=False)
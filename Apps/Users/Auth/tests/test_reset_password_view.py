@@ -17,13 +17,16 @@ class TestUserPasswordResetTests:
     def test_url(self) -> None:
         assert self.url() == "/api/reset_password/"
 
-    def test_reset_password(self, client: APIClient) -> None:
+    def test_reset_password(
+        self, client: APIClient, django_capture_on_commit_callbacks
+    ) -> None:
         # Test that any user can reset its password via API
         normal_user: User = UserFaker()
         assert normal_user.check_password("password") is True
-        response: Response = client.post(
-            self.url(), {"email": normal_user.email}
-        )
+        with django_capture_on_commit_callbacks(execute=True):
+            response: Response = client.post(
+                self.url(), {"email": normal_user.email}
+            )
         assert response.status_code == 200
         tokens: ResetPasswordToken = ResetPasswordToken.objects.all()
         assert len(tokens) == 1
@@ -56,7 +56,9 @@ class TestUserSignUpEndpoint:
         assert message in response.data["password"][0]
         assert len(mail.outbox) == 0
 
-    def test_create_user_is_successfull(self, client: APIClient) -> None:
+    def test_create_user_is_successfull(
+        self, client: APIClient, django_capture_on_commit_callbacks
+    ) -> None:
         data: dict = {
             "first_name": "Test",
             "last_name": "Tested",
@@ -65,7 +67,8 @@ class TestUserSignUpEndpoint:
             "password_confirmation": "strongpassword",
         }
         assert User.objects.count() == 0
-        response: Response = client.post(self.url(), data, format="json")
+        with django_capture_on_commit_callbacks(execute=True):
+            response: Response = client.post(self.url(), data, format="json")
         assert User.objects.count() == 1
         assert response.status_code == 201
         assert response.data["first_name"] == data["first_name"]
@@ -78,7 +81,7 @@ class TestUserSignUpEndpoint:
         assert len(mail.outbox) == 1
 
     def test_sign_up_is_successfully_but_do_not_create_an_user_with_special_fields_modified(
-        self, client: APIClient
+        self, client: APIClient, django_capture_on_commit_callbacks
     ) -> None:
         data: dict = {
             "first_name": "Test",
@@ -92,7 +95,8 @@ class TestUserSignUpEndpoint:
             "is_premium": True,
         }
         assert User.objects.count() == 0
-        response: Response = client.post(self.url(), data, format="json")
+        with django_capture_on_commit_callbacks(execute=True):
+            response: Response = client.post(self.url(), data, format="json")
         assert User.objects.count() == 1
         assert response.status_code == 201
         assert response.data["first_name"] == data["first_name"]
@@ -105,7 +109,7 @@ class TestUserSignUpEndpoint:
         assert len(mail.outbox) == 1
 
     def test_sign_up_is_successfully_with_custom_language(
-        self, client: APIClient
+        self, client: APIClient, django_capture_on_commit_callbacks
     ) -> None:
         data: dict = {
             "first_name": "Test",
@@ -116,14 +120,15 @@ class TestUserSignUpEndpoint:
             "preferred_language": "ES",
         }
         assert User.objects.count() == 0
-        response: Response = client.post(self.url(), data, format="json")
+        with django_capture_on_commit_callbacks(execute=True):
+            response: Response = client.post(self.url(), data, format="json")
         assert User.objects.count() == 1
         assert response.status_code == 201
         assert User.objects.first().preferred_language == "ES"
         assert len(mail.outbox) == 1
 
     def test_sign_up_is_successfully_with_default_language_if_not_passed(
-        self, client: APIClient
+        self, client: APIClient, django_capture_on_commit_callbacks
     ) -> None:
         data: dict = {
             "first_name": "Test",
@@ -133,14 +138,15 @@ class TestUserSignUpEndpoint:
             "password_confirmation": "strong_password",
         }
         assert User.objects.count() == 0
-        response: Response = client.post(self.url(), data, format="json")
+        with django_capture_on_commit_callbacks(execute=True):
+            response: Response = client.post(self.url(), data, format="json")
         assert User.objects.count() == 1
         assert response.status_code == 201
         assert User.objects.first().preferred_language == "EN"
         assert len(mail.outbox) == 1
 
     def test_sign_up_is_successfully_with_default_language_if_wrong_passed(
-        self, client: APIClient
+        self, client: APIClient, django_capture_on_commit_callbacks
     ) -> None:
         data: dict = {
             "first_name": "Test",
@@ -151,7 +157,8 @@ class TestUserSignUpEndpoint:
             "preferred_language": "WR",
         }
         assert User.objects.count() == 0
-        response: Response = client.post(self.url(), data, format="json")
+        with django_capture_on_commit_callbacks(execute=True):
+            response: Response = client.post(self.url(), data, format="json")
         assert User.objects.count() == 1
         assert response.status_code == 201
         assert User.objects.first().preferred_language == "EN"
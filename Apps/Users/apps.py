@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field: str = "django.db.models.BigAutoField"
     name: str = "Users"
+
+    def ready(self) -> None:
+        from Users import receivers  # noqa: F401
@@ -0,0 +1,34 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from Users.cache import authenticated_user_cache
+from Users.models import User
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that reads the user of the token from the
+    authenticated user cache, the database is only queried on a cache miss.
+    The cached users are checked to be active as the database ones
+    """
+
+    def get_user(self, validated_token: Token) -> User:
+        try:
+            user_id: int = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            )
+        user: User = authenticated_user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            authenticated_user_cache.set(user_id, user)
+        elif not user.is_active:
+            raise AuthenticationFailed(
+                _("User is inactive"), code="user_inactive"
+            )
+        return user
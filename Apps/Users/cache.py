@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import BaseCache
+from django.core.cache import caches
+from django.db import router
+from django.db.models import Model
+
+
+class AuthenticatedUserCache:
+    """
+    Users loaded by the authentication, kept for a few seconds in the process
+    and for longer in a shared Django cache (like Redis). The entries are
+    deleted when the user is saved or deleted, the process copies of other
+    workers expire with the local timeout and the least recently used ones
+    are dropped above the local size. A timeout of 0 disables it. Only
+    the fields read by the requests are cached, never the password hash,
+    the other fields are loaded from the database when they are read
+    """
+
+    KEY_PREFIX: str = "authenticated-user"
+    FIELDS: tuple = (
+        "id",
+        "email",
+        "first_name",
+        "last_name",
+        "preferred_language",
+        "is_verified",
+        "is_premium",
+        "is_admin",
+        "is_active",
+    )
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size: int = max_size
+        self.users: OrderedDict = OrderedDict()
+        self.lock: Lock = Lock()
+
+    @property
+    def shared_cache(self) -> BaseCache:
+        alias: str = settings.AUTHENTICATED_USER_CACHE_ALIAS
+        return caches[alias] if alias else None
+
+    @property
+    def is_enabled(self) -> bool:
+        return bool(settings.AUTHENTICATED_USER_CACHE_TIMEOUT)
+
+    @classmethod
+    def get_key(cls, user_id: int) -> str:
+        return f"{cls.KEY_PREFIX}:{user_id}"
+
+    def get(self, user_id: int) -> Model:
+        if not self.is_enabled:
+            return None
+        key: str = self.get_key(user_id)
+        with self.lock:
+            expires_at, values = self.users.get(key, (0, None))
+            if values is not None and expires_at <= monotonic():
+                del self.users[key]
+                values = None
+            elif values is not None:
+                self.users.move_to_end(key)
+        if values is not None:
+            return self.load(values)
+        if self.shared_cache is None:
+            return None
+        values = self.shared_cache.get(key)
+        if values is None:
+            return None
+        self.set_locally(key, values)
+        return self.load(values)
+
+    def set(self, user_id: int, user: Model) -> None:
+        if not self.is_enabled:
+            return
+        key: str = self.get_key(user_id)
+        values: dict = self.dump(user)
+        self.set_locally(key, values)
+        if self.shared_cache is not None:
+            self.shared_cache.set(
+                key, values, settings.AUTHENTICATED_USER_CACHE_TIMEOUT
+            )
+
+    def set_locally(self, key: str, values: dict) -> None:
+        expires_at: float = (
+            monotonic() + settings.AUTHENTICATED_USER_LOCAL_CACHE_TIMEOUT
+        )
+        with self.lock:
+            self.users[key] = (expires_at, values)
+            self.users.move_to_end(key)
+            while len(self.users) > self.max_size:
+                self.users.popitem(last=False)
+
+    def dump(self, user: Model) -> dict:
+        return {field: getattr(user, field) for field in self.FIELDS}
+
+    def load(self, values: dict) -> Model:
+        """
+        Builds the user as loaded from the database with the fields not
+        cached deferred
+        """
+        user_model: Model = get_user_model()
+        fields: list = [
+            field.attname
+            for field in user_model._meta.concrete_fields
+            if field.attname in values
+        ]
+        return user_model.from_db(
+            router.db_for_read(user_model),
+            fields,
+            [values[field] for field in fields],
+        )
+
+    def delete(self, user_id: int) -> None:
+        key: str = self.get_key(user_id)
+        with self.lock:
+            self.users.pop(key, None)
+        if self.shared_cache is not None:
+            self.shared_cache.delete(key)
+
+
+authenticated_user_cache: AuthenticatedUserCache = AuthenticatedUserCache(
+    max_size=settings.AUTHENTICATED_USER_LOCAL_CACHE_SIZE
+)
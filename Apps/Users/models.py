@@ -12,6 +12,7 @@ from django.db.models import DateTimeField
 from django.db.models import EmailField
 from django.db.models import Field
 from django.db.models import ImageField
+from django.db.models import Index
 from django.db.models import Model
 from django.db.models import OneToOneField
 from django.db.models import TextField
@@ -83,6 +84,11 @@ class User(
 
     objects: BaseUserManager = CustomUserManager()
 
+    class Meta:
+        indexes: list = [
+            Index(fields=["created_at", "id"], name="user_created_at_index")
+        ]
+
     def __str__(self) -> str:
         return self.email
 
@@ -150,5 +156,10 @@ class Profile(ExportModelOperationsMixin("profile"), Model):
     created_at: Field = DateTimeField("Creation date", auto_now_add=True)
     updated_at: Field = DateTimeField("Update date", auto_now=True)
 
+    class Meta:
+        indexes: list = [
+            Index(fields=["created_at", "id"], name="profile_created_at_index")
+        ]
+
     def __str__(self) -> str:
         return f"User ({self.user_id}) profile ({self.pk})"
@@ -1,9 +1,9 @@
 from django.http import HttpRequest
 from django.views import View
-from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import BasePermission
 from rest_framework.permissions import DjangoObjectPermissions
 
+from Project.utils.identity_map import get_instance
 from Users.models import Profile
 from Users.models import User
 
@@ -28,7 +28,7 @@ class IsUserOwner(BasePermission):
     def has_permission(self, request: HttpRequest, view: View) -> bool:
         try:
             pk: int = request.parser_context["kwargs"]["pk"]
-            user: User = get_object_or_404(User, id=pk)
+            user: User = get_instance(request, User, pk=pk)
         except:
             return False
         return request.user.has_permission(user)
@@ -48,7 +48,7 @@ class IsProfileOwner(DjangoObjectPermissions):
     def has_permission(self, request: HttpRequest, view: View) -> bool:
         try:
             pk: int = request.parser_context["kwargs"]["pk"]
-            profile: Profile = get_object_or_404(Profile, id=pk)
+            profile: Profile = get_instance(request, Profile, pk=pk)
         except:
             return False
         return request.user.has_permission(profile)
@@ -0,0 +1,67 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+
+from Users.cache import authenticated_user_cache
+from Users.models import User
+
+
+def invalidate_authenticated_users(users_ids: list) -> None:
+    """
+    Drops the cached users now and again once committed, so a request that
+    read the old rows before the commit does not keep them cached
+    """
+    for user_id in users_ids:
+        authenticated_user_cache.delete(user_id)
+
+    def delete_on_commit() -> None:
+        for user_id in users_ids:
+            authenticated_user_cache.delete(user_id)
+
+    transaction.on_commit(delete_on_commit)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_authenticated_user(
+    sender: User, instance: User, *args: tuple, **kwargs: dict
+) -> None:
+    """
+    Queryset updates do not send signals, the entries expire with the cache
+    timeout
+    """
+    user_id: int = getattr(instance, api_settings.USER_ID_FIELD)
+    invalidate_authenticated_users([user_id])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def invalidate_authenticated_user_permissions(
+    sender: type,
+    instance: object,
+    action: str,
+    reverse: bool,
+    pk_set: set,
+    *args: tuple,
+    **kwargs: dict,
+) -> None:
+    """
+    The groups and permissions can be changed from the user or from the
+    group or permission, the users of a cleared group are read before the
+    clear as the signal does not send them
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        users_ids: list = [getattr(instance, api_settings.USER_ID_FIELD)]
+    elif pk_set is not None:
+        users_ids: list = list(pk_set)
+    else:
+        users_ids: list = list(
+            sender.objects.filter(
+                **{instance._meta.model_name: instance}
+            ).values_list("user_id", flat=True)
+        )
+    invalidate_authenticated_users(users_ids)
@@ -0,0 +1,128 @@
+from django.contrib.auth.models import Group
+from django.core.cache import caches
+from mock import patch
+from pytest import fixture
+from pytest import mark
+from pytest import raises
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.tokens import Token
+
+from Users.authentication import CachedJWTAuthentication
+from Users.cache import AuthenticatedUserCache
+from Users.cache import authenticated_user_cache
+from Users.fakers.user import VerifiedUserFaker
+from Users.models import User
+
+
+def get_validated_token(user: User) -> Token:
+    token: str = str(AccessToken.for_user(user))
+    return CachedJWTAuthentication().get_validated_token(token)
+
+
+@mark.django_db
+class TestCachedJWTAuthentication:
+    @fixture(autouse=True)
+    def authenticated_user_cache_settings(self, settings) -> None:
+        settings.AUTHENTICATED_USER_CACHE_TIMEOUT = 60
+        settings.AUTHENTICATED_USER_CACHE_ALIAS = "default"
+
+    def test_user_is_loaded_once(self, django_assert_num_queries) -> None:
+        user: User = VerifiedUserFaker()
+        authenticated_user_cache.delete(user.id)
+        validated_token: Token = get_validated_token(user)
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        with django_assert_num_queries(1):
+            first_user: User = authentication.get_user(validated_token)
+            second_user: User = authentication.get_user(validated_token)
+        assert first_user == second_user == user
+        assert first_user is not second_user
+
+    def test_saved_user_is_loaded_again(
+        self, django_assert_num_queries
+    ) -> None:
+        user: User = VerifiedUserFaker()
+        validated_token: Token = get_validated_token(user)
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        authentication.get_user(validated_token)
+        user.first_name = "New name"
+        user.save()
+        with django_assert_num_queries(1):
+            cached_user: User = authentication.get_user(validated_token)
+        assert cached_user.first_name == "New name"
+
+    def test_password_is_not_cached(self, django_assert_num_queries) -> None:
+        user: User = VerifiedUserFaker()
+        validated_token: Token = get_validated_token(user)
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        authentication.get_user(validated_token)
+        key: str = authenticated_user_cache.get_key(user.id)
+        assert "password" not in caches["default"].get(key)
+        with django_assert_num_queries(0):
+            cached_user: User = authentication.get_user(validated_token)
+        assert "password" in cached_user.get_deferred_fields()
+        assert cached_user.email == user.email
+        assert cached_user.password == user.password
+
+    def test_user_groups_changes_are_loaded_again(self) -> None:
+        user: User = VerifiedUserFaker()
+        group: Group = Group.objects.create(name="group")
+        validated_token: Token = get_validated_token(user)
+        CachedJWTAuthentication().get_user(validated_token)
+        user.groups.add(group)
+        assert authenticated_user_cache.get(user.id) is None
+        CachedJWTAuthentication().get_user(validated_token)
+        group.user_set.remove(user)
+        assert authenticated_user_cache.get(user.id) is None
+        user.groups.add(group)
+        CachedJWTAuthentication().get_user(validated_token)
+        group.user_set.clear()
+        assert authenticated_user_cache.get(user.id) is None
+
+    def test_cached_inactive_user_is_rejected(self) -> None:
+        user: User = VerifiedUserFaker()
+        user.is_active = False
+        validated_token: Token = get_validated_token(user)
+        with patch.object(authenticated_user_cache, "get", return_value=user):
+            with raises(AuthenticationFailed):
+                CachedJWTAuthentication().get_user(validated_token)
+
+    def test_local_cache_keeps_the_most_recent_users(self) -> None:
+        users: list = [VerifiedUserFaker() for _ in range(3)]
+        cache: AuthenticatedUserCache = AuthenticatedUserCache(max_size=2)
+        for user in users:
+            cache.set(user.id, user)
+        cache.get(users[1].id)
+        cache.set(users[0].id, users[0])
+        assert list(cache.users) == [
+            cache.get_key(users[1].id),
+            cache.get_key(users[0].id),
+        ]
+
+    def test_local_cache_drops_the_expired_users(self, settings) -> None:
+        settings.AUTHENTICATED_USER_LOCAL_CACHE_TIMEOUT = 0
+        settings.AUTHENTICATED_USER_CACHE_ALIAS = None
+        user: User = VerifiedUserFaker()
+        cache: AuthenticatedUserCache = AuthenticatedUserCache(max_size=2)
+        cache.set(user.id, user)
+        assert cache.get(user.id) is None
+        assert cache.users == {}
+
+    def test_deleted_user_is_not_cached(self) -> None:
+        user: User = VerifiedUserFaker()
+        validated_token: Token = get_validated_token(user)
+        CachedJWTAuthentication().get_user(validated_token)
+        user_id: int = user.id
+        user.delete()
+        assert authenticated_user_cache.get(user_id) is None
+
+    def test_cache_is_disabled_without_timeout(
+        self, settings, django_assert_num_queries
+    ) -> None:
+        settings.AUTHENTICATED_USER_CACHE_TIMEOUT = 0
+        user: User = VerifiedUserFaker()
+        validated_token: Token = get_validated_token(user)
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        with django_assert_num_queries(2):
+            authentication.get_user(validated_token)
+            authentication.get_user(validated_token)
@@ -1,6 +1,8 @@
 from django.urls import reverse
+from mock import patch
 from pytest import fixture
 from pytest import mark
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.test import APIClient
 
@@ -75,6 +77,18 @@ class TestUserListEndpoint:
         admin_name = user.first_name
         assert response.data["results"][0]["first_name"] == admin_name
 
+    def test_list_users_with_cursor_pagination(self, client: APIClient) -> None:
+        user: User = UserFaker()
+        admin_user: User = AdminFaker()
+        client.force_authenticate(user=admin_user)
+        url: str = f"{self.url()}?pagination=cursor&page_size=1"
+        response: Response = client.get(url, format="json")
+        assert response.status_code == 200
+        assert response.data["results"][0]["id"] == admin_user.id
+        response = client.get(response.data["next"], format="json")
+        assert response.data["results"][0]["id"] == user.id
+        assert response.data["next"] is None
+
 
 @mark.django_db
 class TestUserRetrieveEndpoint:
@@ -127,6 +141,19 @@ class TestUserRetrieveEndpoint:
         response: Response = client.get(self.url(normal_user.id), format="json")
         assert response.status_code == 200
 
+    def test_get_user_loads_the_user_once(self, client: APIClient) -> None:
+        normal_user: User = VerifiedUserFaker()
+        client.force_authenticate(user=normal_user)
+        with patch(
+            "Project.utils.identity_map.get_object_or_404",
+            wraps=get_object_or_404,
+        ) as mocked_get_object:
+            response: Response = client.get(
+                self.url(normal_user.id), format="json"
+            )
+        assert response.status_code == 200
+        assert mocked_get_object.call_count == 1
+
 
 @mark.django_db
 class TestUserUpdateEndpoint:
@@ -15,6 +15,7 @@ from rest_framework.viewsets import ModelViewSet
 
 from Emails.utils import send_email
 from Project.pagination import ListTenResultsSetPagination
+from Project.utils.identity_map import IdentityMapMixin
 from Project.utils.log import log_information
 from Users.models import Profile
 from Users.models import User
@@ -29,7 +30,7 @@ from Users.serializers import UserUpdateSerializer
 from Users.utils import verify_user_query_token
 
 
-class UserViewSet(ModelViewSet):
+class UserViewSet(IdentityMapMixin, ModelViewSet):
     """
     API endpoint that allows to interact with User model
     """
@@ -37,8 +38,9 @@ class UserViewSet(ModelViewSet):
     queryset: QuerySet = User.objects.all().order_by("-created_at")
     user_permissions: bool = IsAuthenticated & IsVerified & IsUserOwner
     admin_user_permissions: bool = IsAuthenticated & IsAdmin
-    permission_classes: list = [user_permissions | admin_user_permissions]
+    permission_classes: list = [admin_user_permissions | user_permissions]
     pagination_class: PageNumberPagination = ListTenResultsSetPagination
+    cursor_ordering: tuple = ("-created_at", "-id")
 
     def get_serializer_class(self) -> Serializer:
         if self.action == "update":
@@ -59,7 +61,7 @@ class UserViewSet(ModelViewSet):
         return JsonResponse(data, status=SUCCESS)
 
 
-class ProfileViewSet(ModelViewSet):
+class ProfileViewSet(IdentityMapMixin, ModelViewSet):
     """
     API endpoint that allows to interact with Profile model;
     List, create and destroy are only available only for admin users because the
@@ -71,9 +73,10 @@ class ProfileViewSet(ModelViewSet):
     serializer_class: ProfileSerializer = ProfileSerializer
     user_permissions: bool = IsVerified & IsProfileOwner & IsActionAllowed
     admin_user_permissions: bool = IsAdmin
-    permissions: bool = user_permissions | admin_user_permissions
+    permissions: bool = admin_user_permissions | user_permissions
     permission_classes: list = [IsAuthenticated & permissions]
     pagination_class: PageNumberPagination = ListTenResultsSetPagination
+    cursor_ordering: tuple = ("-created_at", "-id")
 
 
 @receiver(reset_password_token_created)
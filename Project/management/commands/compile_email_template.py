@@ -0,0 +1,32 @@
+import os
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandParser
+
+from Emails.compiler import EmailTemplateCompiler
+
+
+class Command(BaseCommand):
+
+    help: str = "Compiles the email layout in a single minified template"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        templates_path: str = os.path.join(
+            apps.get_app_config("Emails").path, "templates"
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            type=str,
+            default=os.path.join(
+                templates_path, settings.EMAIL_COMPILED_TEMPLATE
+            ),
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        template: str = EmailTemplateCompiler().compile()
+        with open(options["output"], "w") as output:
+            output.write(template)
+        self.stdout.write(f"Email template compiled in {options['output']}")
@@ -1,7 +1,125 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils.functional import cached_property
+from django.views import View
+from django_mysql.models.query import approx_count
+from rest_framework.pagination import CursorPagination
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+
+class ListTenResultsCursorPagination(CursorPagination):
+    """
+    Keyset pagination, every page is read with a filter on the ordering
+    instead of a count and an offset so deep pages cost the same as the first
+    one. The views can set their cursor_ordering, it must end in a unique
+    field to keep the pages stable
+    """
+
+    page_size: int = 10
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 1000
+    ordering: str = "-id"
+
+    def get_ordering(
+        self, request: HttpRequest, queryset: QuerySet, view: View
+    ) -> tuple:
+        ordering: str or tuple = getattr(view, "cursor_ordering", self.ordering)
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
 
 
 class ListTenResultsSetPagination(PageNumberPagination):
+    """
+    Page number pagination, the requests with ?pagination=cursor are paginated
+    with the cursor pagination instead
+    """
+
     page_size: int = 10
     page_size_query_param: str = "page_size"
     max_page_size: int = 1000
+    pagination_query_param: str = "pagination"
+    cursor_pagination_class: CursorPagination = ListTenResultsCursorPagination
+
+    def __init__(self) -> None:
+        self.cursor_paginator: CursorPagination = None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: HttpRequest, view: View = None
+    ) -> list:
+        pagination: str = request.query_params.get(self.pagination_query_param)
+        if pagination == "cursor":
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(
+                queryset, request, view
+            )
+        self.cursor_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: list) -> Response:
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    Paginator that estimates the count of unfiltered MySQL tables from the
+    table statistics when it is above the threshold, instead of scanning the
+    whole index. The exact count is used otherwise
+    """
+
+    def __init__(self, *args: tuple, threshold: int, **kwargs: dict) -> None:
+        super().__init__(*args, **kwargs)
+        self.threshold: int = threshold
+        self.is_count_exact: bool = True
+
+    @cached_property
+    def count(self) -> int:
+        approximate_count: int = self.get_approximate_count()
+        if (
+            approximate_count is not None
+            and approximate_count >= self.threshold
+        ):
+            self.is_count_exact = False
+            return approximate_count
+        return super().count
+
+    def get_approximate_count(self) -> int:
+        if not isinstance(self.object_list, QuerySet):
+            return None
+        if connections[self.object_list.db].vendor != "mysql":
+            return None
+        try:
+            return approx_count(self.object_list)
+        except ValueError:
+            return None
+
+
+class ListTenResultsApproximateCountPagination(ListTenResultsSetPagination):
+    """
+    Page number pagination for big tables, the count is estimated above the
+    threshold and the response tells if it is exact. The last pages of an
+    estimated count can be empty
+    """
+
+    approximate_count_threshold: int = 100000
+
+    def django_paginator_class(
+        self, object_list: QuerySet, per_page: int
+    ) -> Paginator:
+        return ApproximateCountPaginator(
+            object_list, per_page, threshold=self.approximate_count_threshold
+        )
+
+    def get_paginated_response(self, data: list) -> Response:
+        response: Response = super().get_paginated_response(data)
+        if self.cursor_paginator is None:
+            response.data["count_is_exact"] = self.page.paginator.is_count_exact
+        return response
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        response_schema: dict = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_exact"] = {"type": "boolean"}
+        return response_schema
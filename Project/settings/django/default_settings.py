@@ -81,7 +81,7 @@ REST_FRAMEWORK: dict = {
         "django_filters.rest_framework.DjangoFilterBackend"
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication"
+        "Users.authentication.CachedJWTAuthentication"
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
@@ -109,6 +109,10 @@ CACHES: dict = {
         },
     }
 }
+AUTHENTICATED_USER_CACHE_ALIAS: str = "default"  # Users of the JWT requests
+AUTHENTICATED_USER_CACHE_TIMEOUT: int = 5 * 60  # 0 disables the cache
+AUTHENTICATED_USER_LOCAL_CACHE_TIMEOUT: int = 5  # Copy kept in every process
+AUTHENTICATED_USER_LOCAL_CACHE_SIZE: int = 1024  # Users kept in every process
 
 LOGGING: dict = {
     "version": 1,
@@ -196,11 +200,43 @@ DEFAULT_AUTO_FIELD: str = "django.db.models.BigAutoField"
 CELERY_TIMEZONE: str = TIME_ZONE
 CELERY_TASK_TRACK_STARTED: bool = True
 CELERY_TASK_TIME_LIMIT: int = 30 * 60
+CELERY_RESULT_BACKEND: str = "redis://redis:6379/1"  # Needed by the chords
+CELERY_TASK_ROUTES: dict = {
+    "Emails.tasks.create_notifications_emails": {"queue": "emails"},
+    "Emails.tasks.create_notification_emails": {"queue": "emails"},
+    "Emails.tasks.send_suggestion": {"queue": "transactional_emails"},
+    "Emails.tasks.send_suggestions": {"queue": "transactional_emails"},
+}
 
 # Global email settings
 EMAIL_GREETING: str = _("Hi,")
 FOLLOW_TEXT: str = _("Follow Us")
 UNSUBSCRIBE_TEXT: str = _("Click here to unsubscribe.")
+UNSUBSCRIBE_CONFIRMATION_TEXT: str = _("Stop receiving these emails?")
+UNSUBSCRIBE_BUTTON_TEXT: str = _("Unsubscribe")
+UNSUBSCRIBE_DONE_TEXT: str = _("You will not receive these emails anymore.")
+EMAIL_DISPATCH_BATCH_SIZE: int = 100  # Emails sent per SMTP connection
+EMAIL_DISPATCH_CHUNK_SIZE: int = 1000  # Emails sent per parallel task
+EMAIL_DISPATCH_MAX_CHUNKS: int = 10  # Chunks claimed by every sweep
+EMAIL_SENDING_QUEUE: str = "emails"  # Bulk emails lane
+EMAIL_TRANSACTIONAL_QUEUE: str = "transactional_emails"
+EMAIL_LEASE_SECONDS: int = 5 * 60  # Time a worker owns the claimed emails
+EMAIL_TEMPLATE_VERSION: str = "1"  # Change it to discard the cached templates
+EMAIL_TEMPLATE_CACHE_SIZE: int = 256  # Templates kept in every process
+EMAIL_TEMPLATE_CACHE_ALIAS: str = None  # Shared cache, eg: "default"
+EMAIL_TEMPLATE_CACHE_TIMEOUT: int = 60 * 60
+EMAIL_COMPILED_TEMPLATE: str = "email.compiled.html"  # compile_email_template
+EMAIL_SUPPRESSION_CACHE_ALIAS: str = "default"  # Opted out users by affair
+EMAIL_SUPPRESSION_CACHE_TIMEOUT: int = 24 * 60 * 60
+EMAIL_MAX_ATTEMPTS: int = 5  # Failed sends before the email is a dead letter
+EMAIL_RETRY_DELAY_SECONDS: int = 60  # Doubled on every failed attempt
+EMAIL_RETRY_MAX_DELAY_SECONDS: int = 6 * 60 * 60
+EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS: str = "default"  # Shared by the workers
+EMAIL_CIRCUIT_BREAKER_THRESHOLD: int = 5  # Consecutive failures to open it
+EMAIL_CIRCUIT_BREAKER_TIMEOUT: int = 60  # Seconds the dispatch is paused
+
+# Notification email settings
+NOTIFICATION_EMAILS_CHUNK_SIZE: int = 1000
 
 # Suggestion email settings
 SUGGESTIONS_EMAIL: str = ""
@@ -6,3 +6,8 @@ ENVIRONMENT_NAME: str = "test"
 STATICFILES_DIRS: tuple = ()
 PROJECT_DIR: str = Path(__file__).resolve().parent.parent.parent
 STATIC_ROOT: str = os.path.join(PROJECT_DIR, "media")
+
+CELERY_TASK_ALWAYS_EAGER: bool = True
+EMAIL_SUPPRESSION_CACHE_ALIAS: str = None  # Read the blacklist from the db
+EMAIL_CIRCUIT_BREAKER_CACHE_ALIAS: str = None  # Disabled, enabled per test
+AUTHENTICATED_USER_CACHE_TIMEOUT: int = 0  # Disabled, enabled per test
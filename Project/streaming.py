@@ -0,0 +1,86 @@
+import json
+from itertools import islice
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import ParseError
+from rest_framework.pagination import BasePagination
+from rest_framework.pagination import CursorPagination
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+
+TRUE_VALUES: tuple = ("1", "true", "yes")
+
+
+class StreamingListMixin:
+    """
+    Lists with ?stream=true are written as JSON while the queryset is read in
+    chunks, so the memory used does not grow with the page size. The page
+    is the one the page number pagination would return, without the count.
+    The cursor pagination can not be streamed
+    """
+
+    stream_query_param: str = "stream"
+    stream_chunk_size: int = 100
+
+    def list(
+        self, request: HttpRequest, *args: tuple, **kwargs: dict
+    ) -> Response:
+        if not self.is_stream_requested(request):
+            return super().list(request, *args, **kwargs)
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self.stream_results(self.get_stream_queryset(queryset)),
+            content_type="application/json",
+        )
+
+    def is_stream_requested(self, request: HttpRequest) -> bool:
+        stream: str = request.query_params.get(self.stream_query_param, "")
+        return stream.lower() in TRUE_VALUES
+
+    def is_cursor_pagination_requested(self, paginator: BasePagination) -> bool:
+        if isinstance(paginator, CursorPagination):
+            return True
+        pagination_query_param: str = getattr(
+            paginator, "pagination_query_param", None
+        )
+        return bool(
+            pagination_query_param
+            and self.request.query_params.get(pagination_query_param)
+            == "cursor"
+        )
+
+    def get_stream_queryset(self, queryset: QuerySet) -> QuerySet:
+        paginator: PageNumberPagination = self.paginator
+        if self.is_cursor_pagination_requested(paginator):
+            raise ParseError("The cursor pagination can not be streamed.")
+        if not isinstance(paginator, PageNumberPagination):
+            return queryset
+        page_size: int = paginator.get_page_size(self.request)
+        page_number: str = self.request.query_params.get(
+            paginator.page_query_param, 1
+        )
+        try:
+            page_number: int = int(page_number)
+        except ValueError:
+            raise NotFound("Invalid page.")
+        if page_number < 1:
+            raise NotFound("Invalid page.")
+        offset: int = (page_number - 1) * page_size
+        return queryset[offset : offset + page_size]
+
+    def stream_results(self, queryset: QuerySet) -> iter:
+        yield b'{"results":['
+        instances: iter = queryset.iterator(chunk_size=self.stream_chunk_size)
+        separator: bytes = b""
+        chunk: list = list(islice(instances, self.stream_chunk_size))
+        while chunk:
+            for item in self.get_serializer(chunk, many=True).data:
+                yield separator + json.dumps(item, cls=JSONEncoder).encode()
+                separator = b","
+            chunk = list(islice(instances, self.stream_chunk_size))
+        yield b"]}"
@@ -3,6 +3,7 @@ from io import StringIO
 from io import TextIOWrapper
 from logging import Logger
 
+from django.core.mail.message import RFC5322_EMAIL_LINE_LENGTH_LIMIT
 from django.core.management import call_command
 from django.test import override_settings
 from pytest import fixture
@@ -116,3 +117,23 @@ class TestPopulateCommand:
         assert Email.objects.all().count() == 5
         assert Profile.objects.all().count() == 5
         assert Suggestion.objects.all().count() == 5
+
+
+class TestCompileEmailTemplateCommand:
+    @fixture(autouse=True)
+    def static_files(self, settings) -> None:
+        settings.STATICFILES_DIRS = [settings.BASE_DIR / "Project" / "static"]
+
+    def test_compile_email_template(self, tmp_path) -> None:
+        output: str = str(tmp_path / "email.compiled.html")
+        call_command("compile_email_template", "-o", output, stdout=StringIO())
+        with open(output) as compiled_template:
+            template: str = compiled_template.read()
+        assert template.startswith("{# version: ")
+        assert "{% include" not in template
+        assert "inline_style" not in template
+        assert 'style="' in template
+        assert "@media" in template
+        for line in template.splitlines():
+            assert line == line.strip()
+            assert len(line) <= RFC5322_EMAIL_LINE_LENGTH_LIMIT
@@ -0,0 +1,41 @@
+from mock import patch
+from pytest import mark
+
+from Emails.factories.email import EmailFactory
+from Emails.models import Email
+from Project.pagination import ApproximateCountPaginator
+from Users.fakers.user import UserFaker
+
+
+@mark.django_db
+class TestApproximateCountPaginator:
+    def test_count_is_exact_out_of_mysql(self) -> None:
+        EmailFactory(to=UserFaker())
+        paginator: ApproximateCountPaginator = ApproximateCountPaginator(
+            Email.objects.all(), 10, threshold=0
+        )
+        assert paginator.get_approximate_count() is None
+        assert paginator.count == 1
+        assert paginator.is_count_exact is True
+
+    @patch.object(
+        ApproximateCountPaginator, "get_approximate_count", return_value=500
+    )
+    def test_count_is_estimated_above_the_threshold(self, *args: tuple) -> None:
+        paginator: ApproximateCountPaginator = ApproximateCountPaginator(
+            Email.objects.all(), 10, threshold=100
+        )
+        assert paginator.count == 500
+        assert paginator.num_pages == 50
+        assert paginator.is_count_exact is False
+
+    @patch.object(
+        ApproximateCountPaginator, "get_approximate_count", return_value=50
+    )
+    def test_count_is_exact_below_the_threshold(self, *args: tuple) -> None:
+        EmailFactory(to=UserFaker())
+        paginator: ApproximateCountPaginator = ApproximateCountPaginator(
+            Email.objects.all(), 10, threshold=100
+        )
+        assert paginator.count == 1
+        assert paginator.is_count_exact is True
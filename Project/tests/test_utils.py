@@ -2,13 +2,27 @@ import logging
 from datetime import datetime
 from logging import Logger
 
+from django.conf import settings
+from django.http import Http404
+from django.http import HttpRequest
+from django.utils.translation import gettext
+from django.utils.translation import gettext_lazy
+from django.utils.translation import override
 from freezegun import freeze_time
 from mock import MagicMock
 from mock import PropertyMock
+from mock import patch
 from pytest import mark
+from pytest import raises
 
+from Project.utils.identity_map import get_instance
+from Project.utils.log import log_dispatch_results
 from Project.utils.log import log_email_action
 from Project.utils.log import log_information
+from Project.utils.translation import get_message_id
+from Project.utils.translation import get_translation_in
+from Users.fakers.user import UserFaker
+from Users.models import User
 
 
 @mark.django_db
@@ -64,3 +78,72 @@ class TestAppUtils:
             + f"sent to test@test.com at {now}"
         )
         assert expected_message in caplog.text
+
+    @freeze_time("2012-01-14")
+    def test_log_dispatch_results(self, caplog: Logger) -> None:
+        caplog.clear()
+        caplog.set_level(logging.INFO)
+        results: dict = {
+            "sent": 3,
+            "failed": 1,
+            "blacklisted": 2,
+            "dead_letter": 1,
+            "deferred": 4,
+        }
+        log_dispatch_results(results)
+        now: datetime = datetime.now()
+        expected_message: str = (
+            f"Emails App | Dispatch finished, 3 sent, 1 failed, "
+            + f"1 dead letters, 4 deferred and 2 blacklisted at {now}"
+        )
+        assert expected_message in caplog.text
+
+
+class TestTranslationUtils:
+    def test_get_translation_in_translates_email_settings(self) -> None:
+        for language in ["EN", "ES"]:
+            with override(language):
+                expected_translation: str = gettext(settings.FOLLOW_TEXT)
+            translation: str = get_translation_in(
+                language, settings.FOLLOW_TEXT
+            )
+            assert translation == expected_translation
+
+    def test_get_translation_in_reads_email_settings_from_catalog(
+        self,
+    ) -> None:
+        get_translation_in("ES", settings.VERIFY_EMAIL_SUBJECT)
+        with patch("Project.utils.translation.override") as mocked_override:
+            get_translation_in("ES", settings.VERIFY_EMAIL_SUBJECT)
+            get_translation_in("ES", settings.EMAIL_GREETING)
+        mocked_override.assert_not_called()
+
+    def test_get_translation_in_falls_back_for_other_texts(self) -> None:
+        text: str = gettext_lazy("Unknown text")
+        assert get_translation_in("ES", text) == "Unknown text"
+        assert get_message_id(text) is None
+
+    def test_get_message_id_of_email_settings(self) -> None:
+        with override(None):
+            message_id: str = str(settings.UNSUBSCRIBE_TEXT)
+        assert get_message_id(settings.UNSUBSCRIBE_TEXT) == message_id
+        assert get_message_id("Plain text") == "Plain text"
+
+
+@mark.django_db
+class TestIdentityMap:
+    def test_get_instance_loads_the_instance_once_per_request(
+        self, django_assert_num_queries
+    ) -> None:
+        user: User = UserFaker()
+        request: HttpRequest = HttpRequest()
+        with django_assert_num_queries(1):
+            instance: User = get_instance(request, User, pk=user.id)
+            assert get_instance(request, User, pk=str(user.id)) is instance
+        assert instance == user
+        with django_assert_num_queries(1):
+            get_instance(HttpRequest(), User.objects.all(), pk=user.id)
+
+    def test_get_instance_raises_not_found(self) -> None:
+        with raises(Http404):
+            get_instance(HttpRequest(), User, pk=0)
@@ -0,0 +1,57 @@
+from django.db.models import Model
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from rest_framework.generics import get_object_or_404
+
+
+IDENTITY_MAP_ATTRIBUTE: str = "identity_map"
+
+
+def get_identity_map(request: HttpRequest) -> dict:
+    """
+    Identity map kept in the request instance itself, it is not looked up in
+    the wrapped django request so it lives as long as the DRF request
+    """
+    identity_map: dict = vars(request).get(IDENTITY_MAP_ATTRIBUTE)
+    if identity_map is None:
+        identity_map = {}
+        setattr(request, IDENTITY_MAP_ATTRIBUTE, identity_map)
+    return identity_map
+
+
+def get_instance(
+    request: HttpRequest, queryset: QuerySet or Model, **lookup: dict
+) -> Model:
+    """
+    Returns the instance of the lookup loaded once per request, so the
+    permissions and the view of a request share the same instance. Raises
+    Http404 when it does not exist
+    """
+    model: Model = (
+        queryset.model if isinstance(queryset, QuerySet) else queryset
+    )
+    key: tuple = (
+        model._meta.label,
+        *((field, str(value)) for field, value in sorted(lookup.items())),
+    )
+    identity_map: dict = get_identity_map(request)
+    if key not in identity_map:
+        identity_map[key] = get_object_or_404(queryset, **lookup)
+    return identity_map[key]
+
+
+class IdentityMapMixin:
+    """
+    Loads the object of the detail requests through the identity map of the
+    request, the object permissions are checked as usual. Views whose
+    queryset excludes rows should not use it, the instances are shared by
+    model and lookup
+    """
+
+    def get_object(self) -> Model:
+        lookup_url_kwarg: str = self.lookup_url_kwarg or self.lookup_field
+        lookup: dict = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+        instance: Model = get_instance(self.request, queryset, **lookup)
+        self.check_object_permissions(self.request, instance)
+        return instance
@@ -30,3 +30,26 @@ def log_email_action(email_type: str, instance: Model) -> None:
             "Users App | Password restore, email sent to "
             f"{instance.user.email} at {datetime.now()}"
         )
+
+
+def log_dispatch_results(results: dict) -> None:
+    logger.info(
+        f"Emails App | Dispatch finished, {results['sent']} sent, "
+        f"{results['failed']} failed, {results['dead_letter']} dead letters, "
+        f"{results['deferred']} deferred and {results['blacklisted']} "
+        f"blacklisted at {datetime.now()}"
+    )
+
+
+def log_scheduling_error(model_name: str, ids: list, error: Exception) -> None:
+    logger.warning(
+        f"Emails App | {model_name} {ids} not scheduled, the sweeper will "
+        f"handle them. Error: {error!r} at {datetime.now()}"
+    )
+
+
+def log_connection_error(action: str, error: Exception) -> None:
+    logger.warning(
+        f"Emails App | The email backend connection could not {action}. "
+        f"Error: {error!r} at {datetime.now()}"
+    )
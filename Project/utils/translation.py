@@ -1,7 +1,64 @@
+from functools import lru_cache
+from types import MappingProxyType
+
+from django.conf import settings
+from django.utils.functional import Promise
 from django.utils.translation import gettext
 from django.utils.translation import override
 
 
+TRANSLATED_SETTINGS_PREFIXES: tuple = (
+    "EMAIL_",
+    "VERIFY_",
+    "RESET_",
+    "FOLLOW_",
+    "UNSUBSCRIBE_",
+)
+
+
+@lru_cache(maxsize=None)
+def get_translated_settings() -> MappingProxyType:
+    """
+    Maps the id of every lazy translated email setting to the setting and its
+    message id, the setting is kept to check that the id was not reused
+    """
+    translated_settings: dict = {}
+    with override(None):
+        for name in dir(settings):
+            text: object = getattr(settings, name, None)
+            if name.startswith(TRANSLATED_SETTINGS_PREFIXES) and isinstance(
+                text, Promise
+            ):
+                translated_settings[id(text)] = (text, str(text))
+    return MappingProxyType(translated_settings)
+
+
+@lru_cache(maxsize=None)
+def get_catalog(language: str) -> MappingProxyType:
+    """
+    Translations of the email settings in the given language, built once per
+    process and language
+    """
+    with override(language):
+        return MappingProxyType(
+            {
+                message_id: gettext(message_id)
+                for _, message_id in get_translated_settings().values()
+            }
+        )
+
+
+def get_message_id(text: str) -> str:
+    translated_setting: tuple = get_translated_settings().get(id(text))
+    if translated_setting and translated_setting[0] is text:
+        return translated_setting[1]
+    return text if isinstance(text, str) else None
+
+
 def get_translation_in(language: str, text: str) -> str:
+    message_id: str = get_message_id(text)
+    translation: str = get_catalog(language).get(message_id)
+    if translation is not None:
+        return translation
     with override(language):
         return gettext(text)